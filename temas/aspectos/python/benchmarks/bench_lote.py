@@ -0,0 +1,54 @@
+# Benchmark de las operaciones por lotes: elementos por segundo al llamar a un método escalar en un bucle
+# frente a una sola llamada a su versión por lotes, con listas y con arrays de NumPy, y con los aspectos tejidos
+# Uso (desde la raíz del repositorio): python temas/aspectos/python/benchmarks/bench_lote.py [--n 200000] [--modo fusionado]
+
+import argparse
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import aspectos                                     # Aspectos y aplicar_aspectos
+from operaciones import Calculadora, np             # Clase objetivo de los aspectos y NumPy (si está instalado)
+
+def elementos_por_segundo(funcion, n, repeticiones):
+    mejor = min(timeit.repeat(funcion, number=1, repeat=repeticiones))
+    return n / mejor
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Operaciones por lotes frente a llamadas escalares en un bucle')
+    parser.add_argument('--n', type=int, default=200000, help='elementos por lote')
+    parser.add_argument('--modo', default='fusionado', choices=['ninguno', 'aspectlib', 'fusionado'],
+                        help='aspectos tejidos en Calculadora')
+    parser.add_argument('--nivel', default='WARNING', choices=['INFO', 'WARNING'],
+                        help='nivel del logger de aspectos; con INFO los mensajes van a un NullHandler')
+    parser.add_argument('--repeticiones', type=int, default=3, help='medidas por caso (se toma la mejor)')
+    args = parser.parse_args(argv)
+
+    aspectos.logger.setLevel(args.nivel)
+    aspectos.logger.propagate = False                                                   # No escribir en la consola
+    aspectos.logger.addHandler(logging.NullHandler())
+    if args.modo != 'ninguno':
+        aspectos.aplicar_aspectos(args.modo)
+
+    calc = Calculadora()
+    a = [i % 1000 + 1 for i in range(args.n)]
+    b = [i % 7 + 1 for i in range(args.n)]                                             # Sin ceros: todas las divisiones válidas
+    casos = {
+        'bucle escalar': lambda metodo: lambda: [getattr(calc, metodo)(x, y) for x, y in zip(a, b)],
+        'lote (listas)': lambda metodo: lambda: getattr(calc, f"{metodo}_lote")(a, b),
+    }
+    if np is not None:
+        a_array, b_array = np.array(a, dtype=np.float64), np.array(b, dtype=np.float64)
+        casos['lote (NumPy)'] = lambda metodo: lambda: getattr(calc, f"{metodo}_lote")(a_array, b_array)
+
+    print(f"n={args.n:,} aspectos={args.modo} nivel de log: {args.nivel} (elementos por segundo)")
+    print(f"{'método':>16}" + "".join(f"{caso:>16}" for caso in casos) + f"{'mejor/bucle':>14}")
+    for metodo in aspectos.METODOS:
+        fila = [elementos_por_segundo(caso(metodo), args.n, args.repeticiones) for caso in casos.values()]
+        print(f"{metodo:>16}" + "".join(f"{valor:>16,.0f}" for valor in fila) + f"{max(fila) / fila[0]:>13.0f}x")
+
+if __name__ == "__main__":
+    main()
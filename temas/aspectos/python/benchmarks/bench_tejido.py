@@ -0,0 +1,58 @@
+# Micro-benchmark del tejido de aspectos: llamadas por segundo a los métodos de Calculadora sin aspectos,
+# tejidos con aspectlib, tejidos en modo fusionado y en modo fusionado con métricas en lugar del log de tiempos
+# Uso (desde la raíz del repositorio): python temas/aspectos/python/benchmarks/bench_tejido.py [--nivel WARNING]
+
+import argparse
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import aspectos                                     # Aspectos y aplicar_aspectos
+from metricas import MetricasEjecucion              # Histogramas de duraciones
+from operaciones import Calculadora                 # Clase objetivo de los aspectos
+
+def llamadas_por_segundo(funcion, repeticiones):
+    mejor = min(timeit.repeat(funcion, number=repeticiones, repeat=3))
+    return repeticiones / mejor
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Coste de los aspectos por llamada')
+    parser.add_argument('--nivel', default='WARNING', choices=['INFO', 'WARNING'],
+                        help='nivel del logger de aspectos; con INFO los mensajes van a un NullHandler')
+    parser.add_argument('--repeticiones', type=int, default=20000, help='llamadas por medida')
+    args = parser.parse_args(argv)
+
+    aspectos.logger.setLevel(args.nivel)
+    aspectos.logger.propagate = False                                                   # No escribir en la consola
+    aspectos.logger.addHandler(logging.NullHandler())
+
+    originales = {metodo: getattr(Calculadora, metodo) for metodo in aspectos.METODOS}
+    modos = {
+        'sin aspectos': None,
+        'aspectlib': lambda: aspectos.aplicar_aspectos('aspectlib'),
+        'fusionado': lambda: aspectos.aplicar_aspectos('fusionado'),
+        'métricas': lambda: aspectos.aplicar_aspectos('fusionado', metricas=MetricasEjecucion()),
+        'métricas 1/16': lambda: aspectos.aplicar_aspectos('fusionado', metricas=MetricasEjecucion(muestreo=16)),
+    }
+    resultados = {}
+    for modo, aplicar in modos.items():
+        for metodo, funcion in originales.items():
+            setattr(Calculadora, metodo, funcion)                                       # Restaurar los métodos originales
+        if aplicar is not None:
+            aplicar()
+        calc = Calculadora()
+        resultados[modo] = {metodo: llamadas_por_segundo(lambda: getattr(calc, metodo)(7, 3), args.repeticiones)
+                            for metodo in aspectos.METODOS}
+
+    print(f"nivel de log: {args.nivel} (llamadas por segundo)")
+    print(f"{'método':>16}" + "".join(f"{modo:>15}" for modo in modos) + f"{'fusionado/aspectlib':>21}")
+    for metodo in aspectos.METODOS:
+        fila = [resultados[modo][metodo] for modo in modos]
+        print(f"{metodo:>16}" + "".join(f"{valor:>15,.0f}" for valor in fila)
+              + f"{resultados['fusionado'][metodo] / resultados['aspectlib'][metodo]:>20.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,23 @@
 import aspectlib                    # Importar la librería de aspectos
+import inspect                      # Detectar los métodos async def
 import logging                      # Importar logging para registrar eventos
+import logging.handlers             # QueueHandler y QueueListener para no bloquear en la E/S del log
+import queue
+import reprlib                      # Resumir los argumentos largos (lotes) en el log
 import time                         # Importar time para medir el tiempo de ejecución
 
+from registro import RegistroAspectos   # Adjuntar, separar y activar aspectos en tiempo de ejecución
+from tejido import Aspecto              # Tejido fusionado: todos los aspectos en una sola envoltura
+
 # Configuración básica de logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Los lotes pueden tener millones de elementos: en el log se muestran sólo los primeros
+_resumen = reprlib.Repr()
+_resumen.maxlist = _resumen.maxtuple = 10
+_resumen.maxother = _resumen.maxstring = 100                                            # Cabe la instancia de Calculadora
+
 class AspectosCalculadora:
     """
     Clase que contiene los aspectos a aplicar a la Calculadora
@@ -16,7 +28,7 @@ class AspectosCalculadora:
     def log_antes_despues(cutpoint, *args, **kwargs):
         """Aspecto para loggear antes y después de ejecutar un método"""
         func_name = getattr(cutpoint, '__name__', str(cutpoint))                        # Obtener el nombre de la función
-        logger.info(f"Antes de ejecutar: {func_name}, args={args}, kwargs={kwargs}")
+        logger.info(f"Antes de ejecutar: {func_name}, args={_resumen.repr(args)}, kwargs={_resumen.repr(kwargs)}")
         result = yield aspectlib.Proceed                                                # Continuar con la ejecución del método
         logger.info(f"Después de ejecutar: {func_name}")
         return result
@@ -42,21 +54,119 @@ class AspectosCalculadora:
         logger.info(f"{func_name} ejecutado en {fin - inicio:.4f} segundos")            # Loguear el tiempo de ejecución
         return result
 
-def aplicar_aspectos():
+class LogAntesDespues(Aspecto):
+    """Versión fusionada de log_antes_despues: sólo formatea el mensaje si INFO está activo"""
+
+    def antes(self, nombre, args, kwargs):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Antes de ejecutar: %s, args=%s, kwargs=%s", nombre, _resumen.repr(args), _resumen.repr(kwargs))
+
+    def despues(self, nombre, estado, resultado):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Después de ejecutar: %s", nombre)
+
+class ManejoErrores(Aspecto):
+    """Versión fusionada de manejo_errores"""
+
+    def error(self, nombre, estado, excepcion):
+        logger.error("Error en %s: %s", nombre, excepcion)
+
+class TiempoEjecucion(Aspecto):
+    """Versión fusionada de tiempo_ejecucion: no mide nada si INFO no está activo"""
+
+    def antes(self, nombre, args, kwargs):
+        if logger.isEnabledFor(logging.INFO):
+            return time.perf_counter()                                                  # Reloj monótono de alta resolución
+        return None
+
+    def despues(self, nombre, inicio, resultado):
+        if inicio is not None:
+            logger.info("%s ejecutado en %.4f segundos", nombre, time.perf_counter() - inicio)
+
+# Equivalente fusionado de cada aspecto de AspectosCalculadora. Como tejer espera a las corrutinas,
+# valen también para los métodos async def de CalculadoraAsincrona
+ASPECTOS_FUSIONADOS = {
+    AspectosCalculadora.log_antes_despues: LogAntesDespues(),
+    AspectosCalculadora.manejo_errores: ManejoErrores(),
+    AspectosCalculadora.tiempo_ejecucion: TiempoEjecucion(),
+}
+
+METODOS = ['suma', 'resta', 'multiplicacion', 'division']
+METODOS_LOTE = ['suma_lote', 'resta_lote', 'multiplicacion_lote', 'division_lote']    # Aspectos una vez por lote
+
+# Registro global de los aspectos aplicados: permite separarlos o desactivarlos después
+registro = RegistroAspectos()
+
+def aplicar_aspectos(modo='aspectlib', metricas=None, clase=None):
+    """
+    Aplica los aspectos a Calculadora (o a `clase`). Con modo='aspectlib' cada aspecto es una capa
+    de aspectlib; con modo='fusionado' se teje una sola envoltura plana por método.
+    En modo fusionado, `metricas` (un MetricasEjecucion) sustituye al log de tiempos.
+    Los aspectos quedan en `registro` con su nombre ('manejo_errores', 'tiempo_ejecucion'
+    o 'metricas', 'log_antes_despues') para poder desactivarlos o separarlos.
+    Los métodos async def (CalculadoraAsincrona) sólo se pueden tejer en modo fusionado:
+    aspectlib mediría y vigilaría la creación de la corrutina, no su ejecución
+    """
     # Importar la clase Calculadora
     from operaciones import Calculadora                     
+    clase = clase or Calculadora
+    metodos = [metodo for metodo in METODOS + METODOS_LOTE if hasattr(clase, metodo)]
 
     aspectos = [
         AspectosCalculadora.manejo_errores,     # Aspecto para manejar errores
         AspectosCalculadora.tiempo_ejecucion,   # Aspecto para medir el tiempo de ejecución
         AspectosCalculadora.log_antes_despues   # Aspecto para loggear antes y después
     ]
+    if modo not in ('aspectlib', 'fusionado'):
+        raise ValueError(f"Modo de tejido desconocido: {modo}")
+    if metricas is not None and modo != 'fusionado':
+        raise ValueError("Las métricas sólo se pueden tejer en modo fusionado")
+    if modo == 'aspectlib' and any(inspect.iscoroutinefunction(getattr(clase, metodo)) for metodo in metodos):
+        raise ValueError("Los métodos asíncronos sólo se pueden tejer en modo fusionado")
+
+    registro.restaurar(clase)                                                           # Empezar desde los métodos originales
+    # Adjuntar los aspectos en orden, del más externo al más interno (como decoradores anidados)
+    for aspecto in aspectos:
+        nombre = aspecto.advise_function.__name__                                       # Nombre de la función del aspecto
+        if modo == 'fusionado':
+            if metricas is not None and aspecto is AspectosCalculadora.tiempo_ejecucion:
+                nombre, aspecto = 'metricas', metricas
+            else:
+                aspecto = ASPECTOS_FUSIONADOS[aspecto]
+        registro.adjuntar(clase, metodos, nombre, aspecto)
+
+class LogEnCola:
+    """
+    Desvía el log de los aspectos a una cola: el código que llama (por ejemplo, el bucle de
+    asyncio) sólo encola el registro, y un hilo (QueueListener) lo escribe en los manejadores
+    de destino. Por defecto son los del propio logger o, si no tiene, los del logger raíz
+    """
+
+    def __init__(self, registrador=logger, manejadores=None):
+        self.registrador = registrador
+        self.manejadores = manejadores
+        self._oyente = None
+
+    def iniciar(self):
+        if self._oyente is None:
+            manejadores = self.manejadores or self.registrador.handlers or logging.getLogger().handlers
+            cola = queue.SimpleQueue()
+            self._anteriores = (self.registrador.handlers, self.registrador.propagate)
+            self.registrador.handlers = [logging.handlers.QueueHandler(cola)]
+            self.registrador.propagate = False
+            self._oyente = logging.handlers.QueueListener(cola, *manejadores, respect_handler_level=True)
+            self._oyente.start()
+        return self
+
+    def detener(self):
+        """Escribe los registros pendientes y devuelve al logger sus manejadores"""
+        if self._oyente is not None:
+            self._oyente.stop()
+            self._oyente = None
+            self.registrador.handlers, self.registrador.propagate = self._anteriores
+
+    def __enter__(self):
+        return self.iniciar()
 
-    # Aplicar los aspectos a los métodos de la clase Calculadora
-    for metodo in ['suma', 'resta', 'multiplicacion', 'division']:
-        original_func = getattr(Calculadora, metodo)                                    # Obtener la función original
-        
-        # Aplicar los aspectos en orden (anidándolos como decoradores)
-        for aspecto in reversed(aspectos):
-            original_func = aspecto(original_func)
-        setattr(Calculadora, metodo, original_func)                                     # Reemplazar la función original con la decorada
+    def __exit__(self, *excepcion):
+        self.detener()
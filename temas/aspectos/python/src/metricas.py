@@ -0,0 +1,200 @@
+import itertools                    # Contador para el muestreo 1 de cada N
+import logging                      # Destino por defecto del informe periódico
+import threading                    # Cerrojos y hilo del informe periódico
+import time                         # perf_counter_ns para medir duraciones
+
+from tejido import Aspecto          # Ganchos antes/despues/error del tejido fusionado
+
+logger = logging.getLogger(__name__)
+
+_SUBCUBOS = 16                      # Cubos por cada potencia de dos: error relativo máximo de 1/16
+
+def _cubo(valor):
+    """Índice del cubo de un valor en nanosegundos (escala logarítmico-lineal)"""
+    if valor < _SUBCUBOS:
+        return valor
+    exponente = valor.bit_length() - 5                                                  # Conservar los 5 bits más altos
+    return _SUBCUBOS * (exponente + 1) + (valor >> exponente) - _SUBCUBOS
+
+def _limites(cubo):
+    """Valores mínimo y máximo que caen en un cubo"""
+    if cubo < _SUBCUBOS:
+        return cubo, cubo
+    exponente, posicion = divmod(cubo - _SUBCUBOS, _SUBCUBOS)
+    inferior = (_SUBCUBOS + posicion) << exponente
+    return inferior, inferior + (1 << exponente) - 1
+
+class Histograma:
+    """
+    Histograma de duraciones con memoria acotada: cuenta, suma, mínimo y máximo exactos
+    y percentiles aproximados (error relativo menor del 7%) a partir de cubos logarítmicos
+    """
+
+    def __init__(self):
+        self._cerrojo = threading.Lock()
+        self.reiniciar()
+
+    def reiniciar(self):
+        with self._cerrojo:
+            self.cubos, self.cuenta, self.suma, self.minimo, self.maximo, self.errores = {}, 0, 0, None, None, 0
+
+    def registrar(self, valor, error=False):
+        cubo = _cubo(valor)
+        with self._cerrojo:
+            self.cubos[cubo] = self.cubos.get(cubo, 0) + 1
+            self.cuenta += 1
+            self.suma += valor
+            if self.minimo is None or valor < self.minimo:
+                self.minimo = valor
+            if self.maximo is None or valor > self.maximo:
+                self.maximo = valor
+            if error:
+                self.errores += 1
+
+    def _estado(self, reiniciar=False):
+        """Copia del estado, tomada (y opcionalmente reiniciada) sin soltar el cerrojo"""
+        with self._cerrojo:
+            estado = (dict(self.cubos), self.cuenta, self.suma, self.minimo, self.maximo, self.errores)
+            if reiniciar:
+                self.cubos, self.cuenta, self.suma, self.minimo, self.maximo, self.errores = {}, 0, 0, None, None, 0
+        return estado
+
+    @staticmethod
+    def _percentiles(estado, percentiles):
+        cubos, cuenta, _, minimo, maximo, _ = estado
+        if not cuenta:
+            return [None] * len(percentiles)
+        cubos = sorted(cubos.items())
+        resultado = []
+        for percentil in percentiles:
+            if percentil <= 0 or percentil >= 100:                                      # Extremos exactos
+                resultado.append(minimo if percentil <= 0 else maximo)
+                continue
+            posicion = max(1, -(-percentil * cuenta // 100))                             # Posición del valor buscado, desde 1
+            acumulado = 0
+            for cubo, veces in cubos:
+                acumulado += veces
+                if acumulado >= posicion:
+                    inferior, superior = _limites(cubo)
+                    resultado.append(min(max((inferior + superior) // 2, minimo), maximo))
+                    break
+        return resultado
+
+    def percentiles(self, *percentiles):
+        """Valor aproximado de cada percentil (0-100), o None si no hay datos"""
+        return self._percentiles(self._estado(), percentiles)
+
+    def resumen(self, reiniciar=False):
+        """Cuenta, errores, suma, mínimo, máximo, media y p50/p95/p99; con reiniciar=True empieza de cero"""
+        estado = self._estado(reiniciar)
+        _, cuenta, suma, minimo, maximo, errores = estado
+        p50, p95, p99 = self._percentiles(estado, (50, 95, 99))
+        return {'cuenta': cuenta, 'errores': errores, 'suma_ns': suma, 'min_ns': minimo, 'max_ns': maximo,
+                'media_ns': suma / cuenta if cuenta else None, 'p50_ns': p50, 'p95_ns': p95, 'p99_ns': p99}
+
+class MetricasEjecucion(Aspecto):
+    """
+    Aspecto de métricas para el tejido fusionado: en lugar de escribir una línea por llamada
+    acumula las duraciones (perf_counter_ns) en un histograma por método. Con muestreo=N
+    sólo se mide una de cada N llamadas
+    """
+
+    def __init__(self, muestreo=1):
+        if muestreo < 1:
+            raise ValueError("El muestreo debe ser al menos 1")
+        self.muestreo = muestreo
+        self._llamadas = itertools.count()                                              # next() es atómico con el GIL
+        self._histogramas = {}
+        self._cerrojo = threading.Lock()
+
+    def histograma(self, nombre):
+        histograma = self._histogramas.get(nombre)
+        if histograma is None:
+            with self._cerrojo:
+                histograma = self._histogramas.setdefault(nombre, Histograma())
+        return histograma
+
+    def antes(self, nombre, args, kwargs):
+        if self.muestreo == 1 or next(self._llamadas) % self.muestreo == 0:
+            return time.perf_counter_ns()
+        return None
+
+    def despues(self, nombre, inicio, resultado):
+        if inicio is not None:
+            self.histograma(nombre).registrar(time.perf_counter_ns() - inicio)
+
+    def error(self, nombre, inicio, excepcion):
+        if inicio is not None:
+            self.histograma(nombre).registrar(time.perf_counter_ns() - inicio, error=True)
+
+    def instantanea(self, reiniciar=False):
+        """
+        Resumen de cada método; las cuentas son de llamadas medidas (una de cada `muestreo`).
+        Con reiniciar=True cada histograma se lee y se vacía a la vez, sin perder llamadas
+        """
+        with self._cerrojo:
+            histogramas = dict(self._histogramas)
+        return {nombre: dict(histograma.resumen(reiniciar), muestreo=self.muestreo)
+                for nombre, histograma in sorted(histogramas.items())}
+
+    def reiniciar(self):
+        with self._cerrojo:
+            histogramas = list(self._histogramas.values())
+        for histograma in histogramas:
+            histograma.reiniciar()
+
+def formatear(instantanea):
+    """Una línea de texto por método con cuenta, media y percentiles en microsegundos"""
+    lineas = []
+    for nombre, datos in instantanea.items():
+        if not datos['cuenta']:
+            continue
+        lineas.append(f"{nombre}: n={datos['cuenta']} (1/{datos['muestreo']}) errores={datos['errores']} "
+                      f"media={datos['media_ns'] / 1000:.2f}us p50={datos['p50_ns'] / 1000:.2f}us "
+                      f"p95={datos['p95_ns'] / 1000:.2f}us p99={datos['p99_ns'] / 1000:.2f}us "
+                      f"max={datos['max_ns'] / 1000:.2f}us")
+    return lineas
+
+class InformePeriodico:
+    """
+    Hilo en segundo plano que cada `intervalo` segundos envía a `destino` el resumen de las
+    métricas (por defecto al logger, a nivel INFO) y, si reiniciar=True, empieza un periodo nuevo
+    """
+
+    def __init__(self, metricas, intervalo=60.0, destino=None, reiniciar=True):
+        self.metricas = metricas
+        self.intervalo = intervalo
+        self.destino = destino or logger.info
+        self.reiniciar = reiniciar
+        self._parar = threading.Event()
+        self._hilo = None
+
+    def informar(self):
+        instantanea = self.metricas.instantanea(reiniciar=self.reiniciar)
+        for linea in formatear(instantanea):
+            self.destino(linea)
+
+    def _bucle(self):
+        while not self._parar.wait(self.intervalo):
+            self.informar()
+
+    def iniciar(self):
+        if self._hilo is None:
+            self._parar.clear()
+            self._hilo = threading.Thread(target=self._bucle, name="informe-metricas", daemon=True)
+            self._hilo.start()
+        return self
+
+    def detener(self):
+        """Detiene el hilo y envía el último periodo"""
+        if self._hilo is not None:
+            self._parar.set()
+            self._hilo.join()
+            self._hilo = None
+            self.informar()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *excepcion):
+        self.detener()
@@ -1,3 +1,42 @@
+import asyncio                      # Pausas de la variante asíncrona
+
+try:
+    import numpy as np              # Opcional: las operaciones por lotes sobre arrays de NumPy se vectorizan
+except ImportError:
+    np = None
+
+class DivisionPorCeroLote(ValueError):
+    """
+    Error de division_lote: una sola excepción para todo el lote, con las posiciones
+    cuyo divisor es cero en `posiciones`
+    """
+
+    def __init__(self, posiciones):
+        self.posiciones = posiciones
+        muestra = ", ".join(map(str, posiciones[:10])) + (", ..." if len(posiciones) > 10 else "")
+        super().__init__(f"No se puede dividir por cero en {len(posiciones)} posiciones: [{muestra}]")
+
+def _es_secuencia(valor):
+    return hasattr(valor, '__len__') and not isinstance(valor, (str, bytes))
+
+def _operandos(a, b):
+    """
+    Prepara los operandos de una operación por lotes. Si alguno es un array de NumPy se
+    devuelven como arrays (con las reglas de difusión de NumPy); si no, como dos listas de la
+    misma longitud, repitiendo el operando escalar si lo hay
+    """
+    if np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray)):
+        return np.asarray(a), np.asarray(b), True
+    if not _es_secuencia(a) and not _es_secuencia(b):
+        raise ValueError("Las operaciones por lotes necesitan al menos una secuencia")
+    if not _es_secuencia(a):
+        a = [a] * len(b)
+    elif not _es_secuencia(b):
+        b = [b] * len(a)
+    elif len(a) != len(b):
+        raise ValueError(f"Los lotes tienen longitudes distintas: {len(a)} y {len(b)}")
+    return a, b, False
+
 class Calculadora:
     """
     Clase que realiza operaciones matemáticas básicas.
@@ -21,4 +60,87 @@ class Calculadora:
         #Lanza una excepción si se intenta dividir por cero
         if b == 0:
             raise ValueError("No se puede dividir por cero")
-        return a / b
\ No newline at end of file
+        return a / b
+
+    # Operaciones por lotes: reciben secuencias (o un escalar y una secuencia) y operan elemento a elemento
+    # en una sola llamada, así que los aspectos se ejecutan una vez por lote. Con arrays de NumPy el cálculo
+    # se vectoriza y se devuelve un array; con otras secuencias se devuelve una lista
+
+    #Suma dos lotes de números
+    def suma_lote(self, a, b):
+        a, b, vectorial = _operandos(a, b)
+        if vectorial:
+            return a + b
+        return [x + y for x, y in zip(a, b)]
+
+    #Resta dos lotes de números
+    def resta_lote(self, a, b):
+        a, b, vectorial = _operandos(a, b)
+        if vectorial:
+            return a - b
+        return [x - y for x, y in zip(a, b)]
+
+    #Multiplica dos lotes de números
+    def multiplicacion_lote(self, a, b):
+        a, b, vectorial = _operandos(a, b)
+        if vectorial:
+            return a * b
+        return [x * y for x, y in zip(a, b)]
+
+    #Divide dos lotes de números
+    def division_lote(self, a, b, ceros='error'):
+        """
+        Con ceros='error' lanza un único DivisionPorCeroLote con todas las posiciones de divisor
+        cero. Con ceros='mascara' devuelve (resultado, mascara): en esas posiciones la máscara
+        vale True y el resultado es NaN (arrays) o None (listas)
+        """
+        if ceros not in ('error', 'mascara'):
+            raise ValueError(f"Tratamiento de ceros desconocido: {ceros}")
+        a, b, vectorial = _operandos(a, b)
+        if vectorial:
+            with np.errstate(divide='ignore', invalid='ignore'):                        # Los ceros se tratan después
+                resultado = np.asarray(np.true_divide(a, b))
+            mascara = np.broadcast_to(b == 0, resultado.shape)
+            if mascara.any():
+                if ceros == 'error':
+                    raise DivisionPorCeroLote(np.flatnonzero(mascara).tolist())
+                resultado[mascara] = np.nan
+            return (resultado, mascara.copy()) if ceros == 'mascara' else resultado
+        mascara = [y == 0 for y in b]
+        if ceros == 'error' and any(mascara):
+            raise DivisionPorCeroLote([i for i, cero in enumerate(mascara) if cero])
+        resultado = [None if cero else x / y for x, y, cero in zip(a, b, mascara)]
+        return (resultado, mascara) if ceros == 'mascara' else resultado
+
+class CalculadoraAsincrona:
+    """
+    Variante asíncrona de Calculadora: los métodos son corrutinas que ceden el control al
+    bucle de eventos (durante `latencia` segundos, para simular una operación remota)
+    antes de devolver el resultado
+    """
+
+    def __init__(self, latencia=0):
+        self.latencia = latencia
+
+    #Suma dos números
+    async def suma(self, a, b):
+        await asyncio.sleep(self.latencia)
+        return a + b
+
+    #Resta dos números
+    async def resta(self, a, b):
+        await asyncio.sleep(self.latencia)
+        return a - b
+
+    #Multiplica dos números
+    async def multiplicacion(self, a, b):
+        await asyncio.sleep(self.latencia)
+        return a * b
+
+    #Divide dos números
+    async def division(self, a, b):
+        await asyncio.sleep(self.latencia)
+        #Lanza una excepción si se intenta dividir por cero
+        if b == 0:
+            raise ValueError("No se puede dividir por cero")
+        return a / b
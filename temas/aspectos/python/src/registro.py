@@ -0,0 +1,126 @@
+import threading                    # Cerrojo para modificar el registro desde varios hilos
+
+from tejido import Aspecto, tejer   # Tejido fusionado de los aspectos Aspecto
+
+_HEREDADO = object()                # El método no estaba definido en la propia clase
+
+class RegistroAspectos:
+    """
+    Registro de los aspectos aplicados a cada clase, que se pueden adjuntar, separar,
+    activar y desactivar en tiempo de ejecución. Cada cambio vuelve a tejer los métodos
+    afectados a partir de la función original; si un método se queda sin aspectos activos
+    se restaura la función original, de modo que desactivarlos no tiene ningún coste
+    """
+
+    def __init__(self):
+        self._cerrojo = threading.RLock()
+        self._originales = {}       # clase -> {metodo: función original}
+        self._aspectos = {}         # clase -> [[nombre, aspecto, métodos, activo]], del más externo al más interno
+
+    def adjuntar(self, clase, metodos, nombre, aspecto, activo=True):
+        """
+        Adjunta un aspecto (un Aspecto del tejido fusionado o un aspecto de aspectlib) a los
+        métodos indicados. Si ya hay uno con ese nombre se sustituye en la misma posición;
+        si no, se añade como el más interno
+        """
+        with self._cerrojo:
+            for metodo in metodos:
+                if metodo not in clase.__dict__:
+                    self._heredado(clase, metodo)                                       # AttributeError antes de tocar nada
+            originales = self._originales.setdefault(clase, {})
+            for metodo in metodos:
+                if metodo not in originales:
+                    originales[metodo] = clase.__dict__.get(metodo, _HEREDADO)
+            entrada = [nombre, aspecto, tuple(metodos), activo]
+            lista = self._aspectos.setdefault(clase, [])
+            anterior = self._buscar(clase, nombre, obligatorio=False)
+            if anterior is None:
+                lista.append(entrada)
+            else:
+                lista[lista.index(anterior)] = entrada
+            self._tejer(clase, set(metodos) | set(anterior[2] if anterior else ()))
+
+    def separar(self, clase, nombre):
+        """Quita un aspecto de la clase"""
+        with self._cerrojo:
+            entrada = self._buscar(clase, nombre)
+            self._aspectos[clase].remove(entrada)
+            self._tejer(clase, entrada[2])
+
+    def activar(self, clase, nombre, activo=True):
+        with self._cerrojo:
+            entrada = self._buscar(clase, nombre)
+            if entrada[3] != activo:
+                entrada[3] = activo
+                self._tejer(clase, entrada[2])
+
+    def desactivar(self, clase, nombre):
+        self.activar(clase, nombre, False)
+
+    def alternar(self, clase, nombre):
+        """Cambia el estado de un aspecto y devuelve el nuevo"""
+        with self._cerrojo:
+            activo = not self._buscar(clase, nombre)[3]
+            self.activar(clase, nombre, activo)
+            return activo
+
+    def aspectos(self, clase, metodo=None):
+        """Nombres y estado de los aspectos de la clase (o de uno de sus métodos), del más externo al más interno"""
+        with self._cerrojo:
+            return [(nombre, activo) for nombre, _, metodos, activo in self._aspectos.get(clase, [])
+                    if metodo is None or metodo in metodos]
+
+    def restaurar(self, clase):
+        """Quita todos los aspectos de la clase y deja sus métodos originales"""
+        with self._cerrojo:
+            self._aspectos.pop(clase, None)
+            for metodo, original in self._originales.pop(clase, {}).items():
+                self._poner(clase, metodo, original)
+
+    def _buscar(self, clase, nombre, obligatorio=True):
+        for entrada in self._aspectos.get(clase, []):
+            if entrada[0] == nombre:
+                return entrada
+        if obligatorio:
+            raise KeyError(f"{clase.__name__} no tiene el aspecto {nombre}")
+        return None
+
+    @staticmethod
+    def _poner(clase, metodo, funcion):
+        if funcion is _HEREDADO:
+            if metodo in clase.__dict__:
+                delattr(clase, metodo)
+        else:
+            setattr(clase, metodo, funcion)
+
+    @staticmethod
+    def _heredado(clase, metodo):
+        """Función que la clase hereda con ese nombre; AttributeError si no hay ninguna"""
+        funcion = next((base.__dict__[metodo] for base in clase.__mro__[1:] if metodo in base.__dict__), None)
+        if funcion is None:
+            raise AttributeError(f"{clase.__name__} no tiene el método {metodo}")
+        return funcion
+
+    def _tejer(self, clase, metodos):
+        for metodo in metodos:
+            original = self._originales[clase][metodo]
+            activos = [aspecto for _, aspecto, metodos_aspecto, activo in self._aspectos[clase]
+                       if activo and metodo in metodos_aspecto]
+            if not activos:
+                self._poner(clase, metodo, original)                                    # Sin aspectos: la función original
+                continue
+            funcion = original
+            if original is _HEREDADO:
+                funcion = self._heredado(clase, metodo)
+            # Los aspectos Aspecto consecutivos se fusionan en una sola envoltura; los de aspectlib se anidan
+            grupo = []
+            for aspecto in reversed(activos):                                           # Del más interno al más externo
+                if isinstance(aspecto, Aspecto):
+                    grupo.insert(0, aspecto)
+                    continue
+                if grupo:
+                    funcion, grupo = tejer(funcion, grupo), []
+                funcion = aspecto(funcion)
+            if grupo:
+                funcion = tejer(funcion, grupo)
+            self._poner(clase, metodo, funcion)
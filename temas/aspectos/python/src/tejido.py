@@ -0,0 +1,57 @@
+import inspect                               # Distinguir las funciones asíncronas (async def)
+from functools import wraps                  # Conservar nombre y documentación del método original
+
+class Aspecto:
+    """
+    Aspecto para el tejido fusionado: en lugar de un generador como en aspectlib,
+    define ganchos opcionales que se llaman directamente desde una única envoltura
+    """
+
+    antes = None        # antes(nombre, args, kwargs) -> estado que reciben despues y error
+    despues = None      # despues(nombre, estado, resultado), tras una ejecución correcta
+    error = None        # error(nombre, estado, excepcion), antes de propagar la excepción
+
+def _codigo(aspectos, asincrona=False):
+    """
+    Genera el código de la envoltura anidando los ganchos como lo harían los decoradores.
+    Si la función es asíncrona la envoltura también lo es y espera a la corrutina, de modo que
+    despues y error ven el resultado o la excepción de la ejecución y no sólo su creación
+    """
+    lineas = [("async " if asincrona else "") + "def envoltura(*args, **kwargs):"]
+    nivel = 1
+    for i, aspecto in enumerate(aspectos):                                              # Del más externo al más interno
+        sangria = "    " * nivel
+        if aspecto.antes is not None:
+            lineas.append(f"{sangria}_estado{i} = _antes{i}(_nombre, args, kwargs)")
+        elif aspecto.despues is not None or aspecto.error is not None:
+            lineas.append(f"{sangria}_estado{i} = None")
+        if aspecto.error is not None:
+            lineas.append(f"{sangria}try:")
+            nivel += 1
+    lineas.append("    " * nivel + "resultado = " + ("await " if asincrona else "") + "_funcion(*args, **kwargs)")
+    for i in reversed(range(len(aspectos))):                                            # Del más interno al más externo
+        aspecto = aspectos[i]
+        if aspecto.error is not None:
+            nivel -= 1
+            sangria = "    " * nivel
+            lineas += [f"{sangria}except Exception as _excepcion:",
+                       f"{sangria}    _error{i}(_nombre, _estado{i}, _excepcion)",
+                       f"{sangria}    raise"]
+        if aspecto.despues is not None:
+            lineas.append("    " * nivel + f"_despues{i}(_nombre, _estado{i}, resultado)")
+    lineas.append("    return resultado")
+    return "\n".join(lineas)
+
+def tejer(funcion, aspectos):
+    """
+    Fusiona una lista ordenada de aspectos (el primero es el más externo) en una sola
+    función plana: sin generadores ni una llamada anidada por aspecto. También vale
+    para funciones async def
+    """
+    espacio = {'_funcion': funcion, '_nombre': getattr(funcion, '__name__', str(funcion))}
+    for i, aspecto in enumerate(aspectos):
+        espacio[f"_antes{i}"] = aspecto.antes
+        espacio[f"_despues{i}"] = aspecto.despues
+        espacio[f"_error{i}"] = aspecto.error
+    exec(_codigo(aspectos, inspect.iscoroutinefunction(funcion)), espacio)              # Compilar la envoltura una sola vez
+    return wraps(funcion)(espacio['envoltura'])
@@ -0,0 +1,142 @@
+import asyncio                                                  # Bucle de eventos para las llamadas concurrentes
+import logging                                                  # Manejadores de prueba para el log de los aspectos
+import logging.handlers
+import os                                                       # Rutas para localizar src
+import re
+import sys
+import threading
+import time
+import unittest                                                 # Importar el módulo de pruebas unitarias
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import aspectos                                                 # Aspectos, aplicar_aspectos y LogEnCola
+from metricas import MetricasEjecucion
+from operaciones import CalculadoraAsincrona
+from tejido import Aspecto, tejer
+
+LLAMADAS = 2000                                                 # Llamadas concurrentes por prueba
+LATENCIA = 0.01                                                 # Duración mínima de cada llamada
+
+class Lista(logging.Handler):
+    """Manejador que guarda los mensajes; si se le da un evento, espera a él antes de guardar"""
+
+    def __init__(self, liberar=None):
+        super().__init__()
+        self.liberar = liberar
+        self.mensajes = []
+
+    def emit(self, registro):
+        if self.liberar is not None:
+            self.liberar.wait()                                 # E/S bloqueada hasta que la prueba lo diga
+        self.mensajes.append((registro.levelname, registro.getMessage()))
+
+class Traza(Aspecto):
+    def __init__(self, eventos):
+        self.eventos = eventos
+
+    def antes(self, nombre, args, kwargs):
+        self.eventos.append("antes")
+
+    def despues(self, nombre, estado, resultado):
+        self.eventos.append(f"despues {resultado}")
+
+    def error(self, nombre, estado, excepcion):
+        self.eventos.append(f"error {excepcion}")
+
+class TestTejidoAsincrono(unittest.TestCase):
+    """El tejido fusionado espera a las corrutinas"""
+
+    def test_ganchos_tras_la_ejecucion(self):
+        eventos = []
+        async def operacion(x):
+            eventos.append("ejecucion")
+            await asyncio.sleep(0)
+            if x == 0:
+                raise ValueError("cero")
+            return x
+
+        funcion = tejer(operacion, [Traza(eventos)])
+        self.assertTrue(asyncio.iscoroutinefunction(funcion))
+        self.assertEqual(asyncio.run(funcion(5)), 5)
+        self.assertEqual(eventos, ["antes", "ejecucion", "despues 5"])              # No "despues <coroutine ...>"
+        eventos.clear()
+        with self.assertRaises(ValueError):
+            asyncio.run(funcion(0))
+        self.assertEqual(eventos, ["antes", "ejecucion", "error cero"])
+
+class TestCalculadoraAsincrona(unittest.TestCase):
+    """Miles de llamadas concurrentes a CalculadoraAsincrona con los aspectos tejidos"""
+
+    def setUp(self):
+        self.nivel = aspectos.logger.level
+        aspectos.logger.setLevel(logging.INFO)
+
+    def tearDown(self):
+        aspectos.registro.restaurar(CalculadoraAsincrona)
+        aspectos.logger.setLevel(self.nivel)
+
+    async def concurrentes(self, calc):
+        return await asyncio.gather(*(calc.suma(i, 1) for i in range(LLAMADAS)))
+
+    def test_log_y_tiempos(self):
+        aspectos.aplicar_aspectos('fusionado', clase=CalculadoraAsincrona)
+        destino = Lista()
+        calc = CalculadoraAsincrona(latencia=LATENCIA)
+        with aspectos.LogEnCola(manejadores=[destino]):
+            inicio = time.perf_counter()
+            resultados = asyncio.run(self.concurrentes(calc))
+            transcurrido = time.perf_counter() - inicio
+        self.assertEqual(resultados, [i + 1 for i in range(LLAMADAS)])
+        self.assertLess(transcurrido, LLAMADAS * LATENCIA / 4)                          # Las llamadas se solapan
+        mensajes = [mensaje for _, mensaje in destino.mensajes]
+        self.assertEqual(sum(mensaje.startswith("Antes de ejecutar: suma") for mensaje in mensajes), LLAMADAS)
+        self.assertEqual(mensajes.count("Después de ejecutar: suma"), LLAMADAS)
+        tiempos = [float(m.group(1)) for m in map(re.compile(r"suma ejecutado en ([\d.]+) segundos").match, mensajes) if m]
+        self.assertEqual(len(tiempos), LLAMADAS)
+        self.assertGreaterEqual(min(tiempos), LATENCIA - 0.001)                         # Se mide la ejecución, no la creación
+
+    def test_errores(self):
+        aspectos.aplicar_aspectos('fusionado', clase=CalculadoraAsincrona)
+        destino = Lista()
+        async def dividir():
+            calc = CalculadoraAsincrona()
+            return await asyncio.gather(*(calc.division(1, i % 2) for i in range(LLAMADAS)), return_exceptions=True)
+
+        with aspectos.LogEnCola(manejadores=[destino]):
+            resultados = asyncio.run(dividir())
+        self.assertEqual(sum(isinstance(resultado, ValueError) for resultado in resultados), LLAMADAS // 2)
+        errores = [mensaje for nivel, mensaje in destino.mensajes if nivel == 'ERROR']
+        self.assertEqual(errores, ["Error en division: No se puede dividir por cero"] * (LLAMADAS // 2))
+
+    def test_metricas(self):
+        metricas = MetricasEjecucion()
+        aspectos.aplicar_aspectos('fusionado', metricas=metricas, clase=CalculadoraAsincrona)
+        aspectos.logger.setLevel(logging.WARNING)
+        asyncio.run(self.concurrentes(CalculadoraAsincrona(latencia=LATENCIA)))
+        suma = metricas.instantanea()['suma']
+        self.assertEqual(suma['cuenta'], LLAMADAS)
+        self.assertGreaterEqual(suma['min_ns'], (LATENCIA - 0.001) * 1e9)
+
+    def test_el_log_no_bloquea_el_bucle(self):
+        """Con la E/S del log bloqueada, las llamadas terminan igual: el bucle sólo encola"""
+        aspectos.aplicar_aspectos('fusionado', clase=CalculadoraAsincrona)
+        liberar = threading.Event()
+        destino = Lista(liberar)
+        with aspectos.LogEnCola(manejadores=[destino]):
+            try:
+                resultados = asyncio.run(self.concurrentes(CalculadoraAsincrona()))
+                self.assertEqual(len(resultados), LLAMADAS)
+                self.assertEqual(destino.mensajes, [])                                  # Nada escrito todavía
+            finally:
+                liberar.set()                                                           # Si no, detener esperaría siempre
+        self.assertEqual(len(destino.mensajes), 3 * LLAMADAS)                           # detener vacía la cola
+        self.assertFalse(any(isinstance(manejador, logging.handlers.QueueHandler) for manejador in aspectos.logger.handlers))
+
+    def test_aspectlib_no_admite_corrutinas(self):
+        with self.assertRaises(ValueError):
+            aspectos.aplicar_aspectos('aspectlib', clase=CalculadoraAsincrona)
+
+# Ejecutar las pruebas si este script es ejecutado directamente
+if __name__ == "__main__":
+    unittest.main()
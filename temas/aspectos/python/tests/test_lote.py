@@ -0,0 +1,108 @@
+import logging                                                  # Silenciar el log de los aspectos durante las pruebas
+import math
+import os                                                       # Rutas para localizar src
+import sys
+import unittest                                                 # Importar el módulo de pruebas unitarias
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import aspectos                                                 # Aspectos y aplicar_aspectos
+from metricas import MetricasEjecucion
+from operaciones import Calculadora, DivisionPorCeroLote, np
+
+class TestOperacionesLote(unittest.TestCase):
+    """Pruebas de las operaciones por lotes con listas"""
+
+    def setUp(self):
+        self.calc = Calculadora()
+
+    def test_operaciones(self):
+        self.assertEqual(self.calc.suma_lote([1, 2, 3], [10, 20, 30]), [11, 22, 33])
+        self.assertEqual(self.calc.resta_lote((5, 6), [1, 2]), [4, 4])
+        self.assertEqual(self.calc.multiplicacion_lote(range(4), 3), [0, 3, 6, 9])
+        self.assertEqual(self.calc.division_lote(12, [3, 4, 6]), [4, 3, 2])
+
+    def test_mismo_resultado_que_escalar(self):
+        a, b = [7, -3, 2.5, 10 ** 30], [2, 4, -0.5, 3]
+        for escalar in ('suma', 'resta', 'multiplicacion', 'division'):
+            lote = getattr(self.calc, f"{escalar}_lote")(a, b)
+            self.assertEqual(lote, [getattr(self.calc, escalar)(x, y) for x, y in zip(a, b)])
+
+    def test_division_por_cero(self):
+        with self.assertRaises(DivisionPorCeroLote) as contexto:
+            self.calc.division_lote([1, 2, 3, 4], [0, 1, 0, 2])
+        self.assertEqual(contexto.exception.posiciones, [0, 2])
+        self.assertIsInstance(contexto.exception, ValueError)                          # Igual que division
+        resultado, mascara = self.calc.division_lote([1, 2, 3, 4], [0, 1, 0, 2], ceros='mascara')
+        self.assertEqual(resultado, [None, 2, None, 2])
+        self.assertEqual(mascara, [True, False, True, False])
+
+    def test_errores_de_uso(self):
+        with self.assertRaises(ValueError):
+            self.calc.suma_lote([1, 2], [1, 2, 3])
+        with self.assertRaises(ValueError):
+            self.calc.suma_lote(1, 2)
+        with self.assertRaises(ValueError):
+            self.calc.division_lote([1], [1], ceros='ignorar')
+
+@unittest.skipIf(np is None, "NumPy no está instalado")
+class TestOperacionesLoteNumPy(unittest.TestCase):
+    """Pruebas de las operaciones por lotes vectorizadas con NumPy"""
+
+    def setUp(self):
+        self.calc = Calculadora()
+
+    def test_operaciones(self):
+        a, b = np.arange(1, 6), np.array([2, 2, 5, 1, 4])
+        self.assertIsInstance(self.calc.suma_lote(a, b), np.ndarray)
+        self.assertEqual(self.calc.suma_lote(a, b).tolist(), [3, 4, 8, 5, 9])
+        self.assertEqual(self.calc.resta_lote(a, 1).tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(self.calc.multiplicacion_lote([1, 2, 3, 4, 5], b).tolist(), [2, 4, 15, 4, 20])
+        self.assertEqual(self.calc.division_lote(a, b).tolist(), [0.5, 1, 0.6, 4, 1.25])
+
+    def test_division_por_cero(self):
+        a, b = np.arange(6.0), np.array([1, 0, 2, 0, 0, 5])
+        with self.assertRaises(DivisionPorCeroLote) as contexto:
+            self.calc.division_lote(a, b)
+        self.assertEqual(contexto.exception.posiciones, [1, 3, 4])
+        resultado, mascara = self.calc.division_lote(a, b, ceros='mascara')
+        self.assertEqual(mascara.tolist(), [False, True, False, True, True, False])
+        self.assertEqual(resultado[~mascara].tolist(), [0, 1, 1])
+        self.assertTrue(all(math.isnan(valor) for valor in resultado[mascara]))
+        self.assertEqual(self.calc.division_lote(np.ones((2, 2)), 0, ceros='mascara')[1].tolist(),
+                         [[True, True], [True, True]])                                  # Divisor escalar difundido
+
+class TestAspectosPorLote(unittest.TestCase):
+    """Los aspectos se ejecutan una vez por lote, no una vez por elemento"""
+
+    def setUp(self):
+        self.nivel = aspectos.logger.level
+
+    def tearDown(self):
+        aspectos.registro.restaurar(Calculadora)
+        aspectos.logger.setLevel(self.nivel)
+
+    def test_una_vez_por_lote(self):
+        aspectos.logger.setLevel(logging.INFO)
+        for modo in ('aspectlib', 'fusionado'):
+            aspectos.aplicar_aspectos(modo)
+            with self.assertLogs(aspectos.logger, level='INFO') as capturados:
+                Calculadora().suma_lote(list(range(10000)), 1)
+            self.assertEqual(len(capturados.output), 3)
+            self.assertLess(len(capturados.output[0]), 500)                            # Argumentos resumidos
+
+    def test_error_agregado_y_metricas(self):
+        aspectos.logger.setLevel(logging.CRITICAL)
+        metricas = MetricasEjecucion()
+        aspectos.aplicar_aspectos('fusionado', metricas=metricas)
+        calc = Calculadora()
+        calc.multiplicacion_lote(list(range(1000)), 2)
+        with self.assertRaises(DivisionPorCeroLote):
+            calc.division_lote([1, 2, 3], [0, 0, 1])
+        instantanea = metricas.instantanea()
+        self.assertEqual(instantanea['multiplicacion_lote']['cuenta'], 1)
+        self.assertEqual((instantanea['division_lote']['cuenta'], instantanea['division_lote']['errores']), (1, 1))
+
+# Ejecutar las pruebas si este script es ejecutado directamente
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import logging                                                  # Silenciar el log de los aspectos durante las pruebas
+import os                                                       # Rutas para localizar src
+import random
+import sys
+import threading
+import time
+import unittest                                                 # Importar el módulo de pruebas unitarias
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import aspectos                                                 # Aspectos y aplicar_aspectos
+from metricas import Histograma, InformePeriodico, MetricasEjecucion, formatear
+from operaciones import Calculadora
+from tejido import tejer
+
+class TestHistograma(unittest.TestCase):
+    """Pruebas del histograma de duraciones"""
+
+    def test_valores_exactos(self):
+        histograma = Histograma()
+        for valor in (5, 1000, 250, 7):
+            histograma.registrar(valor)
+        resumen = histograma.resumen()
+        self.assertEqual((resumen['cuenta'], resumen['suma_ns'], resumen['min_ns'], resumen['max_ns']), (4, 1262, 5, 1000))
+        self.assertEqual(resumen['media_ns'], 315.5)
+
+    def test_percentiles_aproximados(self):
+        """Los percentiles tienen un error relativo menor del 7%"""
+        aleatorio = random.Random(22)
+        valores = [int(aleatorio.lognormvariate(8, 1.5)) for _ in range(20000)]
+        histograma = Histograma()
+        for valor in valores:
+            histograma.registrar(valor)
+        valores.sort()
+        for percentil, aproximado in zip((50, 95, 99), histograma.percentiles(50, 95, 99)):
+            exacto = valores[-(-percentil * len(valores) // 100) - 1]
+            self.assertLessEqual(abs(aproximado - exacto), exacto * 0.07)
+        self.assertEqual(histograma.percentiles(0, 100), [valores[0], valores[-1]])
+
+    def test_vacio_y_reinicio(self):
+        histograma = Histograma()
+        self.assertEqual(histograma.percentiles(50), [None])
+        histograma.registrar(10)
+        histograma.reiniciar()
+        self.assertEqual(histograma.resumen()['cuenta'], 0)
+
+class TestMetricasEjecucion(unittest.TestCase):
+    """Pruebas del aspecto de métricas"""
+
+    def setUp(self):
+        self.nivel = aspectos.logger.level
+        aspectos.logger.setLevel(logging.CRITICAL)
+
+    def tearDown(self):
+        aspectos.registro.restaurar(Calculadora)                                        # Volver a los métodos originales
+        aspectos.logger.setLevel(self.nivel)
+
+    def test_histograma_por_metodo(self):
+        metricas = MetricasEjecucion()
+        aspectos.aplicar_aspectos('fusionado', metricas=metricas)
+        calc = Calculadora()
+        for i in range(100):
+            calc.suma(i, 1)
+        calc.division(4, 2)
+        with self.assertRaises(ValueError):
+            calc.division(4, 0)
+        instantanea = metricas.instantanea()
+        self.assertEqual(sorted(instantanea), ['division', 'suma'])
+        self.assertEqual(instantanea['suma']['cuenta'], 100)
+        self.assertEqual((instantanea['division']['cuenta'], instantanea['division']['errores']), (2, 1))
+        self.assertGreater(instantanea['suma']['min_ns'], 0)
+        self.assertLessEqual(instantanea['suma']['p50_ns'], instantanea['suma']['p99_ns'])
+        metricas.reiniciar()
+        self.assertEqual(metricas.instantanea()['suma']['cuenta'], 0)
+
+    def test_sustituye_al_log_de_tiempos(self):
+        aspectos.logger.setLevel(logging.INFO)
+        aspectos.aplicar_aspectos('fusionado', metricas=MetricasEjecucion())
+        with self.assertLogs(aspectos.logger, level='INFO') as capturados:
+            Calculadora().suma(1, 2)
+        self.assertFalse(any('ejecutado en' in mensaje for mensaje in capturados.output))
+        with self.assertRaises(ValueError):
+            aspectos.aplicar_aspectos('aspectlib', metricas=MetricasEjecucion())
+
+    def test_muestreo(self):
+        metricas = MetricasEjecucion(muestreo=10)
+        funcion = tejer(lambda x: x, [metricas])
+        for i in range(95):
+            funcion(i)
+        self.assertEqual(metricas.instantanea()['<lambda>']['cuenta'], 10)
+        self.assertEqual(metricas.instantanea()['<lambda>']['muestreo'], 10)
+        with self.assertRaises(ValueError):
+            MetricasEjecucion(muestreo=0)
+
+    def test_hilos(self):
+        metricas = MetricasEjecucion()
+        funcion = tejer(lambda x: x, [metricas])
+        def trabajar():
+            for i in range(2000):
+                funcion(i)
+        hilos = [threading.Thread(target=trabajar) for _ in range(8)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        self.assertEqual(metricas.instantanea()['<lambda>']['cuenta'], 16000)
+
+class TestInformePeriodico(unittest.TestCase):
+    """Pruebas del informe periódico"""
+
+    def test_informa_y_reinicia(self):
+        metricas = MetricasEjecucion()
+        funcion = tejer(lambda x: x, [metricas])
+        lineas = []
+        with InformePeriodico(metricas, intervalo=0.01, destino=lineas.append):
+            for i in range(50):
+                funcion(i)
+            limite = time.monotonic() + 5
+            while not lineas and time.monotonic() < limite:
+                time.sleep(0.01)
+        self.assertTrue(lineas[0].startswith("<lambda>: n=50 (1/1) errores=0"))
+        self.assertIn("p99=", lineas[0])
+        # Cada periodo empieza de cero: sin llamadas nuevas no se informa de nada más
+        self.assertEqual(len(lineas), 1)
+        self.assertEqual(metricas.instantanea()['<lambda>']['cuenta'], 0)
+
+    def test_formatear_omite_metodos_sin_datos(self):
+        metricas = MetricasEjecucion()
+        metricas.histograma('suma')
+        self.assertEqual(formatear(metricas.instantanea()), [])
+
+# Ejecutar las pruebas si este script es ejecutado directamente
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import logging                                                  # Silenciar el log de los aspectos durante las pruebas
+import os                                                       # Rutas para localizar src
+import sys
+import unittest                                                 # Importar el módulo de pruebas unitarias
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import aspectlib
+import aspectos                                                 # Aspectos, aplicar_aspectos y el registro global
+from operaciones import Calculadora
+from registro import RegistroAspectos
+from tejido import Aspecto
+
+class Traza(Aspecto):
+    """Aspecto de prueba que apunta en una lista cuándo se ejecuta"""
+
+    def __init__(self, nombre, eventos):
+        self.nombre = nombre
+        self.eventos = eventos
+
+    def antes(self, nombre, args, kwargs):
+        self.eventos.append(f"{self.nombre} {nombre}")
+
+def traza_aspectlib(eventos):
+    """Aspecto de aspectlib equivalente a Traza"""
+    @aspectlib.Aspect
+    def traza(*args, **kwargs):
+        eventos.append("aspectlib")
+        return (yield aspectlib.Proceed)
+    return traza
+
+class Base:
+    def doble(self, x):
+        return 2 * x
+
+class Derivada(Base):
+    pass
+
+class TestRegistroAspectos(unittest.TestCase):
+    """Pruebas del registro de aspectos en tiempo de ejecución"""
+
+    def setUp(self):
+        self.registro = RegistroAspectos()
+        self.eventos = []
+        self.original = Calculadora.__dict__['suma']
+
+    def tearDown(self):
+        self.registro.restaurar(Calculadora)
+        self.registro.restaurar(Derivada)
+
+    def test_adjuntar_y_separar(self):
+        self.registro.adjuntar(Calculadora, ['suma'], 'a', Traza('a', self.eventos))
+        self.registro.adjuntar(Calculadora, ['suma', 'resta'], 'b', Traza('b', self.eventos))
+        calc = Calculadora()
+        self.assertEqual(calc.suma(1, 2), 3)
+        self.assertEqual(calc.resta(5, 2), 3)
+        self.assertEqual(self.eventos, ["a suma", "b suma", "b resta"])
+        self.assertEqual(self.registro.aspectos(Calculadora), [('a', True), ('b', True)])
+        self.assertEqual(self.registro.aspectos(Calculadora, 'resta'), [('b', True)])
+        self.registro.separar(Calculadora, 'a')
+        self.registro.separar(Calculadora, 'b')
+        self.assertIs(Calculadora.__dict__['suma'], self.original)                      # Sin envoltura alguna
+        with self.assertRaises(KeyError):
+            self.registro.separar(Calculadora, 'a')
+
+    def test_activar_y_desactivar(self):
+        self.registro.adjuntar(Calculadora, ['suma'], 'a', Traza('a', self.eventos))
+        self.registro.adjuntar(Calculadora, ['suma'], 'b', Traza('b', self.eventos), activo=False)
+        Calculadora().suma(1, 2)
+        self.assertEqual(self.eventos, ["a suma"])
+        self.assertTrue(self.registro.alternar(Calculadora, 'b'))
+        self.registro.desactivar(Calculadora, 'a')
+        Calculadora().suma(1, 2)
+        self.assertEqual(self.eventos, ["a suma", "b suma"])
+        self.registro.desactivar(Calculadora, 'b')
+        self.assertIs(Calculadora.__dict__['suma'], self.original)
+        self.registro.activar(Calculadora, 'a')
+        self.assertEqual(self.registro.aspectos(Calculadora), [('a', True), ('b', False)])
+
+    def test_sustituir_conserva_la_posicion(self):
+        self.registro.adjuntar(Calculadora, ['suma'], 'a', Traza('a', self.eventos))
+        self.registro.adjuntar(Calculadora, ['suma'], 'b', Traza('b', self.eventos))
+        self.registro.adjuntar(Calculadora, ['suma'], 'a', Traza('nuevo', self.eventos))
+        Calculadora().suma(1, 2)
+        self.assertEqual(self.eventos, ["nuevo suma", "b suma"])
+
+    def test_aspectlib_y_fusionados(self):
+        """Los aspectos de aspectlib se anidan entre los grupos de aspectos fusionados"""
+        self.registro.adjuntar(Calculadora, ['suma'], 'a', Traza('a', self.eventos))
+        self.registro.adjuntar(Calculadora, ['suma'], 'b', traza_aspectlib(self.eventos))
+        self.registro.adjuntar(Calculadora, ['suma'], 'c', Traza('c', self.eventos))
+        self.assertEqual(Calculadora().suma(1, 2), 3)
+        self.assertEqual(self.eventos, ["a suma", "aspectlib", "c suma"])
+        self.registro.desactivar(Calculadora, 'b')
+        self.eventos.clear()
+        Calculadora().suma(1, 2)
+        self.assertEqual(self.eventos, ["a suma", "c suma"])
+
+    def test_metodo_heredado(self):
+        self.registro.adjuntar(Derivada, ['doble'], 'a', Traza('a', self.eventos))
+        self.assertEqual(Derivada().doble(4), 8)
+        self.assertEqual(Base().doble(4), 8)
+        self.assertEqual(self.eventos, ["a doble"])
+        self.registro.desactivar(Derivada, 'a')
+        self.assertNotIn('doble', Derivada.__dict__)                                   # Vuelve a heredarse de Base
+
+    def test_coste_cero_al_separar(self):
+        """Tras separar los aspectos el método vuelve a ser la función original, sin envoltura"""
+        self.registro.adjuntar(Calculadora, ['suma'], 'a', Traza('a', []))
+        self.assertIsNot(Calculadora.__dict__['suma'], self.original)
+        self.registro.separar(Calculadora, 'a')
+        self.assertIs(Calculadora.__dict__['suma'], self.original)
+        self.registro.adjuntar(Derivada, ['doble'], 'a', Traza('a', []))
+        self.registro.separar(Derivada, 'a')
+        self.assertIs(Derivada().doble.__func__, Base.__dict__['doble'])
+
+    def test_metodo_inexistente(self):
+        with self.assertRaisesRegex(AttributeError, "Calculadora no tiene el método potencia"):
+            self.registro.adjuntar(Calculadora, ['suma', 'potencia'], 'a', Traza('a', self.eventos))
+        self.assertEqual(self.registro.aspectos(Calculadora), [])                       # No queda nada a medias
+        self.assertIs(Calculadora.__dict__['suma'], self.original)
+
+class TestAplicarAspectos(unittest.TestCase):
+    """aplicar_aspectos deja los aspectos en el registro global"""
+
+    def setUp(self):
+        self.nivel = aspectos.logger.level
+        aspectos.logger.setLevel(logging.INFO)
+
+    def tearDown(self):
+        aspectos.registro.restaurar(Calculadora)
+        aspectos.logger.setLevel(self.nivel)
+
+    def test_desactivar_un_aspecto(self):
+        for modo in ('aspectlib', 'fusionado'):
+            aspectos.aplicar_aspectos(modo)
+            aspectos.registro.desactivar(Calculadora, 'log_antes_despues')
+            with self.assertLogs(aspectos.logger, level='INFO') as capturados:
+                Calculadora().suma(1, 2)
+            self.assertEqual(len(capturados.output), 1)                                 # Sólo el tiempo de ejecución
+            self.assertIn('ejecutado en', capturados.output[0])
+
+    def test_aplicar_dos_veces_no_envuelve_dos_veces(self):
+        aspectos.aplicar_aspectos('fusionado')
+        aspectos.aplicar_aspectos('fusionado')
+        with self.assertLogs(aspectos.logger, level='INFO') as capturados:
+            Calculadora().suma(1, 2)
+        self.assertEqual(len(capturados.output), 3)
+        self.assertEqual([nombre for nombre, _ in aspectos.registro.aspectos(Calculadora)],
+                         ['manejo_errores', 'tiempo_ejecucion', 'log_antes_despues'])
+
+# Ejecutar las pruebas si este script es ejecutado directamente
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import os                                                       # Rutas para localizar src
+import sys
+import unittest                                                 # Importar el módulo de pruebas unitarias
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import aspectos                                                 # Aspectos y aplicar_aspectos (importa operaciones desde src)
+from operaciones import Calculadora
+from tejido import Aspecto, tejer
+
+class Traza(Aspecto):
+    """Aspecto de prueba que apunta en una lista el orden en que se llaman sus ganchos"""
+
+    def __init__(self, nombre, eventos):
+        self.nombre = nombre
+        self.eventos = eventos
+
+    def antes(self, nombre, args, kwargs):
+        self.eventos.append(f"antes {self.nombre}")
+        return self.nombre
+
+    def despues(self, nombre, estado, resultado):
+        self.eventos.append(f"despues {estado} {resultado}")
+
+    def error(self, nombre, estado, excepcion):
+        self.eventos.append(f"error {estado} {excepcion}")
+
+class SoloAntes(Aspecto):
+    def __init__(self, eventos):
+        self.eventos = eventos
+
+    def antes(self, nombre, args, kwargs):
+        self.eventos.append(f"solo antes {nombre}")
+
+class Repr:
+    """Argumento que cuenta cuántas veces se convierte a texto"""
+
+    veces = 0
+
+    def __repr__(self):
+        Repr.veces += 1
+        return "Repr()"
+
+    def __add__(self, otro):
+        return self
+
+class TestTejido(unittest.TestCase):
+    """Pruebas del tejido fusionado de aspectos"""
+
+    def setUp(self):
+        self.nivel = aspectos.logger.level
+
+    def tearDown(self):
+        aspectos.registro.restaurar(Calculadora)                                        # Volver a los métodos originales
+        aspectos.logger.setLevel(self.nivel)
+
+    def registros(self, modo, calc, operacion):
+        """Aplica los aspectos en el modo indicado y devuelve los mensajes que genera la operación"""
+        aspectos.aplicar_aspectos(modo)                                                 # Sustituye a los aspectos anteriores
+        with self.assertLogs(aspectos.logger, level='INFO') as capturados:
+            try:
+                operacion(calc)
+            except ValueError:
+                pass
+        # El tiempo medido cambia en cada ejecución
+        return [(registro.levelname, registro.getMessage().rsplit(' en ', 1)[0] if 'ejecutado en' in registro.getMessage()
+                 else registro.getMessage()) for registro in capturados.records]
+
+    def test_mismos_resultados(self):
+        """Las operaciones devuelven lo mismo con los dos modos de tejido"""
+        aspectos.aplicar_aspectos('fusionado')
+        calc = Calculadora()
+        self.assertEqual(calc.suma(5, 3), 8)
+        self.assertEqual(calc.resta(5, 3), 2)
+        self.assertEqual(calc.multiplicacion(5, 3), 15)
+        self.assertEqual(calc.division(6, 3), 2)
+        self.assertEqual(Calculadora.suma.__name__, 'suma')                            # wraps conserva el nombre
+        with self.assertRaises(ValueError):
+            calc.division(5, 0)
+
+    def test_mismos_mensajes_que_aspectlib(self):
+        """El modo fusionado registra los mismos mensajes y en el mismo orden que aspectlib"""
+        calc = Calculadora()
+        suma = self.registros('fusionado', calc, lambda calc: calc.suma(5, 3))
+        self.assertEqual(suma, [('INFO', f"Antes de ejecutar: suma, args=({calc!r}, 5, 3), kwargs={{}}"),
+                                ('INFO', "Después de ejecutar: suma"),
+                                ('INFO', "suma ejecutado")])
+        division = self.registros('fusionado', calc, lambda calc: calc.division(5, 0))
+        self.assertEqual(division, [('INFO', f"Antes de ejecutar: division, args=({calc!r}, 5, 0), kwargs={{}}"),
+                                    ('ERROR', "Error en division: No se puede dividir por cero")])
+        # Con aspectlib el primer argumento del aspecto es la instancia: el nombre que aparece es el de la
+        # instancia y ésta no sale en args. Salvo eso, los mensajes coinciden
+        for nombre, operacion, fusionado in (('suma', lambda calc: calc.suma(5, 3), suma),
+                                             ('division', lambda calc: calc.division(5, 0), division)):
+            con_aspectlib = [(nivel, mensaje.replace(repr(calc), nombre))
+                             for nivel, mensaje in self.registros('aspectlib', calc, operacion)]
+            self.assertEqual(con_aspectlib, [(nivel, mensaje.replace(f"({calc!r}, ", "("))
+                                             for nivel, mensaje in fusionado])
+
+    def test_orden_de_los_ganchos(self):
+        """El primer aspecto es el más externo, como al anidar decoradores"""
+        eventos = []
+        funcion = tejer(lambda a, b: a / b, [Traza("externo", eventos), SoloAntes(eventos), Traza("interno", eventos)])
+        self.assertEqual(funcion(6, 3), 2)
+        self.assertEqual(eventos, ["antes externo", "solo antes <lambda>", "antes interno",
+                                   "despues interno 2.0", "despues externo 2.0"])
+        eventos.clear()
+        with self.assertRaises(ZeroDivisionError):
+            funcion(1, 0)
+        self.assertEqual(eventos, ["antes externo", "solo antes <lambda>", "antes interno",
+                                   "error interno division by zero", "error externo division by zero"])
+
+    def test_formato_perezoso(self):
+        """Con INFO desactivado no se formatean los argumentos"""
+        aspectos.logger.setLevel('WARNING')
+        aspectos.aplicar_aspectos('fusionado')
+        Repr.veces = 0
+        valor = Repr()
+        self.assertIs(Calculadora().suma(valor, 0), valor)
+        self.assertEqual(Repr.veces, 0)
+
+    def test_modo_desconocido(self):
+        with self.assertRaises(ValueError):
+            aspectos.aplicar_aspectos('otro')
+
+# Ejecutar las pruebas si este script es ejecutado directamente
+if __name__ == "__main__":
+    unittest.main()
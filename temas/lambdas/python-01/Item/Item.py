@@ -10,22 +10,41 @@ class Item:
     def __repr__(self):
         return f"Item(name={self.name}, category={self.category}, price={self.price}, quantity={self.quantity})"
 
+class CompactItem:
+    """Item con __slots__: mismos atributos y __repr__ que Item, pero sin __dict__ por instancia."""
+    __slots__ = ('name', 'category', 'price', 'quantity')
+
+    def __init__(self, name, category, price, quantity):
+        self.name = name
+        self.category = category
+        self.price = price
+        self.quantity = quantity
+
+    def __repr__(self):
+        return f"Item(name={self.name}, category={self.category}, price={self.price}, quantity={self.quantity})"
+
+def _with_spec(predicate: Callable[[Item], bool], spec: tuple) -> Callable[[Item], bool]:
+    """Anota la lambda con la descripción del filtro (tipo, atributo y valores) para poder combinarla y compilarla."""
+    predicate.spec = spec
+    return predicate
+
 def build_equals_filter(attribute: str, value: Any) -> Callable[[Item], bool]:
     """Genera una función lambda para filtrar objetos por igualdad de atributo."""
-    return lambda item: getattr(item, attribute) == value
+    return _with_spec(lambda item: getattr(item, attribute) == value, ('equals', attribute, value))
 
 def build_greater_than_filter(attribute: str, umbral: float) -> Callable[[Item], bool]:
     """Genera una función lambda para filtrar objetos con atributos mayores a un umbral."""
-    return lambda item: getattr(item, attribute) > umbral
+    return _with_spec(lambda item: getattr(item, attribute) > umbral, ('greater_than', attribute, umbral))
 
 def build_less_than_filter(attribute: str, umbral: float) -> Callable[[Item], bool]:
     """Genera una función lambda para filtrar objetos con atributos menores a un umbral."""
-    return lambda item: getattr(item, attribute) < umbral
+    return _with_spec(lambda item: getattr(item, attribute) < umbral, ('less_than', attribute, umbral))
 
 def build_range_filter(attribute: str, min_value: float, max_value: float) -> Callable[[Item], bool]:
     """Genera una función lambda para filtrar objetos dentro de un rango de valores."""
-    return lambda item: min_value <= getattr(item, attribute) <= max_value
+    return _with_spec(lambda item: min_value <= getattr(item, attribute) <= max_value,
+                      ('range', attribute, min_value, max_value))
 
 def build_contains_filter(attribute: str, substring: str) -> Callable[[Item], bool]:
     """Genera una función lambda para filtrar objetos que contienen un substring en un atributo."""
-    return lambda item: substring in getattr(item, attribute)
+    return _with_spec(lambda item: substring in getattr(item, attribute), ('contains', attribute, substring))
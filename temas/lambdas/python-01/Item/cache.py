@@ -0,0 +1,110 @@
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Set
+
+from Item.Item import Item
+from Item.indexed import IndexedCollection
+from Item.predicates import normalize, spec_of
+
+def canonical_key(spec: tuple) -> Optional[tuple]:
+    """Clave canónica de un filtro: el mismo filtro escrito de otra forma (otro orden en una conjunción,
+    anidado, con dobles negaciones o repetido) da la misma clave. None si no se puede cachear: filtros
+    opacos (lambdas sin descripción) o con valores no hashables."""
+    spec = normalize(spec)
+    kind = spec[0]
+    if kind in ('and', 'or'):
+        children = [canonical_key(child) for child in spec[1:]]
+        if any(child is None for child in children):
+            return None
+        children = sorted(set(children), key=repr)
+        return children[0] if len(children) == 1 else (kind, *children)
+    if kind == 'not':
+        inner = canonical_key(spec[1])
+        return None if inner is None else ('not', inner)
+    if kind == 'custom':
+        return None
+    try:
+        hash(spec)
+    except TypeError:
+        return None
+    return spec
+
+def attributes_of(spec: tuple) -> FrozenSet[str]:
+    """Atributos que consulta un filtro."""
+    kind = spec[0]
+    if kind in ('and', 'or'):
+        return frozenset().union(*map(attributes_of, spec[1:]))
+    if kind == 'not':
+        return attributes_of(spec[1])
+    return frozenset((spec[1],))
+
+class FilterCache:
+    """Caché LRU de resultados de filtros sobre una IndexedCollection.
+
+    La clave es la descripción canónica del filtro (tipo, atributo y valores). Se limita el número
+    de entradas y el total de Items guardados. Al añadir o borrar Items de la colección se vacía,
+    y al cambiar atributos con update() sólo se descartan los filtros que usan esos atributos."""
+
+    def __init__(self, collection: IndexedCollection, max_entries: int = 256, max_items: int = 1_000_000):
+        self.collection = collection
+        self.max_entries = max_entries
+        self.max_items = max_items
+        self._entries: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._attributes: Dict[tuple, FrozenSet[str]] = {}
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        collection.subscribe(self._invalidate)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def query(self, predicate: Any) -> List[Item]:
+        """Como IndexedCollection.query, devolviendo el resultado guardado si el filtro ya se ha aplicado."""
+        key = canonical_key(spec_of(predicate))
+        results = self._entries.get(key) if key is not None else None
+        if results is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return list(results)
+        self.misses += 1
+        found = self.collection.query(predicate)
+        if key is not None and len(found) <= self.max_items:
+            self._store(key, tuple(found))
+        return found
+
+    def _store(self, key: tuple, results: tuple) -> None:
+        self._entries[key] = results
+        self._attributes[key] = attributes_of(key)
+        self._size += len(results)
+        while len(self._entries) > self.max_entries or self._size > self.max_items:
+            oldest, evicted = self._entries.popitem(last=False)
+            del self._attributes[oldest]
+            self._size -= len(evicted)
+            self.evictions += 1
+
+    def _drop(self, key: tuple) -> None:
+        self._size -= len(self._entries.pop(key))
+        del self._attributes[key]
+        self.invalidations += 1
+
+    def _invalidate(self, attributes: Optional[Set[str]]) -> None:
+        if attributes is None:
+            self.invalidations += len(self._entries)
+            self.clear()
+            return
+        for key in [key for key, used in self._attributes.items() if not used.isdisjoint(attributes)]:
+            self._drop(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._attributes.clear()
+        self._size = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Contadores de aciertos, fallos, expulsiones por LRU e invalidaciones."""
+        total = self.hits + self.misses
+        return {'entries': len(self._entries), 'items': self._size, 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'invalidations': self.invalidations,
+                'hit_ratio': self.hits / total if total else 0.0}
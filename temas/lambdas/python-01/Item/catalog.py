@@ -0,0 +1,196 @@
+from typing import Any, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from Item.Item import Item
+from Item.predicates import COSTS, normalize, spec_of
+
+ATTRIBUTES = ('name', 'category', 'price', 'quantity')
+
+def _column(values: list) -> np.ndarray:
+    """Convierte una lista de valores en columna de NumPy. Sólo se usa un tipo nativo ('U', int64,
+    float64) si representa todos los valores exactamente; si no, la columna es de objetos de Python."""
+    types = set(map(type, values))
+    if not types:
+        return np.array(values, dtype=object)
+    if types <= {str}:
+        return np.array(values, dtype=str)
+    if types <= {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    elif types <= {float}:
+        return np.array(values, dtype=np.float64)
+    return np.array(values, dtype=object)
+
+def _python(value: Any) -> Any:
+    """Escalar de NumPy a su tipo de Python (los de columnas de objetos ya lo son)."""
+    return value.item() if isinstance(value, np.generic) else value
+
+class ItemCatalog:
+    """Inventario de Items guardado por columnas: name, price y quantity como arrays de NumPy y
+    category como códigos enteros sobre la lista de categorías distintas."""
+
+    def __init__(self, items: Iterable[Item] = ()):
+        names, categories, prices, quantities = [], [], [], []
+        for item in items:
+            names.append(item.name)
+            categories.append(item.category)
+            prices.append(item.price)
+            quantities.append(item.quantity)
+        self.categories: List[Any] = []
+        self._category_codes = {}
+        codes = np.fromiter((self._code(category) for category in categories), dtype=np.int32, count=len(categories))
+        self.columns = {'name': _column(names), 'category': codes, 'price': _column(prices), 'quantity': _column(quantities)}
+
+    def _code(self, category: Any) -> int:
+        code = self._category_codes.get(category)
+        if code is None:
+            code = self._category_codes[category] = len(self.categories)
+            self.categories.append(category)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.columns['category'])
+
+    def item(self, index: int) -> Item:
+        """Construye el Item de la fila indicada."""
+        return Item(_python(self.columns['name'][index]), self.categories[self.columns['category'][index]],
+                    _python(self.columns['price'][index]), _python(self.columns['quantity'][index]))
+
+    def __iter__(self) -> Iterator[Item]:
+        return iter(CatalogView(self, np.arange(len(self))))
+
+    def column(self, attribute: str) -> np.ndarray:
+        """Columna de un atributo; la de category se devuelve con los valores, no con los códigos."""
+        if attribute == 'category':
+            return np.array(self.categories, dtype=object)[self.columns['category']]
+        return self.columns[attribute]
+
+    def mask(self, predicate: Any) -> np.ndarray:
+        """Máscara booleana de las filas que cumplen el filtro (lambda de los build_*, combinación o spec)."""
+        spec = normalize(predicate if isinstance(predicate, tuple) else spec_of(predicate))
+        return self._mask(spec)
+
+    def _mask(self, spec: tuple, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Máscara sobre las filas 'rows' (todas si es None), con una posición por fila evaluada."""
+        kind = spec[0]
+        if kind == 'and':
+            # Primero los filtros baratos; los caros sólo se evalúan sobre las filas que siguen vivas
+            children = sorted(spec[1:], key=lambda child: COSTS.get(child[0], COSTS['contains']))
+            result = self._mask(children[0], rows)
+            for child in children[1:]:
+                alive = np.flatnonzero(result)
+                if len(alive) < len(result) // 2:
+                    result[alive] = self._mask(child, alive if rows is None else rows[alive])
+                else:
+                    result &= self._mask(child, rows)
+            return result
+        if kind == 'or':
+            result = self._mask(spec[1], rows)
+            for child in spec[2:]:
+                result |= self._mask(child, rows)
+            return result
+        if kind == 'not':
+            return ~self._mask(spec[1], rows)
+        selected = rows if rows is not None else np.arange(len(self))
+        if kind == 'custom':
+            # Filtro opaco: no se puede vectorizar, se evalúa Item a Item
+            return np.fromiter(map(spec[1], CatalogView(self, selected)), dtype=bool, count=len(selected))
+        if kind not in ('equals', 'greater_than', 'less_than', 'range', 'contains'):
+            raise ValueError(f"Tipo de filtro desconocido: {kind}")
+        attribute = spec[1]
+        if attribute not in ATTRIBUTES:
+            raise AttributeError(f"'Item' object has no attribute '{attribute}'")
+        column = self.columns[attribute] if rows is None else self.columns[attribute][rows]
+        if attribute == 'category':
+            # Se evalúa una vez por categoría distinta y se expande con los códigos
+            matches = np.fromiter((_evaluate(spec, category) for category in self.categories),
+                                  dtype=bool, count=len(self.categories))
+            return matches[column] if len(self.categories) else np.zeros(len(column), dtype=bool)
+        return _vectorized(spec, column)
+
+    def filter(self, predicate: Any) -> 'CatalogView':
+        """Filas que cumplen el filtro, como vista perezosa sobre el catálogo."""
+        return CatalogView(self, np.flatnonzero(self.mask(predicate)))
+
+    def count(self, predicate: Any) -> int:
+        return int(np.count_nonzero(self.mask(predicate)))
+
+def _evaluate(spec: tuple, value: Any) -> bool:
+    """Aplica un filtro simple a un valor suelto con la misma semántica que las lambdas de Item.py."""
+    kind = spec[0]
+    if kind == 'equals':
+        return value == spec[2]
+    if kind == 'greater_than':
+        return value > spec[2]
+    if kind == 'less_than':
+        return value < spec[2]
+    if kind == 'range':
+        return spec[2] <= value <= spec[3]
+    return spec[2] in value
+
+# Por encima de 2**53 no todos los enteros tienen representación exacta en float64
+_EXACT_FLOAT_LIMIT = 2 ** 53
+
+def _loses_precision(spec: tuple, column: np.ndarray) -> bool:
+    """True si comparar con NumPy daría otro resultado que en Python: con un umbral float, NumPy pasa la
+    columna int64 a float64 y redondea los valores mayores que 2**53 en valor absoluto, mientras que
+    Python compara int y float de forma exacta."""
+    if column.dtype.kind != 'i' or not len(column) or not any(isinstance(value, float) for value in spec[2:]):
+        return False
+    return int(column.max()) > _EXACT_FLOAT_LIMIT or int(column.min()) < -_EXACT_FLOAT_LIMIT
+
+def _vectorized(spec: tuple, column: np.ndarray) -> np.ndarray:
+    """Aplica un filtro simple a una columna entera con la misma semántica que _evaluate."""
+    kind = spec[0]
+    if kind != 'contains' and _loses_precision(spec, column):
+        return np.fromiter((_evaluate(spec, value) for value in column.tolist()), dtype=bool, count=len(column))
+    if kind == 'equals':
+        return np.asarray(column == spec[2], dtype=bool)
+    if kind == 'greater_than':
+        return column > spec[2]
+    if kind == 'less_than':
+        return column < spec[2]
+    if kind == 'range':
+        return (spec[2] <= column) & (column <= spec[3])
+    if column.dtype.kind == 'U':
+        if not isinstance(spec[2], str):
+            raise TypeError(f"'in <string>' requires string as left operand, not {type(spec[2]).__name__}")
+        return np.char.find(column, spec[2]) >= 0
+    return np.fromiter((spec[2] in value for value in column), dtype=bool, count=len(column))
+
+class CatalogView:
+    """Selección de filas de un catálogo. Los Items se construyen sólo al acceder a ellos."""
+
+    def __init__(self, catalog: ItemCatalog, indices: np.ndarray):
+        self.catalog = catalog
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, position: int) -> Item:
+        return self.catalog.item(self.indices[position])
+
+    def __iter__(self) -> Iterator[Item]:
+        catalog = self.catalog
+        names = catalog.columns['name'][self.indices].tolist()
+        codes = catalog.columns['category'][self.indices].tolist()
+        prices = catalog.columns['price'][self.indices].tolist()
+        quantities = catalog.columns['quantity'][self.indices].tolist()
+        categories = catalog.categories
+        for name, code, price, quantity in zip(names, codes, prices, quantities):
+            yield Item(name, categories[code], price, quantity)
+
+    def column(self, attribute: str) -> np.ndarray:
+        """Valores de un atributo en las filas seleccionadas, sin construir Items."""
+        return self.catalog.column(attribute)[self.indices]
+
+    def filter(self, predicate: Any) -> 'CatalogView':
+        """Refina la selección con otro filtro."""
+        return CatalogView(self.catalog, self.indices[self.catalog.mask(predicate)[self.indices]])
+
+    def to_items(self) -> List[Item]:
+        return list(self)
@@ -0,0 +1,255 @@
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from Item.Item import Item
+from Item.predicates import compile_filter, normalize, spec_of
+from Item.trigram import TrigramIndex
+
+LEAVES = ('equals', 'greater_than', 'less_than', 'range')
+# Filtros simples que los índices resuelven de forma exacta, sin verificar los candidatos
+EXACT = LEAVES + ('contains',)
+
+class HashIndex:
+    """Índice hash de un atributo: para cada valor, su fila o (si hay varias) el conjunto de filas.
+    Guardar la fila suelta evita un conjunto por valor en atributos casi únicos como name."""
+
+    def __init__(self):
+        self.buckets: Dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.buckets)
+
+    def add(self, value: Any, row: int) -> None:
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            self.buckets[value] = row
+        elif type(bucket) is int:
+            self.buckets[value] = {bucket, row}
+        else:
+            bucket.add(row)
+
+    def remove(self, value: Any, row: int) -> None:
+        bucket = self.buckets[value]
+        if type(bucket) is int:
+            del self.buckets[value]
+            return
+        bucket.discard(row)
+        if len(bucket) == 1:
+            self.buckets[value] = bucket.pop()
+
+    def rows(self, value: Any) -> Collection[int]:
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            return ()
+        return (bucket,) if type(bucket) is int else bucket
+
+class SortedIndex:
+    """Índice ordenado de un atributo: valores ordenados y, en paralelo, las filas que los tienen."""
+
+    def __init__(self, values: List[Any] = (), rows: List[int] = ()):
+        # Ordenación estable de las posiciones: a igual valor, las filas conservan su orden
+        order = sorted(range(len(values)), key=values.__getitem__)
+        self.keys = [values[i] for i in order]
+        self.rows = [rows[i] for i in order]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, value: Any, row: int) -> None:
+        # Las filas crecen con cada inserción, así que la nueva va tras las de igual valor
+        position = bisect_right(self.keys, value)
+        self.keys.insert(position, value)
+        self.rows.insert(position, row)
+
+    def remove(self, value: Any, row: int) -> None:
+        start, end = bisect_left(self.keys, value), bisect_right(self.keys, value)
+        position = start + self.rows[start:end].index(row)
+        del self.keys[position]
+        del self.rows[position]
+
+    def bounds(self, spec: tuple) -> Tuple[int, int]:
+        """Posiciones [inicio, fin) de las entradas que cumplen un filtro equals/greater_than/less_than/range."""
+        kind = spec[0]
+        if kind == 'equals':
+            return bisect_left(self.keys, spec[2]), bisect_right(self.keys, spec[2])
+        if kind == 'greater_than':
+            return bisect_right(self.keys, spec[2]), len(self.keys)
+        if kind == 'less_than':
+            return 0, bisect_left(self.keys, spec[2])
+        return bisect_left(self.keys, spec[2]), bisect_right(self.keys, spec[3])
+
+class IndexedCollection:
+    """Colección de Items con índices secundarios que se mantienen al insertar, borrar o modificar:
+    índices hash para los atributos de igualdad, ordenados para los numéricos y de trigramas para
+    las búsquedas de subcadenas en los de texto. query() aplica un
+    filtro de los build_* usando el índice más selectivo y verifica el resto sólo sobre los candidatos."""
+
+    def __init__(self, items: Iterable[Item] = (), hash_attributes: Iterable[str] = ('name', 'category'),
+                 sorted_attributes: Iterable[str] = ('price', 'quantity'), text_attributes: Iterable[str] = ('name',)):
+        self._items: Dict[int, Item] = {}
+        self._row_of: Dict[int, int] = {}
+        self._next_row = 0
+        self.hash_indexes: Dict[str, HashIndex] = {attribute: HashIndex() for attribute in hash_attributes}
+        self.sorted_indexes: Dict[str, SortedIndex] = {attribute: SortedIndex() for attribute in sorted_attributes}
+        self.text_indexes: Dict[str, TrigramIndex] = {attribute: TrigramIndex() for attribute in text_attributes}
+        self._subscribers: List[Callable[[Optional[Set[str]]], None]] = []
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Item]:
+        return iter(list(self._items.values()))
+
+    def __contains__(self, item: Item) -> bool:
+        return id(item) in self._row_of
+
+    def subscribe(self, callback: Callable[[Optional[Set[str]]], None]) -> None:
+        """Registra una función a la que se avisa de cada cambio: con los atributos modificados por
+        update(), o con None si se han añadido o borrado Items."""
+        self._subscribers.append(callback)
+
+    def _notify(self, attributes: Optional[Set[str]]) -> None:
+        for callback in self._subscribers:
+            callback(attributes)
+
+    def add(self, item: Item) -> None:
+        self._notify(None)
+        row = self._store(item)
+        for attribute, index in self.hash_indexes.items():
+            index.add(getattr(item, attribute), row)
+        for attribute, index in self.sorted_indexes.items():
+            index.add(getattr(item, attribute), row)
+        for attribute, index in self.text_indexes.items():
+            index.add(row, getattr(item, attribute))
+
+    def extend(self, items: Iterable[Item]) -> None:
+        items = list(items)
+        if not items:
+            return
+        if len(items) < len(self) // 8 + 16:
+            for item in items:
+                self.add(item)
+            return
+        # Carga masiva: se asignan las filas de una vez y se reconstruyen los índices ordenados
+        # en lugar de insertar uno a uno
+        ids = list(map(id, items))
+        if len(set(ids)) < len(ids) or not self._row_of.keys().isdisjoint(ids):
+            raise ValueError("Hay Items repetidos o que ya están en la colección")
+        self._notify(None)
+        rows = range(self._next_row, self._next_row + len(items))
+        self._next_row += len(items)
+        self._items.update(zip(rows, items))
+        self._row_of.update(zip(ids, rows))
+        for attribute, index in self.hash_indexes.items():
+            add = index.add
+            for row, value in zip(rows, map(attrgetter(attribute), items)):
+                add(value, row)
+        for attribute, index in self.text_indexes.items():
+            index.extend(rows, map(attrgetter(attribute), items))
+        for attribute in self.sorted_indexes:
+            self.sorted_indexes[attribute] = SortedIndex(list(map(attrgetter(attribute), self._items.values())),
+                                                         list(self._items))
+
+    def _store(self, item: Item) -> int:
+        if id(item) in self._row_of:
+            raise ValueError(f"{item!r} ya está en la colección")
+        row = self._next_row
+        self._next_row += 1
+        self._items[row] = item
+        self._row_of[id(item)] = row
+        return row
+
+    def remove(self, item: Item) -> None:
+        row = self._row_of.pop(id(item), None)
+        if row is None:
+            raise KeyError(item)
+        self._notify(None)
+        del self._items[row]
+        for attribute, index in self.hash_indexes.items():
+            index.remove(getattr(item, attribute), row)
+        for attribute, index in self.sorted_indexes.items():
+            index.remove(getattr(item, attribute), row)
+        for index in self.text_indexes.values():
+            index.remove(row)
+
+    def update(self, item: Item, **changes: Any) -> None:
+        """Modifica atributos de un Item de la colección manteniendo los índices al día."""
+        row = self._row_of.get(id(item))
+        if row is None:
+            raise KeyError(item)
+        self._notify(set(changes))
+        for attribute, value in changes.items():
+            old = getattr(item, attribute)
+            if attribute in self.hash_indexes:
+                self.hash_indexes[attribute].remove(old, row)
+                self.hash_indexes[attribute].add(value, row)
+            if attribute in self.sorted_indexes:
+                self.sorted_indexes[attribute].remove(old, row)
+                self.sorted_indexes[attribute].add(value, row)
+            if attribute in self.text_indexes:
+                self.text_indexes[attribute].update(row, value)
+            setattr(item, attribute, value)
+
+    def _candidates(self, spec: tuple) -> Optional[Tuple[int, str, Callable[[], Iterable[int]]]]:
+        """Filas candidatas para un filtro usando un índice: (número estimado, índice usado, generador de filas),
+        o None si ningún índice sirve y hay que recorrer toda la colección."""
+        kind = spec[0]
+        if kind in LEAVES:
+            attribute = spec[1]
+            if kind == 'equals' and attribute in self.hash_indexes:
+                try:
+                    rows = self.hash_indexes[attribute].rows(spec[2])
+                except TypeError:
+                    return None
+                return len(rows), f"hash({attribute})", lambda: rows
+            if attribute in self.sorted_indexes:
+                index = self.sorted_indexes[attribute]
+                try:
+                    start, end = index.bounds(spec)
+                except TypeError:
+                    # Valor no comparable con los del índice (p. ej. equals con una cadena): se recorre todo
+                    return None
+                return max(end - start, 0), f"sorted({attribute})", lambda: index.rows[start:end]
+            return None
+        if kind == 'contains' and spec[1] in self.text_indexes:
+            rows = self.text_indexes[spec[1]].search(spec[2])
+            if rows is None:
+                return None
+            return len(rows), f"trigram({spec[1]})", lambda: rows
+        if kind == 'and':
+            # Basta con el índice más selectivo: el resto de la conjunción se verifica sobre sus candidatos
+            options = [option for option in map(self._candidates, spec[1:]) if option is not None]
+            return min(options, key=lambda option: option[0]) if options else None
+        if kind == 'or':
+            options = list(map(self._candidates, spec[1:]))
+            if any(option is None for option in options):
+                return None
+            return (sum(option[0] for option in options), ' | '.join(option[1] for option in options),
+                    lambda: set().union(*(option[2]() for option in options)))
+        return None
+
+    def _plan(self, spec: tuple) -> Optional[Tuple[int, str, Callable[[], Iterable[int]]]]:
+        plan = self._candidates(spec)
+        # Si el índice deja pasar buena parte de la colección, recorrerla entera es más barato
+        if plan is None or plan[0] > len(self) // 4:
+            return None
+        return plan
+
+    def explain(self, predicate: Any) -> str:
+        """Describe el plan que usaría query(): los índices elegidos o 'scan' si recorre toda la colección."""
+        plan = self._plan(normalize(spec_of(predicate)))
+        return 'scan' if plan is None else plan[1]
+
+    def query(self, predicate: Any) -> List[Item]:
+        """Items que cumplen el filtro, en orden de inserción (igual que filter() sobre una lista)."""
+        spec = normalize(spec_of(predicate))
+        plan = self._plan(spec)
+        if plan is None:
+            return compile_filter(predicate).select(self._items.values())
+        candidates = [self._items[row] for row in sorted(plan[2]())]
+        # Un filtro simple (o una disyunción de filtros simples) resuelto con índices no necesita verificación
+        if spec[0] in EXACT or (spec[0] == 'or' and all(child[0] in EXACT for child in spec[1:])):
+            return candidates
+        return compile_filter(predicate).select(candidates)
@@ -0,0 +1,105 @@
+import csv
+import json
+from contextlib import contextmanager
+from typing import Any, Callable, IO, Iterable, Iterator, List, Optional, Union
+
+from Item.Item import CompactItem
+
+FIELDS = ('name', 'category', 'price', 'quantity')
+_POSITIONS = {field: position for position, field in enumerate(FIELDS)}
+_MISSING = object()
+
+Source = Union[str, IO[str]]
+
+@contextmanager
+def _open(source: Source, mode: str = 'r', newline: Optional[str] = None) -> Iterator[IO[str]]:
+    """Acepta una ruta o un fichero ya abierto (que no se cierra al terminar)."""
+    if isinstance(source, str):
+        with open(source, mode, encoding='utf-8', newline=newline) as handle:
+            yield handle
+    else:
+        yield source
+
+def parse_number(text: str) -> Union[int, float]:
+    """Convierte el texto a int si es entero y a float en otro caso."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+def iter_csv(source: Source, item_class: Callable[..., Any] = CompactItem, delimiter: str = ',') -> Iterator[Any]:
+    """Genera los Items de un CSV con cabecera name,category,price,quantity (en cualquier orden).
+
+    Se lee fila a fila con csv.reader: cada fila es una lista y las columnas se toman por posición,
+    sin crear un dict por fila como csv.DictReader. Las categorías repetidas comparten la misma cadena."""
+    categories = {}
+    with _open(source, newline='') as handle:
+        rows = csv.reader(handle, delimiter=delimiter)
+        header = [column.strip() for column in next(rows, [])]
+        if not header:
+            return
+        missing = [field for field in FIELDS if field not in header]
+        if missing:
+            raise ValueError(f"Faltan columnas en el CSV: {', '.join(missing)}")
+        name, category, price, quantity = (header.index(field) for field in FIELDS)
+        width = max(name, category, price, quantity) + 1
+        for line, row in enumerate(rows, start=2):
+            if not row:
+                continue
+            if len(row) < width:
+                raise ValueError(f"Fila incompleta en la línea {line}: {row!r}")
+            try:
+                yield item_class(row[name], categories.setdefault(row[category], row[category]),
+                                 parse_number(row[price]), parse_number(row[quantity]))
+            except ValueError as error:
+                raise ValueError(f"Valor no válido en la línea {line}: {error}") from None
+
+def iter_jsonl(source: Source, item_class: Callable[..., Any] = CompactItem) -> Iterator[Any]:
+    """Genera los Items de un fichero JSON Lines con un objeto por línea.
+
+    El decodificador entrega la lista de pares clave-valor (object_pairs_hook) y los valores se
+    colocan por posición, sin construir un dict por línea; los campos que no son de Item se ignoran.
+    Como en iter_csv, las categorías repetidas comparten la misma cadena."""
+    categories = {}
+    decode = json.JSONDecoder(object_pairs_hook=lambda pairs: pairs).decode
+    with _open(source) as handle:
+        for line, text in enumerate(handle, start=1):
+            if not text.strip():
+                continue
+            pairs = decode(text)
+            if not isinstance(pairs, list) or (pairs and not isinstance(pairs[0], tuple)):
+                raise ValueError(f"Se esperaba un objeto JSON en la línea {line}")
+            values = [_MISSING] * len(FIELDS)
+            for key, value in pairs:
+                position = _POSITIONS.get(key)
+                if position is not None:
+                    values[position] = value
+            if _MISSING in values:
+                missing = [field for field, value in zip(FIELDS, values) if value is _MISSING]
+                raise ValueError(f"Faltan campos en la línea {line}: {', '.join(missing)}")
+            category = values[1]
+            if isinstance(category, str):
+                values[1] = categories.setdefault(category, category)
+            yield item_class(*values)
+
+def load_csv(source: Source, item_class: Callable[..., Any] = CompactItem, delimiter: str = ',') -> List[Any]:
+    """Carga todos los Items de un CSV en una lista."""
+    return list(iter_csv(source, item_class, delimiter))
+
+def load_jsonl(source: Source, item_class: Callable[..., Any] = CompactItem) -> List[Any]:
+    """Carga todos los Items de un fichero JSON Lines en una lista."""
+    return list(iter_jsonl(source, item_class))
+
+def write_csv(items: Iterable[Any], target: Source, delimiter: str = ',') -> None:
+    """Escribe Items (o CompactItems) en CSV con cabecera, en el formato que lee iter_csv."""
+    with _open(target, 'w', newline='') as handle:
+        writer = csv.writer(handle, delimiter=delimiter)
+        writer.writerow(FIELDS)
+        writer.writerows((item.name, item.category, item.price, item.quantity) for item in items)
+
+def write_jsonl(items: Iterable[Any], target: Source) -> None:
+    """Escribe Items (o CompactItems) en JSON Lines, un objeto por línea."""
+    with _open(target, 'w') as handle:
+        for item in items:
+            handle.write(json.dumps({'name': item.name, 'category': item.category,
+                                     'price': item.price, 'quantity': item.quantity}) + '\n')
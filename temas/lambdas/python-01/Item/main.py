@@ -1,4 +1,5 @@
 from Item import Item, build_equals_filter, build_greater_than_filter, build_less_than_filter, build_range_filter, build_contains_filter
+from predicates import all_of, any_of, negate
 
 # Ejemplo de uso
 items = [
@@ -22,3 +23,8 @@ print("Expensive:", list(filter(expensive_filter, items)))
 print("Cheap:", list(filter(cheap_filter, items)))
 print("Price Range (5 to 50):", list(filter(range_filter, items)))
 print("Name contains 'a':", list(filter(name_contains_filter, items)))
+
+# Filtros combinados y compilados en una sola lambda
+print("Cheap electronics:", list(filter(all_of(electronics_filter, build_less_than_filter("price", 50)), items)))
+print("Expensive or cheap:", list(filter(any_of(expensive_filter, cheap_filter), items)))
+print("Not electronics:", list(filter(negate(electronics_filter), items)))
@@ -0,0 +1,135 @@
+import keyword
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, Optional
+
+# Coste relativo de evaluar cada tipo de filtro y fracción de elementos que se estima que lo cumplen
+COSTS = {'equals': 1.0, 'greater_than': 1.0, 'less_than': 1.0, 'range': 1.2, 'contains': 2.0, 'custom': 4.0}
+SELECTIVITY = {'equals': 0.1, 'greater_than': 0.5, 'less_than': 0.5, 'range': 0.25, 'contains': 0.3, 'custom': 0.5}
+
+def spec_of(predicate: Callable[[Any], bool]) -> tuple:
+    """Devuelve la descripción de un filtro; una lambda cualquiera se trata como filtro opaco."""
+    return getattr(predicate, 'spec', None) or ('custom', predicate)
+
+def normalize(spec: tuple) -> tuple:
+    """Aplana conjunciones y disyunciones anidadas y elimina las dobles negaciones."""
+    kind = spec[0]
+    if kind == 'not':
+        inner = normalize(spec[1])
+        return inner[1] if inner[0] == 'not' else ('not', inner)
+    if kind in ('and', 'or'):
+        children = []
+        for child in map(normalize, spec[1:]):
+            children.extend(child[1:] if child[0] == kind else (child,))
+        return children[0] if len(children) == 1 else (kind, *children)
+    return spec
+
+def _leaf_selectivity(spec: tuple, sample: Optional[list]) -> float:
+    """Selectividad de un filtro simple: medida sobre la muestra si la hay (suavizada) o la estimada por tipo."""
+    if not sample:
+        return SELECTIVITY[spec[0]]
+    predicate = _build(spec, {})
+    return (sum(1 for item in sample if predicate(item)) + 1) / (len(sample) + 2)
+
+def _plan(spec: tuple, sample: Optional[list]) -> tuple:
+    """Reordena el árbol para cortocircuitar cuanto antes; devuelve (spec, coste, selectividad)."""
+    kind = spec[0]
+    if kind == 'not':
+        inner, cost, selectivity = _plan(spec[1], sample)
+        return ('not', inner), cost, 1 - selectivity
+    if kind in ('and', 'or'):
+        planned = [_plan(child, sample) for child in spec[1:]]
+        if kind == 'and':
+            # Primero los filtros que descartan más elementos por unidad de coste
+            planned.sort(key=lambda p: p[1] / max(1 - p[2], 1e-9))
+        else:
+            # En una disyunción, primero los que aceptan más elementos por unidad de coste
+            planned.sort(key=lambda p: p[1] / max(p[2], 1e-9))
+        cost, reach, selectivity = 0.0, 1.0, 1.0 if kind == 'and' else 0.0
+        for _, child_cost, child_selectivity in planned:
+            cost += reach * child_cost
+            if kind == 'and':
+                reach *= child_selectivity
+                selectivity *= child_selectivity
+            else:
+                reach *= 1 - child_selectivity
+                selectivity = 1 - (1 - selectivity) * (1 - child_selectivity)
+        return (kind, *(p[0] for p in planned)), cost, selectivity
+    return spec, COSTS[kind], _leaf_selectivity(spec, sample)
+
+def _bind(value: Any, namespace: dict) -> str:
+    """Guarda un valor en el espacio de nombres del código generado y devuelve su nombre."""
+    name = f"_v{len(namespace)}"
+    namespace[name] = value
+    return name
+
+def _access(attribute: str, namespace: dict) -> str:
+    """Acceso directo item.atributo si es un identificador; si no (p. ej. 'a.b'), con attrgetter creado una sola vez."""
+    if attribute.isidentifier() and not keyword.iskeyword(attribute):
+        return f"item.{attribute}"
+    return f"{_bind(attrgetter(attribute), namespace)}(item)"
+
+def _source(spec: tuple, namespace: dict) -> str:
+    """Traduce la descripción a una expresión de Python sobre la variable item."""
+    kind = spec[0]
+    if kind == 'and':
+        return '(' + ' and '.join(_source(child, namespace) for child in spec[1:]) + ')'
+    if kind == 'or':
+        return '(' + ' or '.join(_source(child, namespace) for child in spec[1:]) + ')'
+    if kind == 'not':
+        return f"(not {_source(spec[1], namespace)})"
+    if kind == 'custom':
+        return f"{_bind(spec[1], namespace)}(item)"
+    value = _access(spec[1], namespace)
+    if kind == 'equals':
+        return f"({value} == {_bind(spec[2], namespace)})"
+    if kind == 'greater_than':
+        return f"({value} > {_bind(spec[2], namespace)})"
+    if kind == 'less_than':
+        return f"({value} < {_bind(spec[2], namespace)})"
+    if kind == 'range':
+        return f"({_bind(spec[2], namespace)} <= {value} <= {_bind(spec[3], namespace)})"
+    if kind == 'contains':
+        return f"({_bind(spec[2], namespace)} in {value})"
+    raise ValueError(f"Tipo de filtro desconocido: {kind}")
+
+def _build(spec: tuple, namespace: dict) -> Callable[[Any], bool]:
+    return eval(f"lambda item: {_source(spec, namespace)}", namespace)
+
+def _compile(spec: tuple, sample: Optional[list]) -> Callable[[Any], bool]:
+    spec, _, _ = _plan(normalize(spec), sample)
+    namespace = {}
+    expression = _source(spec, namespace)
+    compiled = eval(f"lambda item: {expression}", namespace)
+    # Variante por lotes: el bucle entero en una comprensión de listas, sin una llamada por elemento
+    compiled.select = eval(f"lambda items: [item for item in items if {expression}]", namespace)
+    compiled.spec = spec
+    return compiled
+
+def compile_filter(predicate: Callable[[Any], bool], sample: Optional[list] = None) -> Callable[[Any], bool]:
+    """Compila un filtro (simple o combinado) en una única lambda optimizada.
+
+    Con una muestra de elementos, el orden de evaluación se decide con la selectividad medida."""
+    return _compile(spec_of(predicate), sample)
+
+def _combine(kind: str, predicates: Iterable[Callable[[Any], bool]]) -> tuple:
+    specs = tuple(map(spec_of, predicates))
+    if not specs:
+        raise ValueError("Se necesita al menos un filtro")
+    return (kind, *specs)
+
+def all_of(*predicates: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Filtro que se cumple si se cumplen todos los filtros dados (AND)."""
+    return _compile(_combine('and', predicates), None)
+
+def any_of(*predicates: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Filtro que se cumple si se cumple alguno de los filtros dados (OR)."""
+    return _compile(_combine('or', predicates), None)
+
+def negate(predicate: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Filtro que se cumple si no se cumple el filtro dado (NOT)."""
+    return _compile(('not', spec_of(predicate)), None)
+
+def filter_items(items: Iterable[Any], *predicates: Callable[[Any], bool]) -> List[Any]:
+    """Aplica a la vez todos los filtros en una sola pasada (equivale a encadenar filter())."""
+    items = items if isinstance(items, list) else list(items)
+    return _compile(_combine('and', predicates), items[:256]).select(items)
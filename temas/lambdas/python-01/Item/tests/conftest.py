@@ -0,0 +1,29 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import random
+
+from Item.Item import Item
+import pytest
+
+NAMES = ["Laptop", "Mouse", "Banana", "Shampoo", "Apple", "Keyboard", "Cable", "Monitor"]
+CATEGORIES = ["Electronics", "Groceries", "Personal Care", "Toys"]
+
+@pytest.fixture
+def items():
+    return [
+        Item("Laptop", "Electronics", 1200, 5),
+        Item("Mouse", "Electronics", 25, 100),
+        Item("Banana", "Groceries", 1, 200),
+        Item("Shampoo", "Personal Care", 7, 50),
+        Item("Apple", "Groceries", 2, 300),
+        Item("Keyboard", "Electronics", 80, 30),
+    ]
+
+def random_items(n, rnd=0, float_prices=False):
+    """n Items aleatorios; rnd es una semilla o un random.Random ya creado (para seguir su secuencia)."""
+    rnd = rnd if isinstance(rnd, random.Random) else random.Random(rnd)
+    return [Item(rnd.choice(NAMES) + str(rnd.randint(0, 99)), rnd.choice(CATEGORIES),
+                 round(rnd.uniform(0, 2000), 2) if float_prices else rnd.randint(0, 2000), rnd.randint(0, 500))
+            for _ in range(n)]
@@ -0,0 +1,111 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import random
+
+from Item.Item import Item, build_equals_filter, build_greater_than_filter, build_less_than_filter, build_range_filter, build_contains_filter
+from Item.cache import FilterCache, canonical_key
+from Item.indexed import IndexedCollection
+from Item.predicates import all_of, any_of, negate
+import pytest
+
+def names(items):
+    return [item.name for item in items]
+
+def test_hits_and_misses(items):
+    cache = FilterCache(IndexedCollection(items))
+    electronics = build_equals_filter("category", "Electronics")
+    assert names(cache.query(electronics)) == ["Laptop", "Mouse", "Keyboard"]
+    assert names(cache.query(build_equals_filter("category", "Electronics"))) == ["Laptop", "Mouse", "Keyboard"]
+    assert (cache.hits, cache.misses) == (1, 1)
+    # Modificar la lista devuelta no altera lo guardado
+    cache.query(electronics).clear()
+    assert len(cache.query(electronics)) == 3
+
+def test_canonical_key_ignores_order_nesting_and_duplicates():
+    a = build_equals_filter("category", "Toys")
+    b = build_greater_than_filter("price", 10)
+    c = build_contains_filter("name", "o")
+    assert canonical_key(all_of(a, b, c).spec) == canonical_key(all_of(c, all_of(b, a)).spec)
+    assert canonical_key(all_of(a, a).spec) == canonical_key(a.spec)
+    assert canonical_key(negate(negate(b)).spec) == canonical_key(b.spec)
+    assert canonical_key(all_of(a, b).spec) != canonical_key(any_of(a, b).spec)
+    assert canonical_key(all_of(a, lambda item: True).spec) is None
+    assert canonical_key(build_equals_filter("category", ["Toys"]).spec) is None
+
+def test_uncacheable_filters_still_work(items):
+    cache = FilterCache(IndexedCollection(items))
+    odd = lambda item: item.quantity % 2 == 1
+    assert names(cache.query(odd)) == ["Laptop"]
+    assert names(cache.query(odd)) == ["Laptop"]
+    assert cache.hits == 0 and len(cache) == 0
+
+def test_lru_eviction_and_size_limits(items):
+    cache = FilterCache(IndexedCollection(items), max_entries=2, max_items=4)
+    electronics = build_equals_filter("category", "Electronics")
+    groceries = build_equals_filter("category", "Groceries")
+    cheap = build_less_than_filter("price", 10)
+    cache.query(electronics)
+    cache.query(groceries)
+    cache.query(electronics)
+    # Por el límite de Items (3 + 2 > 4) ya se había expulsado groceries; ahora entra cheap
+    cache.query(cheap)
+    assert cache.stats()["entries"] <= 2 and cache.stats()["items"] <= 4
+    assert cache.evictions >= 1
+    # Un resultado mayor que max_items no se guarda
+    cache.query(build_greater_than_filter("price", 0))
+    assert len(cache.query(build_greater_than_filter("price", 0))) == 6
+    assert cache.stats()["items"] <= 4
+
+def test_invalidation_on_add_remove_and_update(items):
+    collection = IndexedCollection(items)
+    cache = FilterCache(collection)
+    electronics = build_equals_filter("category", "Electronics")
+    cheap = build_range_filter("price", 5, 50)
+    assert len(cache.query(electronics)) == 3
+    assert names(cache.query(cheap)) == ["Mouse", "Shampoo"]
+
+    tablet = Item("Tablet", "Electronics", 30, 10)
+    collection.add(tablet)
+    assert len(cache) == 0
+    assert len(cache.query(electronics)) == 4
+
+    assert names(cache.query(cheap)) == ["Mouse", "Shampoo", "Tablet"]
+    # Cambiar el precio sólo invalida los filtros que usan price
+    collection.update(tablet, price=500)
+    assert len(cache) == 1
+    assert names(cache.query(cheap)) == ["Mouse", "Shampoo"]
+    assert cache.hits == 0
+
+    collection.remove(items[1])
+    assert names(cache.query(cheap)) == ["Shampoo"]
+    assert len(cache.query(electronics)) == 3
+    assert cache.invalidations >= 3
+
+def test_randomized_against_uncached_queries():
+    rnd = random.Random(5)
+    categories = ["Electronics", "Groceries", "Toys"]
+    items = [Item(f"Item{i}", rnd.choice(categories), rnd.randint(0, 100), rnd.randint(0, 10)) for i in range(300)]
+    collection = IndexedCollection(items)
+    cache = FilterCache(collection, max_entries=8)
+    filters = [build_equals_filter("category", c) for c in categories] + \
+              [build_range_filter("price", low, low + 20) for low in range(0, 100, 25)] + \
+              [all_of(build_equals_filter("category", "Toys"), build_less_than_filter("quantity", 5)),
+               build_contains_filter("name", "Item1")]
+    for _ in range(500):
+        action = rnd.random()
+        if action < 0.05:
+            item = Item(f"New{rnd.randint(0, 99)}", rnd.choice(categories), rnd.randint(0, 100), rnd.randint(0, 10))
+            collection.add(item)
+            items.append(item)
+        elif action < 0.08:
+            collection.remove(items.pop(rnd.randrange(len(items))))
+        elif action < 0.15:
+            attribute = rnd.choice(["price", "quantity", "category"])
+            value = rnd.choice(categories) if attribute == "category" else rnd.randint(0, 100)
+            collection.update(rnd.choice(items), **{attribute: value})
+        predicate = rnd.choice(filters)
+        assert cache.query(predicate) == list(filter(predicate, items))
+    stats = cache.stats()
+    assert stats["hits"] > 0 and stats["hits"] + stats["misses"] == 500
@@ -0,0 +1,102 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from Item.Item import Item, build_equals_filter, build_greater_than_filter, build_less_than_filter, build_range_filter, build_contains_filter
+from Item.catalog import ItemCatalog
+from Item.predicates import all_of, any_of, negate
+
+from conftest import CATEGORIES, random_items
+
+def random_filter(rnd):
+    attribute = rnd.choice(["name", "category", "price", "quantity"])
+    if attribute == "name":
+        value = rnd.choice(["a", "o", "Mouse", "1", "pp", "zz"])
+        return rnd.choice([build_contains_filter("name", value), build_equals_filter("name", value + "1"),
+                           build_range_filter("name", "B", "M")])
+    if attribute == "category":
+        return rnd.choice([build_equals_filter("category", rnd.choice(CATEGORIES + ["Books"])),
+                           build_contains_filter("category", rnd.choice(["o", "Care", "x"])),
+                           build_less_than_filter("category", "H")])
+    limit = 2000 if attribute == "price" else 500
+    low = rnd.randint(0, limit)
+    return rnd.choice([build_equals_filter(attribute, low), build_greater_than_filter(attribute, low),
+                       build_less_than_filter(attribute, low), build_range_filter(attribute, low, low + rnd.randint(0, limit)),
+                       build_greater_than_filter(attribute, low + 0.5)])
+
+def as_tuples(items):
+    return [(item.name, item.category, item.price, item.quantity) for item in items]
+
+def test_same_results_as_lambda_filters(items):
+    catalog = ItemCatalog(items)
+    for predicate in [build_equals_filter("category", "Electronics"), build_greater_than_filter("price", 100),
+                      build_less_than_filter("price", 10), build_range_filter("price", 5, 50),
+                      build_contains_filter("name", "a")]:
+        assert as_tuples(catalog.filter(predicate)) == as_tuples(filter(predicate, items))
+
+@pytest.mark.parametrize("float_prices", [False, True])
+def test_randomized_filters_match_lambdas(float_prices):
+    items = random_items(3000, 7, float_prices=float_prices)
+    catalog = ItemCatalog(items)
+    rnd = random.Random(11)
+    for _ in range(200):
+        predicate = random_filter(rnd)
+        combination = rnd.random()
+        if combination < 0.2:
+            predicate = all_of(predicate, random_filter(rnd))
+        elif combination < 0.3:
+            predicate = any_of(predicate, random_filter(rnd))
+        elif combination < 0.4:
+            predicate = negate(predicate)
+        expected = [i for i, item in enumerate(items) if predicate(item)]
+        assert np.flatnonzero(catalog.mask(predicate)).tolist() == expected
+        assert as_tuples(catalog.filter(predicate)) == as_tuples(items[i] for i in expected)
+
+def test_view_is_lazy_and_refinable(items):
+    catalog = ItemCatalog(items)
+    electronics = catalog.filter(build_equals_filter("category", "Electronics"))
+    assert len(electronics) == 3
+    assert electronics.column("price").tolist() == [1200, 25, 80]
+    assert electronics.column("category").tolist() == ["Electronics"] * 3
+    assert repr(electronics[1]) == repr(items[1])
+    cheap = electronics.filter(build_less_than_filter("price", 100))
+    assert [item.name for item in cheap] == ["Mouse", "Keyboard"]
+    assert catalog.count(build_contains_filter("name", "a")) == 4
+
+def test_returns_python_values(items):
+    item = ItemCatalog(items).filter(build_equals_filter("name", "Mouse"))[0]
+    assert type(item.price) is int and type(item.name) is str
+    assert repr(item) == "Item(name=Mouse, category=Electronics, price=25, quantity=100)"
+
+def test_mixed_types_keep_python_semantics():
+    items = [Item("A", "X", 1, 1), Item("B", "X", 2.5, 1), Item("C", "Y", 10 ** 30, 1)]
+    catalog = ItemCatalog(items)
+    predicate = build_greater_than_filter("price", 2)
+    assert as_tuples(catalog.filter(predicate)) == as_tuples(filter(predicate, items))
+    assert catalog.filter(build_equals_filter("price", 10 ** 30))[0].price == 10 ** 30
+
+def test_large_int64_with_float_thresholds_match_lambdas():
+    # NumPy compararía 2**53 + 1 como float64 (2**53); las lambdas comparan int y float de forma exacta
+    items = [Item("A", "X", 2 ** 53 + 1, 1), Item("B", "X", 5, 1), Item("C", "X", -2 ** 53 - 1, 1)]
+    catalog = ItemCatalog(items)
+    assert catalog.column("price").dtype == np.int64
+    for predicate in (build_greater_than_filter("price", float(2 ** 53)), build_equals_filter("price", float(2 ** 53)),
+                      build_range_filter("price", 0, float(2 ** 53)), build_less_than_filter("price", -float(2 ** 53)),
+                      build_greater_than_filter("price", 2 ** 53)):
+        assert as_tuples(catalog.filter(predicate)) == as_tuples(filter(predicate, items))
+
+def test_custom_lambdas_are_supported(items):
+    catalog = ItemCatalog(items)
+    predicate = all_of(build_equals_filter("category", "Electronics"), lambda item: item.quantity % 2 == 0)
+    assert [item.name for item in catalog.filter(predicate)] == ["Mouse", "Keyboard"]
+
+def test_empty_catalog_and_unknown_attribute(items):
+    assert len(ItemCatalog().filter(build_greater_than_filter("price", 5))) == 0
+    with pytest.raises(AttributeError):
+        ItemCatalog(items).mask(build_equals_filter("colour", "red"))
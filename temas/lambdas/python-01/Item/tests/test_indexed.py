@@ -0,0 +1,93 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import random
+
+from Item.Item import Item, build_equals_filter, build_greater_than_filter, build_less_than_filter, build_range_filter, build_contains_filter
+from Item.indexed import IndexedCollection
+from Item.predicates import all_of, any_of, negate
+import pytest
+
+from conftest import NAMES, CATEGORIES, random_items
+
+def random_filter(rnd):
+    low = rnd.randint(0, 2000)
+    return rnd.choice([
+        build_equals_filter("category", rnd.choice(CATEGORIES + ["Books"])),
+        build_equals_filter("name", rnd.choice(NAMES) + str(rnd.randint(0, 99))),
+        build_equals_filter("price", low),
+        build_greater_than_filter("price", low),
+        build_less_than_filter("quantity", rnd.randint(0, 500)),
+        build_range_filter("price", low, low + rnd.randint(0, 200)),
+        build_contains_filter("name", str(rnd.randint(0, 9))),
+    ])
+
+def test_same_results_as_filter(items):
+    collection = IndexedCollection(items)
+    for predicate in [build_equals_filter("category", "Electronics"), build_greater_than_filter("price", 100),
+                      build_less_than_filter("price", 10), build_range_filter("price", 5, 50),
+                      build_contains_filter("name", "a")]:
+        assert collection.query(predicate) == list(filter(predicate, items))
+
+def test_planner_chooses_index():
+    rnd = random.Random(0)
+    collection = IndexedCollection(random_items(2000, rnd))
+    assert collection.explain(build_equals_filter("category", "Books")) == "hash(category)"
+    assert collection.explain(build_range_filter("price", 5, 50)) == "sorted(price)"
+    assert collection.explain(build_contains_filter("name", "1")) == "scan"
+    # Un rango que abarca casi todo no compensa: se recorre la colección
+    assert collection.explain(build_greater_than_filter("price", 1)) == "scan"
+    combined = all_of(build_contains_filter("name", "1"), build_range_filter("price", 5, 50),
+                      build_equals_filter("name", "Item7"))
+    assert collection.explain(combined) == "hash(name)"
+    either = any_of(build_equals_filter("name", "Item7"), build_less_than_filter("price", 3))
+    assert set(collection.explain(either).split(" | ")) == {"hash(name)", "sorted(price)"}
+    assert collection.explain(negate(build_equals_filter("name", "Item7"))) == "scan"
+
+def test_randomized_queries_with_mutations():
+    rnd = random.Random(3)
+    items = random_items(300, rnd)
+    collection = IndexedCollection(items)
+    for step in range(300):
+        action = rnd.random()
+        if action < 0.2:
+            item = random_items(1, rnd)[0]
+            collection.add(item)
+            items.append(item)
+        elif action < 0.35 and items:
+            item = items.pop(rnd.randrange(len(items)))
+            collection.remove(item)
+        elif action < 0.5 and items:
+            item = rnd.choice(items)
+            collection.update(item, price=rnd.randint(0, 2000), category=rnd.choice(CATEGORIES))
+        predicate = random_filter(rnd)
+        if rnd.random() < 0.3:
+            predicate = all_of(predicate, random_filter(rnd))
+        elif rnd.random() < 0.2:
+            predicate = any_of(predicate, random_filter(rnd))
+        assert collection.query(predicate) == list(filter(predicate, items))
+    assert len(collection) == len(items)
+    assert list(collection) == items
+
+def test_bulk_extend_keeps_indexes(items):
+    collection = IndexedCollection(items[:2])
+    collection.extend(items[2:] + [Item(f"Extra{i}", "Toys", i, i) for i in range(100)])
+    assert len(collection.sorted_indexes["price"]) == len(collection) == 106
+    assert [item.name for item in collection.query(build_range_filter("price", 5, 8))] == ["Shampoo", "Extra5", "Extra6", "Extra7", "Extra8"]
+
+def test_membership_errors(items):
+    collection = IndexedCollection(items)
+    with pytest.raises(ValueError):
+        collection.add(items[0])
+    outsider = Item("Pear", "Groceries", 3, 10)
+    assert outsider not in collection
+    with pytest.raises(KeyError):
+        collection.remove(outsider)
+    with pytest.raises(KeyError):
+        collection.update(outsider, price=4)
+
+def test_incomparable_values_fall_back_to_scan(items):
+    collection = IndexedCollection(items)
+    assert collection.query(build_equals_filter("price", "cheap")) == []
+    assert collection.query(build_equals_filter("category", ["Electronics"])) == []
@@ -2,20 +2,9 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from Item.Item import Item, build_equals_filter, build_greater_than_filter, build_less_than_filter, build_range_filter, build_contains_filter
+from Item.Item import build_equals_filter, build_greater_than_filter, build_less_than_filter, build_range_filter, build_contains_filter
 import pytest
 
-@pytest.fixture
-def items():
-    return [
-        Item("Laptop", "Electronics", 1200, 5),
-        Item("Mouse", "Electronics", 25, 100),
-        Item("Banana", "Groceries", 1, 200),
-        Item("Shampoo", "Personal Care", 7, 50),
-        Item("Apple", "Groceries", 2, 300),
-        Item("Keyboard", "Electronics", 80, 30),
-    ]
-
 def test_build_equals_filter(items):
     electronics_filter = build_equals_filter("category", "Electronics")
     filtered_items = list(filter(electronics_filter, items))
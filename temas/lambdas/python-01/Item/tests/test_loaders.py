@@ -0,0 +1,96 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import io
+import tracemalloc
+
+from Item.Item import Item, CompactItem, build_equals_filter
+from Item.loaders import iter_csv, load_csv, load_jsonl, write_csv, write_jsonl
+import pytest
+
+@pytest.fixture
+def items(items):
+    # Los items comunes (conftest.py) con un precio float y una coma en un nombre para los formatos de texto
+    items[3].price = 7.5
+    items[5].name = "Keyboard, wireless"
+    return items
+
+def test_compact_item_has_same_attributes_and_repr(items):
+    for item in items:
+        compact = CompactItem(item.name, item.category, item.price, item.quantity)
+        assert repr(compact) == repr(item)
+        assert not hasattr(compact, '__dict__')
+    compact = CompactItem("Mouse", "Electronics", 25, 100)
+    compact.price = 30
+    assert compact.price == 30
+    assert build_equals_filter("category", "Electronics")(compact)
+    with pytest.raises(AttributeError):
+        compact.colour = "black"
+
+def test_csv_round_trip(items, tmp_path):
+    path = str(tmp_path / "items.csv")
+    write_csv(items, path)
+    loaded = load_csv(path)
+    assert [repr(item) for item in loaded] == [repr(item) for item in items]
+    assert type(loaded[3].price) is float and type(loaded[0].price) is int
+    assert all(isinstance(item, CompactItem) for item in loaded)
+    assert [repr(item) for item in load_csv(path, item_class=Item)] == [repr(item) for item in items]
+
+def test_jsonl_round_trip(items, tmp_path):
+    path = str(tmp_path / "items.jsonl")
+    write_jsonl(items, path)
+    assert [repr(item) for item in load_jsonl(path)] == [repr(item) for item in items]
+
+def test_loaders_are_streaming():
+    source = io.StringIO("name,category,price,quantity\nMouse,Electronics,25,100\nbroken\n")
+    stream = iter_csv(source)
+    assert repr(next(stream)) == "Item(name=Mouse, category=Electronics, price=25, quantity=100)"
+    with pytest.raises(ValueError, match="línea 3"):
+        next(stream)
+
+def test_csv_columns_in_any_order_and_missing_columns():
+    source = io.StringIO("quantity;price;name;category;supplier\n5;1200;Laptop;Electronics;ACME\n\n")
+    assert repr(load_csv(source, delimiter=';')[0]) == "Item(name=Laptop, category=Electronics, price=1200, quantity=5)"
+    with pytest.raises(ValueError, match="price"):
+        load_csv(io.StringIO("name,category,quantity\nLaptop,Electronics,5\n"))
+    assert load_csv(io.StringIO("")) == []
+
+def test_jsonl_ignores_extra_fields_and_reports_errors():
+    source = io.StringIO('{"quantity": 5, "name": "Laptop", "extra": {"a": 1}, "category": "Electronics", "price": 1200}\n\n')
+    assert repr(load_jsonl(source)[0]) == "Item(name=Laptop, category=Electronics, price=1200, quantity=5)"
+    with pytest.raises(ValueError, match="quantity"):
+        load_jsonl(io.StringIO('{"name": "Laptop", "category": "Electronics", "price": 1200}\n'))
+    with pytest.raises(ValueError, match="objeto"):
+        load_jsonl(io.StringIO('[1, 2]\n'))
+
+def test_repeated_categories_share_one_string():
+    text = "name,category,price,quantity\n" + "".join(f"Item{i},Electronics,{i},1\n" for i in range(10))
+    loaded = load_csv(io.StringIO(text))
+    assert all(item.category is loaded[0].category for item in loaded)
+
+def measure_per_item(build, n):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = build(n)
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert len(items) == n
+    return used / n
+
+def test_compact_item_uses_less_memory_per_item():
+    # Mismos valores compartidos en ambos casos: sólo se mide el coste de los objetos
+    n = 20000
+    values = [(f"Item{i}", "Electronics", i * 1000, i * 1000 + 1) for i in range(n)]
+    plain = measure_per_item(lambda n: [Item(*row) for row in values], n)
+    compact = measure_per_item(lambda n: [CompactItem(*row) for row in values], n)
+    assert compact < 0.7 * plain
+
+def test_loaded_catalog_uses_less_memory(tmp_path):
+    path = str(tmp_path / "items.csv")
+    write_csv((Item(f"Item{i}", "Electronics", i, i % 100) for i in range(20000)), path)
+    plain = measure_per_item(lambda n: load_csv(path, item_class=Item), 20000)
+    compact = measure_per_item(lambda n: load_csv(path), 20000)
+    assert compact < 0.8 * plain
@@ -0,0 +1,83 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import random
+
+from Item.Item import Item, build_equals_filter, build_greater_than_filter, build_less_than_filter, build_range_filter, build_contains_filter
+from Item.predicates import all_of, any_of, negate, compile_filter, filter_items, normalize
+import pytest
+
+from conftest import random_items
+
+def test_builders_keep_lambda_behaviour_and_describe_filter(items):
+    electronics_filter = build_equals_filter("category", "Electronics")
+    assert electronics_filter.spec == ('equals', 'category', 'Electronics')
+    assert build_range_filter("price", 5, 50).spec == ('range', 'price', 5, 50)
+    assert len(list(filter(electronics_filter, items))) == 3
+
+def test_all_of_any_of_negate(items):
+    electronics = build_equals_filter("category", "Electronics")
+    cheap = build_less_than_filter("price", 50)
+    assert {item.name for item in filter(all_of(electronics, cheap), items)} == {"Mouse"}
+    assert {item.name for item in filter(any_of(build_greater_than_filter("price", 1000), build_contains_filter("name", "pp")), items)} == {"Laptop", "Apple"}
+    assert {item.name for item in filter(negate(electronics), items)} == {"Banana", "Shampoo", "Apple"}
+
+def test_combinations_compose_and_normalize():
+    a = build_equals_filter("category", "Toys")
+    b = build_greater_than_filter("price", 10)
+    c = build_less_than_filter("quantity", 5)
+    nested = all_of(all_of(a, b), c)
+    assert nested.spec[0] == 'and' and len(nested.spec) == 4
+    assert normalize(('not', ('not', a.spec))) == a.spec
+    assert negate(negate(a)).spec == a.spec
+
+def test_and_places_selective_cheap_filters_first():
+    contains = build_contains_filter("name", "o")
+    greater = build_greater_than_filter("price", 10)
+    equals = build_equals_filter("category", "Toys")
+    assert [child[0] for child in all_of(contains, greater, equals).spec[1:]] == ['equals', 'greater_than', 'contains']
+
+def test_sample_based_ordering():
+    items = [Item("x", "Toys", price, 1) for price in range(100)]
+    most_pass = build_greater_than_filter("price", 0)
+    few_pass = build_less_than_filter("price", 3)
+    compiled = compile_filter(all_of(most_pass, few_pass), sample=items)
+    assert compiled.spec[1] == few_pass.spec
+
+def test_arbitrary_lambdas_are_opaque_filters(items):
+    even_quantity = lambda item: item.quantity % 2 == 0
+    combined = all_of(build_equals_filter("category", "Electronics"), even_quantity)
+    assert {item.name for item in filter(combined, items)} == {"Mouse", "Keyboard"}
+
+def test_dotted_attributes_use_attrgetter():
+    class Supplier:
+        def __init__(self, country):
+            self.country = country
+    item = Item("Laptop", "Electronics", 1200, 5)
+    item.supplier = Supplier("ES")
+    assert compile_filter(build_equals_filter("supplier.country", "ES"))(item)
+
+def test_compiled_matches_chained_filters_on_random_data():
+    items = random_items(5000)
+    rnd = random.Random(1)
+    for _ in range(50):
+        predicates = [
+            build_equals_filter("category", rnd.choice(["Electronics", "Groceries", "Toys"])),
+            build_greater_than_filter("price", rnd.randint(0, 2000)),
+            build_less_than_filter("quantity", rnd.randint(0, 500)),
+            build_range_filter("price", rnd.randint(0, 1000), rnd.randint(1000, 2000)),
+            build_contains_filter("name", rnd.choice(["a", "o", "1", "pp"])),
+        ]
+        chosen = rnd.sample(predicates, rnd.randint(1, len(predicates)))
+        expected = items
+        for predicate in chosen:
+            expected = list(filter(predicate, expected))
+        assert filter_items(items, *chosen) == expected
+        assert list(filter(all_of(*chosen), items)) == expected
+        either = any_of(*chosen)
+        assert either.select(items) == [item for item in items if any(p(item) for p in chosen)]
+
+def test_combining_nothing_is_an_error():
+    with pytest.raises(ValueError):
+        all_of()
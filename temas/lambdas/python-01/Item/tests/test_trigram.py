@@ -0,0 +1,98 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import random
+
+from Item.Item import Item, build_contains_filter, build_equals_filter
+from Item.indexed import IndexedCollection
+from Item.predicates import all_of, any_of
+from Item.trigram import TrigramIndex, trigrams
+import pytest
+
+WORDS = ["Laptop", "Mouse", "Banana", "Shampoo", "Apple", "Keyboard", "Cable", "Monitor", "Pro", "Mini", "USB"]
+
+def random_name(rnd):
+    return " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 3))) + str(rnd.randint(0, 99))
+
+def brute_force(values, substring):
+    return {row for row, value in values.items() if substring in value}
+
+def test_trigrams():
+    assert trigrams("Mouse") == {"Mou", "ous", "use"}
+    assert trigrams("ab") == set()
+
+def test_search_matches_brute_force():
+    rnd = random.Random(0)
+    values = {row: random_name(rnd) for row in range(2000)}
+    values[2000] = "ab"
+    index = TrigramIndex()
+    index.extend(values.keys(), values.values())
+    for substring in ["Mouse", "ana", "Pro Mini", "e Ke", "USB1", "xyz", "oo", "ab", "o"]:
+        found = index.search(substring)
+        if len(substring) < 3:
+            assert found is None
+        else:
+            assert found == brute_force(values, substring)
+
+def test_short_and_non_string_values_are_still_found():
+    index = TrigramIndex()
+    index.add(0, "Pro")
+    index.add(1, "P")
+    index.add(2, ["Pro", "Max"])
+    assert index.search("Pro") == {0, 2}
+
+def test_incremental_updates_and_compaction():
+    rnd = random.Random(1)
+    values = {}
+    index = TrigramIndex()
+    for step in range(3000):
+        action = rnd.random()
+        if action < 0.5 or not values:
+            row = step
+            values[row] = random_name(rnd)
+            index.add(row, values[row])
+        elif action < 0.75:
+            row = rnd.choice(list(values))
+            index.remove(row)
+            del values[row]
+        else:
+            row = rnd.choice(list(values))
+            values[row] = random_name(rnd)
+            index.update(row, values[row])
+        if step % 100 == 0:
+            for substring in ["Mouse", "ple", "Mini1", "a Ap"]:
+                assert index.search(substring) == brute_force(values, substring)
+    # Las entradas obsoletas no superan nunca a las vivas
+    assert index._stale <= index._entries - index._stale
+    assert len(index) == len(values)
+
+def test_collection_uses_trigram_index(items):
+    collection = IndexedCollection(items + [Item(f"Cable {i}", "Electronics", i, i) for i in range(100)])
+    assert collection.explain(build_contains_filter("name", "ana")) == "trigram(name)"
+    assert [item.name for item in collection.query(build_contains_filter("name", "ana"))] == ["Banana"]
+    assert collection.explain(build_contains_filter("name", "a")) == "scan"
+    assert collection.explain(build_contains_filter("category", "tron")) == "scan"
+
+def test_collection_queries_with_mutations():
+    rnd = random.Random(2)
+    items = [Item(random_name(rnd), rnd.choice(["A", "B"]), rnd.randint(0, 100), 1) for _ in range(500)]
+    collection = IndexedCollection(items)
+    for _ in range(200):
+        action = rnd.random()
+        if action < 0.2:
+            item = Item(random_name(rnd), "A", 1, 1)
+            collection.add(item)
+            items.append(item)
+        elif action < 0.4:
+            item = items.pop(rnd.randrange(len(items)))
+            collection.remove(item)
+        elif action < 0.6:
+            collection.update(rnd.choice(items), name=random_name(rnd))
+        substring = rnd.choice(["Mouse", "ple", "Mini1", "a Ap", "USB", "Pro K"])
+        predicate = rnd.choice([
+            build_contains_filter("name", substring),
+            all_of(build_contains_filter("name", substring), build_equals_filter("category", "A")),
+            any_of(build_contains_filter("name", substring), build_contains_filter("name", "Cable")),
+        ])
+        assert collection.query(predicate) == list(filter(predicate, items))
@@ -0,0 +1,90 @@
+from array import array
+from typing import Any, Dict, Iterable, Optional, Set
+
+def trigrams(text: str) -> Set[str]:
+    """Trigramas distintos de una cadena."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class TrigramIndex:
+    """Índice invertido de trigramas para búsquedas de subcadenas (build_contains_filter).
+
+    Cada trigrama apunta a las filas cuyo valor lo contiene, en arrays compactos de enteros.
+    Una subcadena de 3 o más caracteres sólo puede estar en las filas que tienen todos sus
+    trigramas: se intersectan esas listas y se verifica cada candidato con 'in'. Los borrados
+    son perezosos (las filas obsoletas se descartan al verificar) y el índice se compacta
+    cuando las entradas obsoletas superan a las vivas."""
+
+    def __init__(self):
+        self.postings: Dict[str, array] = {}
+        self._values: Dict[int, Any] = {}
+        # Filas que no se pueden indexar por trigramas: valores de menos de 3 caracteres o que no son cadenas
+        self._unindexed: Set[int] = set()
+        self._entries = 0
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, row: int, value: Any) -> None:
+        self._values[row] = value
+        grams = trigrams(value) if isinstance(value, str) else ()
+        if not grams:
+            self._unindexed.add(row)
+            return
+        postings = self.postings
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting is None:
+                posting = postings[gram] = array('i')
+            posting.append(row)
+        self._entries += len(grams)
+
+    def extend(self, rows: Iterable[int], values: Iterable[Any]) -> None:
+        for row, value in zip(rows, values):
+            self.add(row, value)
+
+    def remove(self, row: int) -> None:
+        value = self._values.pop(row)
+        if row in self._unindexed:
+            self._unindexed.discard(row)
+            return
+        self._stale += len(trigrams(value))
+        if self._stale > self._entries - self._stale:
+            self.compact()
+
+    def update(self, row: int, value: Any) -> None:
+        self.remove(row)
+        self.add(row, value)
+
+    def compact(self) -> None:
+        """Reconstruye las listas de filas sin las entradas obsoletas."""
+        values, self._values = self._values, {}
+        self.postings, self._unindexed = {}, set()
+        self._entries = self._stale = 0
+        self.extend(values.keys(), values.values())
+
+    def search(self, substring: str) -> Optional[Set[int]]:
+        """Filas cuyo valor contiene la subcadena, o None si es demasiado corta para usar el índice."""
+        grams = trigrams(substring)
+        if not grams:
+            return None
+        postings = []
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is None:
+                postings = None
+                break
+            postings.append(posting)
+        candidates = set(self._unindexed)
+        if postings:
+            # Se empieza por la lista más corta para que el conjunto intermedio sea pequeño
+            postings.sort(key=len)
+            rows = set(postings[0])
+            for posting in postings[1:]:
+                # Recorrer una lista mucho más larga que los candidatos cuesta más que verificarlos
+                if len(rows) * 2 < len(posting):
+                    break
+                rows.intersection_update(posting)
+            candidates |= rows
+        values = self._values
+        return {row for row in candidates if row in values and substring in values[row]}
@@ -0,0 +1,41 @@
+# Benchmark del catálogo por columnas: lambdas de Item.py sobre una lista frente a máscaras de NumPy
+# Uso (desde temas/lambdas/python-01): python -m benchmarks.bench_catalog [--items 1000000] [--repeat 3]
+
+import argparse
+import time
+
+from Item.Item import build_equals_filter, build_greater_than_filter, build_range_filter, build_contains_filter
+from Item.catalog import ItemCatalog
+from Item.predicates import all_of
+from benchmarks.bench_predicates import best_time, generate_items
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Filtros con lambdas frente al catálogo por columnas')
+    parser.add_argument('--items', type=int, default=1_000_000, help='número de Items (por defecto 10^6)')
+    parser.add_argument('--repeat', type=int, default=3, help='repeticiones; se toma la mejor (por defecto 3)')
+    args = parser.parse_args(argv)
+
+    items = generate_items(args.items)
+    start = time.perf_counter()
+    catalog = ItemCatalog(items)
+    print(f"construcción del catálogo: {time.perf_counter() - start:.3f}s")
+
+    queries = [
+        ('category == Electronics', build_equals_filter("category", "Electronics")),
+        ('price > 1500', build_greater_than_filter("price", 1500)),
+        ('5 <= price <= 50', build_range_filter("price", 5, 50)),
+        ("'o' in name", build_contains_filter("name", "o")),
+        ('combinado', all_of(build_equals_filter("category", "Electronics"), build_range_filter("price", 5, 500),
+                             build_contains_filter("name", "o"))),
+    ]
+    print(f"{'consulta':>24} {'lambda':>9} {'máscara':>9} {'vista':>9} {'Items':>9} {'mejora':>8}")
+    for name, predicate in queries:
+        lambda_time, _ = best_time(lambda: list(filter(predicate, items)), args.repeat)
+        mask_time, _ = best_time(lambda: catalog.mask(predicate), args.repeat)
+        view_time, _ = best_time(lambda: catalog.filter(predicate), args.repeat)
+        items_time, _ = best_time(lambda: catalog.filter(predicate).to_items(), args.repeat)
+        print(f"{name:>24} {lambda_time:>8.3f}s {mask_time:>8.3f}s {view_time:>8.3f}s {items_time:>8.3f}s "
+              f"{lambda_time / view_time:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Benchmark de índices secundarios: latencia de consultas puntuales y de rango frente a recorrer la lista
+# Uso (desde temas/lambdas/python-01): python -m benchmarks.bench_indexed [--items 1000000] [--queries 200]
+
+import argparse
+import random
+import time
+
+from Item.Item import build_equals_filter, build_range_filter, build_less_than_filter
+from Item.indexed import IndexedCollection
+from Item.predicates import all_of
+from benchmarks.bench_predicates import generate_items
+
+def mean_latency(run, queries):
+    start = time.perf_counter()
+    for predicate in queries:
+        run(predicate)
+    return (time.perf_counter() - start) / len(queries)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Consultas con índices frente a recorrer la lista')
+    parser.add_argument('--items', type=int, default=1_000_000, help='número de Items (por defecto 10^6)')
+    parser.add_argument('--queries', type=int, default=200, help='consultas por tipo (por defecto 200)')
+    args = parser.parse_args(argv)
+
+    items = generate_items(args.items)
+    start = time.perf_counter()
+    collection = IndexedCollection(items)
+    print(f"construcción de los índices: {time.perf_counter() - start:.2f}s")
+
+    rnd = random.Random(1)
+    # Las consultas por lista son lentas: se mide con menos repeticiones
+    scans = max(args.queries // 20, 3)
+    query_types = [
+        ('nombre exacto', lambda: build_equals_filter("name", f"Mouse {rnd.randrange(args.items)}")),
+        ('precio exacto', lambda: build_equals_filter("price", rnd.randint(1, 2000))),
+        ('rango de precio (0,5 %)', lambda: (lambda low: build_range_filter("price", low, low + 9))(rnd.randint(1, 1990))),
+        ('rango + categoría', lambda: all_of(build_range_filter("price", 5, 50), build_equals_filter("category", "Toys"))),
+        ('cantidad < 5', lambda: build_less_than_filter("quantity", 5)),
+    ]
+    print(f"{'consulta':>26} {'plan':>14} {'lista':>11} {'índice':>11} {'mejora':>9}")
+    for name, make in query_types:
+        queries = [make() for _ in range(args.queries)]
+        scan = mean_latency(lambda predicate: list(filter(predicate, items)), queries[:scans])
+        indexed = mean_latency(collection.query, queries)
+        print(f"{name:>26} {collection.explain(queries[0]):>14} {scan * 1e3:>9.2f}ms {indexed * 1e3:>9.3f}ms "
+              f"{scan / indexed:>8.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Benchmark de filtros combinados: filter() encadenados frente al filtro compilado
+# Uso (desde temas/lambdas/python-01): python -m benchmarks.bench_predicates [--items 1000000] [--repeat 3]
+
+import argparse
+import random
+import time
+
+from Item.Item import Item, build_equals_filter, build_greater_than_filter, build_range_filter, build_contains_filter
+from Item.predicates import all_of, compile_filter, filter_items
+
+NAMES = ["Laptop", "Mouse", "Banana", "Shampoo", "Apple", "Keyboard", "Cable", "Monitor"]
+CATEGORIES = ["Electronics", "Groceries", "Personal Care", "Toys", "Books"]
+
+def generate_items(n, seed=0):
+    rnd = random.Random(seed)
+    return [Item(f"{rnd.choice(NAMES)} {i}", rnd.choice(CATEGORIES), rnd.randint(1, 2000), rnd.randint(0, 500))
+            for i in range(n)]
+
+def best_time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times), len(result)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Filtros encadenados frente a filtros compilados')
+    parser.add_argument('--items', type=int, default=1_000_000, help='número de Items (por defecto 10^6)')
+    parser.add_argument('--repeat', type=int, default=3, help='repeticiones; se toma la mejor (por defecto 3)')
+    args = parser.parse_args(argv)
+
+    items = generate_items(args.items)
+    # Orden "natural" al escribirlos: el más caro y menos selectivo primero
+    predicates = [
+        build_contains_filter("name", "o"),
+        build_greater_than_filter("price", 100),
+        build_range_filter("quantity", 10, 400),
+        build_equals_filter("category", "Electronics"),
+    ]
+
+    def chained():
+        result = items
+        for predicate in predicates:
+            result = filter(predicate, result)
+        return list(result)
+
+    combined = all_of(*predicates)
+    sampled = compile_filter(combined, sample=items[:1000])
+    variants = [
+        ('filter() encadenados', chained),
+        ('lambda con and', lambda: [item for item in items if all(p(item) for p in predicates)]),
+        ('all_of + filter()', lambda: list(filter(combined, items))),
+        ('compilado con muestra', lambda: list(filter(sampled, items))),
+        ('compilado .select()', lambda: sampled.select(items)),
+        ('filter_items()', lambda: filter_items(items, *predicates)),
+    ]
+
+    reference, _ = best_time(chained, args.repeat)
+    print(f"{'variante':>24} {'tiempo':>10} {'resultados':>11} {'mejora':>8}")
+    for name, function in variants:
+        elapsed, count = best_time(function, args.repeat)
+        print(f"{name:>24} {elapsed:>9.3f}s {count:>11} {reference / elapsed:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
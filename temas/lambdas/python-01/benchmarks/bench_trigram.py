@@ -0,0 +1,55 @@
+# Benchmark del índice de trigramas: memoria y latencia de build_contains_filter frente a recorrer la lista
+# Uso (desde temas/lambdas/python-01): python -m benchmarks.bench_trigram [--items 1000000] [--queries 50]
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from Item.Item import Item, build_contains_filter
+from Item.indexed import IndexedCollection
+from Item.trigram import TrigramIndex
+
+WORDS = ["Laptop", "Mouse", "Banana", "Shampoo", "Apple", "Keyboard", "Cable", "Monitor", "Wireless", "Gaming",
+         "Ultra", "Pro", "Mini", "Max", "Charger", "Headphones", "Speaker", "Organic", "Premium", "Travel"]
+
+def generate_names(n, seed=0):
+    rnd = random.Random(seed)
+    return [f"{' '.join(rnd.sample(WORDS, rnd.randint(2, 3)))} {rnd.randrange(100_000):05d}" for _ in range(n)]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Índice de trigramas frente a la lambda de build_contains_filter')
+    parser.add_argument('--items', type=int, default=1_000_000, help='número de Items (por defecto 10^6)')
+    parser.add_argument('--queries', type=int, default=50, help='consultas por subcadena (por defecto 50)')
+    args = parser.parse_args(argv)
+
+    names = generate_names(args.items)
+    items = [Item(name, "Electronics", 1, 1) for name in names]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    index = TrigramIndex()
+    index.extend(range(len(names)), names)
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(f"índice de trigramas: {len(index.postings)} trigramas, {size / 2 ** 20:.1f} MiB "
+          f"({size / len(names):.0f} B/Item), construido en {elapsed:.2f}s (con tracemalloc)")
+
+    collection = IndexedCollection(items, hash_attributes=(), sorted_attributes=())
+    print(f"{'subcadena':>16} {'resultados':>11} {'lambda':>10} {'índice':>10} {'mejora':>8}")
+    for substring in ["Gaming Pro", "Mouse", "12345", "ess Ch", "Max 0", "Banana Ultra"]:
+        predicate = build_contains_filter("name", substring)
+        start = time.perf_counter()
+        expected = list(filter(predicate, items))
+        scan = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(args.queries):
+            found = collection.query(predicate)
+        indexed = (time.perf_counter() - start) / args.queries
+        assert found == expected
+        print(f"{substring:>16} {len(found):>11} {scan * 1e3:>8.1f}ms {indexed * 1e3:>8.2f}ms {scan / indexed:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# Benchmark de memoizar: aplicar una función costosa a una lista con muchas entradas repetidas,
+# sin caché y con memoizar, y las estadísticas de la caché.
+# Uso: python benchmarks/bench_memoizacion.py [--n 300] [--distintos 10] [--coste 20000]
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Program import orden_superior_map
+from Memoizacion import memoizar
+
+def costosa(n):
+    return sum(i * i for i in range(n))
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Aceleración de memoizar con entradas repetidas')
+    parser.add_argument('--n', type=int, default=300, help='número de llamadas')
+    parser.add_argument('--distintos', type=int, default=10, help='valores distintos entre las llamadas')
+    parser.add_argument('--coste', type=int, default=20_000, help='tamaño del cálculo de cada llamada')
+    args = parser.parse_args(argv)
+
+    datos = [args.coste + i % args.distintos for i in range(args.n)]
+    esperado, sin_cache = cronometrar(lambda: orden_superior_map(costosa, datos))
+    memoizada = memoizar(costosa)
+    resultado, con_cache = cronometrar(lambda: orden_superior_map(memoizada, datos))
+    assert resultado == esperado
+
+    estadisticas = memoizada.estadisticas()
+    print(f"{args.n} llamadas, {args.distintos} valores distintos")
+    print(f"sin caché: {sin_cache:.3f} s")
+    print(f"con caché: {con_cache:.3f} s ({estadisticas['fallos']} fallos, {estadisticas['aciertos']} aciertos)")
+    print(f"aceleración: {sin_cache / con_cache:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Benchmark de las versiones paralelas: aceleración frente a orden_superior_map/reduce según el número
+# de trabajadores, con una función que consume CPU (procesos) y otra que espera E/S (hilos).
+# Uso: python benchmarks/bench_paralelo.py [--n 20000] [--max-trabajadores 8]
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Program import lambda_add, orden_superior_map, orden_superior_reduce
+from Paralelo import paralelo_map, paralelo_reduce
+
+def es_primo(n):
+    # Comprobación ingenua a propósito, para que cada llamada cueste CPU
+    if n < 2:
+        return False
+    return all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+def consulta_lenta(x):
+    time.sleep(0.001)
+    return x
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Aceleración de map/reduce paralelos según el número de trabajadores')
+    parser.add_argument('--n', type=int, default=20000, help='elementos para la función de CPU (por defecto 20000)')
+    parser.add_argument('--max-trabajadores', type=int, default=max(8, os.cpu_count() or 1),
+                        help='número máximo de trabajadores')
+    args = parser.parse_args(argv)
+    print(f"núcleos disponibles: {os.cpu_count()}")
+
+    trabajadores = [1]
+    while trabajadores[-1] * 2 <= args.max_trabajadores:
+        trabajadores.append(trabajadores[-1] * 2)
+
+    numeros = list(range(10 ** 9, 10 ** 9 + args.n))
+    casos = [
+        ('map CPU', 'procesos', numeros,
+         lambda: orden_superior_map(es_primo, numeros),
+         lambda lista, modo, t: paralelo_map(es_primo, lista, modo, t)),
+        ('reduce', 'procesos', numeros * 50,
+         lambda: orden_superior_reduce(lambda_add, numeros * 50),
+         lambda lista, modo, t: paralelo_reduce(lambda_add, lista, modo=modo, trabajadores=t)),
+        ('map E/S', 'hilos', numeros[:1000],
+         lambda: orden_superior_map(consulta_lenta, numeros[:1000]),
+         lambda lista, modo, t: paralelo_map(consulta_lenta, lista, modo, t)),
+    ]
+    print(f"{'caso':>8} {'modo':>9} {'trabajadores':>12} {'tiempo':>9} {'aceleración':>11}")
+    for nombre, modo, lista, serie, paralelo in casos:
+        esperado, base = cronometrar(serie)
+        print(f"{nombre:>8} {'serie':>9} {'-':>12} {base:>8.2f}s {1:>10.2f}x")
+        for t in trabajadores:
+            resultado, segundos = cronometrar(lambda: paralelo(lista, modo, t))
+            assert resultado == esperado
+            print(f"{nombre:>8} {modo:>9} {t:>12} {segundos:>8.2f}s {base / segundos:>10.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Benchmark de memoria: funciones de orden superior (listas completas) frente a Stream (perezoso)
+# para filtrar pares -> elevar al cuadrado -> sumar sobre range(10^N). 'stream' usa la ruta con
+# NumPy y 'stream-py' el Stream en Python puro (con un iterador de fuente).
+# Cada medida se hace en un proceso nuevo para que el pico de memoria (ru_maxrss) sea el suyo.
+# Uso: python benchmarks/bench_stream.py [--max-exp 8] [--max-exp-listas 7]
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Program import lambda_add, lambda_even, orden_superior_map, orden_superior_filter, orden_superior_reduce
+from Stream import Stream
+
+def cuadrado(x):
+    return x * x
+
+def con_listas(n):
+    return orden_superior_reduce(lambda_add, orden_superior_map(cuadrado, orden_superior_filter(lambda_even, range(n))))
+
+# Con un range de fuente el Stream va por la ruta vectorizada con NumPy (si está instalada)
+def con_stream(n):
+    return Stream(range(n)).filter(lambda_even).map(cuadrado).reduce(lambda_add)
+
+# Un iterador no tiene longitud y nunca se vectoriza: mide el Stream perezoso fusionado en Python
+def con_stream_python(n):
+    return Stream(iter(range(n))).filter(lambda_even).map(cuadrado).reduce(lambda_add)
+
+VARIANTES = {'listas': con_listas, 'stream': con_stream, 'stream-py': con_stream_python}
+
+def medir(nombre, n):
+    inicio = time.perf_counter()
+    resultado = VARIANTES[nombre](n)
+    segundos = time.perf_counter() - inicio
+    # ru_maxrss está en KiB en Linux
+    return resultado, segundos, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Memoria de las funciones de orden superior frente a Stream')
+    parser.add_argument('--max-exp', type=int, default=8, help='tamaño máximo 10^N para Stream (por defecto 8)')
+    parser.add_argument('--max-exp-listas', type=int, default=7,
+                        help='tamaño máximo 10^N para las funciones con listas (por defecto 7)')
+    args = parser.parse_args(argv)
+
+    contexto = multiprocessing.get_context('spawn')
+    print(f"{'n':>11} {'variante':>9} {'tiempo':>9} {'pico RSS':>10}")
+    with contexto.Pool(1, maxtasksperchild=1) as pool:
+        for exponente in range(4, args.max_exp + 1):
+            n = 10 ** exponente
+            resultados = set()
+            for nombre, limite in (('listas', args.max_exp_listas), ('stream', args.max_exp), ('stream-py', args.max_exp)):
+                if exponente > limite:
+                    print(f"{n:>11} {nombre:>9} {'-':>9} {'-':>10}")
+                    continue
+                resultado, segundos, pico = pool.apply(medir, (nombre, n))
+                resultados.add(resultado)
+                print(f"{n:>11} {nombre:>9} {segundos:>8.2f}s {pico:>8.1f}MB")
+            assert len(resultados) == 1
+
+if __name__ == "__main__":
+    main()
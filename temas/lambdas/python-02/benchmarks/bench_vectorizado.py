@@ -0,0 +1,55 @@
+# Benchmark de la ruta vectorizada con NumPy frente a recorrer el Stream elemento a elemento en Python,
+# con 10^7 elementos por defecto. La ruta en Python se fuerza iterando el Stream (iter() nunca se vectoriza).
+# Uso: python benchmarks/bench_vectorizado.py [--n 10000000]
+
+import argparse
+import os
+import random
+import sys
+import time
+from functools import reduce
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Program import lambda_add, lambda_even, closure, FiltrarPorPar
+from Stream import Stream
+import Vectorizado
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Ruta vectorizada con NumPy frente a Python puro')
+    parser.add_argument('--n', type=int, default=10 ** 7, help='número de elementos (por defecto 10^7)')
+    args = parser.parse_args(argv)
+    if not Vectorizado.HAY_NUMPY:
+        sys.exit("NumPy no está instalado")
+
+    aleatorio = random.Random(0)
+    enteros = list(range(args.n))
+    reales = [aleatorio.random() for _ in range(args.n)]
+    casos = [
+        ('pares² (range)', Stream(range(args.n)).filter(lambda_even).map(lambda x: x ** 2), 'reduce'),
+        ('pares² (lista)', Stream(enteros).filter(lambda_even).map(lambda x: x ** 2), 'reduce'),
+        ('closure(3) collect', Stream(enteros).map(closure(3)).filter(lambda x: x % 5 < 2), 'collect'),
+        ('FiltrarPorPar count', Stream(range(args.n)).map(closure(7)).filter(FiltrarPorPar()), 'count'),
+        ('suma de reales', Stream(reales).map(lambda x: x * 2.5 - 1), 'reduce'),
+    ]
+    print(f"{'caso':>20} {'python':>9} {'numpy':>9} {'mejora':>8}")
+    for nombre, stream, terminal in casos:
+        if terminal == 'reduce':
+            esperado, python = cronometrar(lambda: reduce(lambda_add, iter(stream)))
+            resultado, numpy = cronometrar(lambda: stream.reduce(lambda_add))
+        elif terminal == 'collect':
+            esperado, python = cronometrar(lambda: list(iter(stream)))
+            resultado, numpy = cronometrar(stream.collect)
+        else:
+            esperado, python = cronometrar(lambda: sum(1 for _ in stream))
+            resultado, numpy = cronometrar(stream.count)
+        assert resultado == esperado
+        print(f"{nombre:>20} {python:>8.2f}s {numpy:>8.3f}s {python / numpy:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+# === MEMOIZACIÓN ===
+# memoizar guarda los resultados de una función pura según sus argumentos. La caché es LRU (se
+# expulsa la entrada usada hace más tiempo al superar maxsize) y, opcionalmente, cada entrada
+# caduca ttl segundos después de calcularse. Sirve también como caché de fábricas: una función que
+# crea funciones, como closure(n), devuelve siempre el mismo objeto para los mismos argumentos.
+
+class EstadisticasCache:
+    # Contadores protegidos por un cerrojo para poder consultarlos desde varios hilos
+    def __init__(self):
+        self._cerrojo = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+        self.caducadas = 0
+        self.bytes = 0
+
+    def sumar(self, **incrementos):
+        with self._cerrojo:
+            for nombre, valor in incrementos.items():
+                setattr(self, nombre, getattr(self, nombre) + valor)
+
+    def como_dict(self):
+        with self._cerrojo:
+            total = self.aciertos + self.fallos
+            return {'aciertos': self.aciertos, 'fallos': self.fallos, 'expulsiones': self.expulsiones,
+                    'caducadas': self.caducadas, 'bytes': self.bytes,
+                    'tasa_aciertos': self.aciertos / total if total else 0.0}
+
+def _clave(args, kwargs):
+    # El tipo forma parte de la clave: closure(2) y closure(2.0) no son la misma función
+    clave = tuple((type(a), a) for a in args)
+    if kwargs:
+        clave += tuple((nombre, type(valor), valor) for nombre, valor in sorted(kwargs.items()))
+    return clave
+
+def _tamano(clave, valor):
+    # Tamaño aproximado de una entrada: la clave, sus elementos y el valor (sin seguir referencias)
+    return sys.getsizeof(clave) + sum(sys.getsizeof(parte[-1]) for parte in clave) + sys.getsizeof(valor)
+
+def memoizar(funcion=None, maxsize=128, ttl=None, reloj=time.monotonic):
+    # Se puede usar como @memoizar o como @memoizar(maxsize=..., ttl=...); maxsize=None no limita
+    # el número de entradas. Los argumentos no hashables no se cachean: la función se llama sin más.
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("maxsize debe ser al menos 1")
+    if ttl is not None and ttl <= 0:
+        raise ValueError("ttl debe ser positivo")
+
+    def decorador(funcion):
+        entradas = OrderedDict()
+        cerrojo = threading.Lock()
+        estadisticas = EstadisticasCache()
+
+        def descartar(clave, **contador):
+            _, _, tamano = entradas.pop(clave)
+            estadisticas.sumar(bytes=-tamano, **contador)
+
+        @wraps(funcion)
+        def memoizada(*args, **kwargs):
+            try:
+                clave = _clave(args, kwargs)
+                hash(clave)
+            except TypeError:
+                estadisticas.sumar(fallos=1)
+                return funcion(*args, **kwargs)
+            with cerrojo:
+                entrada = entradas.get(clave)
+                if entrada is not None:
+                    if entrada[1] is None or reloj() < entrada[1]:
+                        entradas.move_to_end(clave)
+                        estadisticas.sumar(aciertos=1)
+                        return entrada[0]
+                    descartar(clave, caducadas=1)
+            estadisticas.sumar(fallos=1)
+            # Se calcula fuera del cerrojo para no bloquear al resto de hilos mientras tanto
+            valor = funcion(*args, **kwargs)
+            with cerrojo:
+                # Si otro hilo ha guardado ya el resultado se devuelve ése, para que todas las
+                # llamadas con los mismos argumentos reciban el mismo objeto
+                entrada = entradas.get(clave)
+                if entrada is not None and (entrada[1] is None or reloj() < entrada[1]):
+                    return entrada[0]
+                if entrada is not None:
+                    descartar(clave, caducadas=1)
+                tamano = _tamano(clave, valor)
+                entradas[clave] = (valor, None if ttl is None else reloj() + ttl, tamano)
+                estadisticas.sumar(bytes=tamano)
+                while maxsize is not None and len(entradas) > maxsize:
+                    descartar(next(iter(entradas)), expulsiones=1)
+            return valor
+
+        def limpiar():
+            with cerrojo:
+                for clave in list(entradas):
+                    descartar(clave)
+
+        memoizada.estadisticas = lambda: {**estadisticas.como_dict(), 'entradas': len(entradas)}
+        memoizada.limpiar = limpiar
+        return memoizada
+
+    if funcion is not None:
+        return decorador(funcion)
+    return decorador
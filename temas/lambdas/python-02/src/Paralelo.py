@@ -0,0 +1,111 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import reduce
+
+# === VERSIONES PARALELAS DE LAS FUNCIONES DE ORDEN SUPERIOR ===
+# La lista se divide en trozos y cada trozo se procesa en un hilo ('hilos', para funciones que
+# esperan E/S) o en un proceso ('procesos', para funciones que consumen CPU y chocarían con el GIL).
+# Con 'procesos' la función se entrega a cada proceso al crearlo (fork), de modo que también
+# sirven lambdas; en sistemas sin fork la función tiene que poder serializarse con pickle.
+
+MODOS = ('hilos', 'procesos')
+
+_SIN_INICIAL = object()
+
+# Función de cada proceso trabajador, fijada por _inicializar_proceso
+_funcion_proceso = None
+
+def _inicializar_proceso(funcion):
+    global _funcion_proceso
+    _funcion_proceso = funcion
+
+def _aplicar(operacion, funcion, trozo):
+    if funcion is None:
+        funcion = _funcion_proceso
+    if operacion == 'map':
+        return list(map(funcion, trozo))
+    if operacion == 'filter':
+        return list(filter(funcion, trozo))
+    return reduce(funcion, trozo)
+
+def _trabajadores(trabajadores):
+    if trabajadores is None:
+        return os.cpu_count() or 1
+    if trabajadores < 1:
+        raise ValueError("El número de trabajadores debe ser al menos 1")
+    return trabajadores
+
+def _trozos(lista, tamano_trozo, trabajadores):
+    # Por defecto unos cuatro trozos por trabajador para repartir bien la carga
+    if tamano_trozo is None:
+        tamano_trozo = max(1, -(-len(lista) // (trabajadores * 4)))
+    elif tamano_trozo < 1:
+        raise ValueError("El tamaño de los trozos debe ser al menos 1")
+    return [lista[i:i + tamano_trozo] for i in range(0, len(lista), tamano_trozo)]
+
+def _comprobar_modo(modo):
+    if modo not in MODOS:
+        raise ValueError(f"Modo desconocido: {modo!r} (se esperaba uno de {', '.join(MODOS)})")
+
+def _ejecutor(modo, funcion, trabajadores):
+    _comprobar_modo(modo)
+    if modo == 'hilos':
+        return ThreadPoolExecutor(trabajadores), funcion
+    metodos = multiprocessing.get_all_start_methods()
+    contexto = multiprocessing.get_context('fork' if 'fork' in metodos else None)
+    return ProcessPoolExecutor(trabajadores, mp_context=contexto,
+                               initializer=_inicializar_proceso, initargs=(funcion,)), None
+
+def _enviar(ejecutor, argumento, operacion, trozos, ordenado):
+    futuros = [ejecutor.submit(_aplicar, operacion, argumento, trozo) for trozo in trozos]
+    if ordenado:
+        return [futuro.result() for futuro in futuros]
+    return [futuro.result() for futuro in as_completed(futuros)]
+
+def _paralelo(operacion, funcion, lista, modo, trabajadores, tamano_trozo, ordenado):
+    lista = list(lista)
+    trabajadores = _trabajadores(trabajadores)
+    trozos = _trozos(lista, tamano_trozo, trabajadores)
+    # Con un solo trozo o un solo trabajador no compensa crear el pool
+    if len(trozos) <= 1 or trabajadores == 1:
+        _comprobar_modo(modo)
+        return [_aplicar(operacion, funcion, trozo) for trozo in trozos]
+    ejecutor, argumento = _ejecutor(modo, funcion, trabajadores)
+    with ejecutor:
+        return _enviar(ejecutor, argumento, operacion, trozos, ordenado)
+
+def paralelo_map(funcion, lista, modo='hilos', trabajadores=None, tamano_trozo=None, ordenado=True):
+    # Con ordenado=False los trozos se devuelven según terminan (el orden dentro de cada trozo se mantiene)
+    resultados = _paralelo('map', funcion, lista, modo, trabajadores, tamano_trozo, ordenado)
+    return [elemento for trozo in resultados for elemento in trozo]
+
+def paralelo_filter(funcion, lista, modo='hilos', trabajadores=None, tamano_trozo=None, ordenado=True):
+    resultados = _paralelo('filter', funcion, lista, modo, trabajadores, tamano_trozo, ordenado)
+    return [elemento for trozo in resultados for elemento in trozo]
+
+def paralelo_reduce(funcion, lista, inicial=_SIN_INICIAL, modo='hilos', trabajadores=None, tamano_trozo=None):
+    # Reducción en árbol: cada trozo se reduce por separado y los resultados parciales se combinan
+    # por parejas, nivel a nivel, en el mismo pool. Sólo es equivalente a reduce() si la operación
+    # es asociativa (como lambda_add); no hace falta que sea conmutativa porque se respeta el orden.
+    lista = list(lista)
+    if not lista:
+        if inicial is _SIN_INICIAL:
+            raise TypeError("paralelo_reduce() de una secuencia vacía sin valor inicial")
+        return inicial
+    trabajadores = _trabajadores(trabajadores)
+    trozos = _trozos(lista, tamano_trozo, trabajadores)
+    if len(trozos) <= 1 or trabajadores == 1:
+        _comprobar_modo(modo)
+        resultado = reduce(funcion, lista)
+    else:
+        ejecutor, argumento = _ejecutor(modo, funcion, trabajadores)
+        with ejecutor:
+            parciales = _enviar(ejecutor, argumento, 'reduce', trozos, True)
+            while len(parciales) > 1:
+                parejas = [parciales[i:i + 2] for i in range(0, len(parciales), 2)]
+                parciales = _enviar(ejecutor, argumento, 'reduce', parejas, True)
+        resultado = parciales[0]
+    if inicial is _SIN_INICIAL:
+        return resultado
+    return funcion(inicial, resultado)
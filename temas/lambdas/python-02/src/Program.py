@@ -1,5 +1,8 @@
 from functools import reduce
 
+from Memoizacion import memoizar
+from Stream import Stream
+
 # === LAMBDAS ===
 lambda_add = lambda x, y: x + y
 lambda_even = lambda x: x % 2 == 0
@@ -20,7 +23,9 @@ def orden_superior_sorted(funcion, lista):
     return sorted(lista, key=funcion)
 
 # === CLAUSURA ===
+# Caché de fábrica: closure(n) con el mismo n devuelve la misma función en lugar de crear otra
 
+@memoizar(maxsize=256)
 def closure(n):
     return lambda x: x * n
 
@@ -37,8 +42,7 @@ class FiltrarPorPar:
 # === PROCESAMIENTO ESTILO STREAM ===
 
 def ejemplo_procesamiento_stream(lista):
-    return reduce(
-        lambda x, y: x + y,
-        map(lambda x: x ** 2,
-            filter(lambda x: x % 2 == 0, lista))
-    )
+    return (Stream(lista)
+            .filter(lambda x: x % 2 == 0)
+            .map(lambda x: x ** 2)
+            .reduce(lambda x, y: x + y))
@@ -0,0 +1,147 @@
+from functools import reduce as _reduce
+from itertools import islice
+
+import Vectorizado
+
+# === STREAM PEREZOSO ===
+# Cada operación intermedia devuelve un Stream nuevo con una etapa más; no se evalúa nada
+# hasta una operación terminal (reduce, collect, count, iteración), que recorre la fuente
+# una sola vez y sin listas intermedias.
+
+_SIN_INICIAL = object()
+
+# Etapas elemento a elemento que se fusionan en un único generador
+_FUSIONABLES = ('map', 'filter', 'flat_map', 'distinct')
+
+def _codigo_segmento(etapas):
+    # Genera el código de un generador que aplica varias etapas seguidas en un solo bucle
+    espacio, inicio, cuerpo = {}, [], []
+    nivel = 2
+    for i, (tipo, funcion) in enumerate(etapas):
+        nombre = f"_e{i}"
+        espacio[nombre] = funcion
+        sangria = "    " * nivel
+        if tipo == 'map':
+            cuerpo.append(f"{sangria}x = {nombre}(x)")
+            continue
+        if tipo == 'filter':
+            cuerpo.append(f"{sangria}if {nombre}(x):")
+        elif tipo == 'flat_map':
+            cuerpo.append(f"{sangria}for x in {nombre}(x):")
+        else:
+            inicio.append(f"    _vistos{i} = set()")
+            clave = "x" if funcion is None else f"{nombre}(x)"
+            cuerpo += [f"{sangria}_clave = {clave}",
+                       f"{sangria}if _clave not in _vistos{i}:",
+                       f"{sangria}    _vistos{i}.add(_clave)"]
+        nivel += 1
+    cuerpo.append("    " * nivel + "yield x")
+    return "\n".join(["def _segmento(_fuente):", *inicio, "    for x in _fuente:", *cuerpo]), espacio
+
+def _fusionar(etapas):
+    codigo, espacio = _codigo_segmento(etapas)
+    exec(codigo, espacio)
+    return espacio['_segmento']
+
+def _trozos(iterable, tamano):
+    iterador = iter(iterable)
+    while True:
+        trozo = list(islice(iterador, tamano))
+        if not trozo:
+            return
+        yield trozo
+
+class Stream:
+    def __init__(self, fuente, etapas=()):
+        self._fuente = fuente
+        self._etapas = tuple(etapas)
+
+    @classmethod
+    def of(cls, *valores):
+        return cls(valores)
+
+    def _con(self, tipo, argumento):
+        return Stream(self._fuente, self._etapas + ((tipo, argumento),))
+
+    # === OPERACIONES INTERMEDIAS (perezosas) ===
+
+    def map(self, funcion):
+        return self._con('map', funcion)
+
+    def filter(self, predicado):
+        return self._con('filter', predicado)
+
+    def flat_map(self, funcion):
+        return self._con('flat_map', funcion)
+
+    def distinct(self, clave=None):
+        return self._con('distinct', clave)
+
+    def take(self, n):
+        return self._con('take', n)
+
+    def skip(self, n):
+        return self._con('skip', n)
+
+    def chunk(self, tamano):
+        if tamano < 1:
+            raise ValueError("El tamaño de los trozos debe ser al menos 1")
+        return self._con('chunk', tamano)
+
+    # Ordenar necesita todos los elementos: es la única etapa que materializa una lista
+    def sorted(self, clave=None, reverse=False):
+        return self._con('sorted', (clave, reverse))
+
+    # Construye la cadena de iteradores: las etapas elemento a elemento consecutivas se
+    # fusionan en un generador; take/skip/chunk/sorted hacen de frontera entre segmentos
+    def __iter__(self):
+        iterador = iter(Vectorizado.como_python(self._fuente))
+        pendientes = []
+        for tipo, argumento in self._etapas:
+            if tipo in _FUSIONABLES:
+                pendientes.append((tipo, argumento))
+                continue
+            if pendientes:
+                iterador = _fusionar(pendientes)(iterador)
+                pendientes = []
+            if tipo == 'take':
+                iterador = islice(iterador, max(argumento, 0))
+            elif tipo == 'skip':
+                iterador = islice(iterador, max(argumento, 0), None)
+            elif tipo == 'chunk':
+                iterador = _trozos(iterador, argumento)
+            else:
+                clave, reverse = argumento
+                iterador = iter(sorted(iterador, key=clave, reverse=reverse))
+        if pendientes:
+            iterador = _fusionar(pendientes)(iterador)
+        return iterador
+
+    # === OPERACIONES TERMINALES ===
+    # reduce, collect y count prueban primero la ruta vectorizada con NumPy (Vectorizado.py), que sólo
+    # se usa con fuentes numéricas grandes y funciones aritméticas puras; si no, se recorre en Python
+
+    def reduce(self, funcion, inicial=_SIN_INICIAL):
+        sin_inicial = inicial is _SIN_INICIAL
+        resultado = Vectorizado.reducir(self._fuente, self._etapas, funcion, () if sin_inicial else (inicial,))
+        if resultado is not Vectorizado.NO_APLICABLE:
+            return resultado
+        if sin_inicial:
+            return _reduce(funcion, self)
+        return _reduce(funcion, self, inicial)
+
+    def collect(self, colector=list):
+        elementos = Vectorizado.recolectar(self._fuente, self._etapas)
+        if elementos is Vectorizado.NO_APLICABLE:
+            elementos = iter(self)
+        return colector(elementos)
+
+    def count(self):
+        total = Vectorizado.contar(self._fuente, self._etapas)
+        if total is not Vectorizado.NO_APLICABLE:
+            return total
+        return sum(1 for _ in self)
+
+    def for_each(self, funcion):
+        for elemento in self:
+            funcion(elemento)
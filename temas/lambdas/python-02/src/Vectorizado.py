@@ -0,0 +1,312 @@
+import dis
+import inspect
+import operator
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# === RUTA VECTORIZADA CON NUMPY ===
+# Un Stream numérico grande (range, lista de int o de float, array) cuyas etapas son map/filter
+# con lambdas aritméticas se ejecuta como operaciones sobre arrays en lugar de elemento a elemento.
+# Sólo se vectorizan funciones cuyo código es una expresión aritmética o de comparación sobre su
+# argumento, constantes numéricas y variables de clausura numéricas (lambda_even, closure(n),
+# lambda x: x ** 2...): aplicadas a un array hacen lo mismo que elemento a elemento y no tienen
+# efectos secundarios. Cualquier otra función, fuente o situación en la que NumPy no daría
+# exactamente el mismo resultado que Python (desbordamientos de int64, división por cero...)
+# vuelve a la ruta en Python puro.
+
+HAY_NUMPY = np is not None
+
+# Por debajo de este tamaño la conversión a array no compensa
+UMBRAL = 10_000
+# Elementos por bloque: la fuente se procesa por partes para no crear arrays del tamaño de la entrada
+BLOQUE = 1 << 16
+
+NO_APLICABLE = object()
+
+_LIMITE_INT64 = 2 ** 63
+# Por encima de 2^53 los enteros no se representan exactamente en float64
+_LIMITE_EXACTO = 2.0 ** 53
+
+_OPERADORES = {'+', '-', '*', '/', '//', '%', '**', '&', '|', '^', '<<', '>>'}
+_INSTRUCCIONES = {'RESUME', 'NOP', 'CACHE', 'COPY_FREE_VARS', 'RETURN_VALUE', 'UNARY_NEGATIVE', 'UNARY_INVERT',
+                  'LOAD_CONST', 'LOAD_SMALL_INT', 'LOAD_DEREF', 'BINARY_OP', 'COMPARE_OP',
+                  'LOAD_FAST', 'LOAD_FAST_CHECK', 'LOAD_FAST_LOAD_FAST', 'LOAD_FAST_BORROW',
+                  'LOAD_FAST_BORROW_LOAD_FAST_BORROW'}
+
+class _NoVectorizable(Exception):
+    pass
+
+def _es_numero(valor):
+    if type(valor) is int:
+        return -_LIMITE_INT64 < valor < _LIMITE_INT64
+    return type(valor) is float
+
+def _codigo(funcion, aridad):
+    # Devuelve el código, los nombres de los argumentos utilizables y las variables de clausura
+    codigo = getattr(funcion, '__code__', None)
+    libres = getattr(funcion, '__closure__', None)
+    ignorados = 0
+    if codigo is None:
+        # Objeto invocable como FiltrarPorPar: se analiza __call__ sin permitir el uso de self
+        llamada = getattr(type(funcion), '__call__', None)
+        codigo = getattr(llamada, '__code__', None)
+        libres = getattr(llamada, '__closure__', None)
+        ignorados = 1
+    if codigo is None or codigo.co_argcount != aridad + ignorados or codigo.co_kwonlyargcount:
+        return None
+    if codigo.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+        return None
+    variables = dict(zip(codigo.co_freevars, (celda.cell_contents for celda in libres or ())))
+    return codigo, set(codigo.co_varnames[ignorados:aridad + ignorados]), variables
+
+def es_vectorizable(funcion, aridad=1):
+    # True si la función es una expresión aritmética pura sobre sus argumentos
+    try:
+        datos = _codigo(funcion, aridad)
+    except ValueError:
+        # Celda de clausura todavía vacía
+        return False
+    if datos is None:
+        return False
+    codigo, argumentos, variables = datos
+    for instruccion in dis.get_instructions(codigo):
+        nombre = instruccion.opname
+        if nombre not in _INSTRUCCIONES:
+            return False
+        if nombre.startswith('LOAD_FAST'):
+            nombres = instruccion.argval if isinstance(instruccion.argval, tuple) else (instruccion.argval,)
+            if not argumentos.issuperset(nombres):
+                return False
+        elif nombre in ('LOAD_CONST', 'LOAD_SMALL_INT') and not _es_numero(instruccion.argval):
+            return False
+        elif nombre == 'LOAD_DEREF' and not _es_numero(variables.get(instruccion.argval)):
+            return False
+        elif nombre == 'BINARY_OP' and instruccion.argrepr not in _OPERADORES:
+            return False
+    return True
+
+class _Simbolo:
+    # Valor simbólico para reconocer qué operación hace una función de reducción
+    def __init__(self, nombre):
+        self.nombre = nombre
+
+    def __add__(self, otro):
+        return ('+', self.nombre, getattr(otro, 'nombre', otro))
+
+    def __mul__(self, otro):
+        return ('*', self.nombre, getattr(otro, 'nombre', otro))
+
+_REDUCCIONES = ((operator.add, 'suma'), (operator.mul, 'producto'), (max, 'max'), (min, 'min'))
+
+def _operacion_reduccion(funcion):
+    # 'suma', 'producto', 'max', 'min' o None si la función no es una de ellas
+    for conocida, operacion in _REDUCCIONES:
+        if funcion is conocida:
+            return operacion
+    if not es_vectorizable(funcion, 2):
+        return None
+    try:
+        expresion = funcion(_Simbolo('a'), _Simbolo('b'))
+    except Exception:
+        return None
+    if expresion in (('+', 'a', 'b'), ('+', 'b', 'a')):
+        return 'suma'
+    if expresion in (('*', 'a', 'b'), ('*', 'b', 'a')):
+        return 'producto'
+    return None
+
+if HAY_NUMPY:
+    # Subclase de array para los enteros: comprueba cada operación que podría desbordar int64
+    # (NumPy no avisa en los arrays) o perder precisión al mezclarse con float
+    _PUEDEN_DESBORDAR = {np.add, np.subtract, np.multiply, np.power, np.negative,
+                         np.floor_divide, np.left_shift, np.absolute}
+
+    class _Enteros(np.ndarray):
+        def __array_ufunc__(self, ufunc, metodo, *entradas, **kwargs):
+            if metodo != '__call__' or kwargs:
+                raise _NoVectorizable(ufunc.__name__)
+            entradas = [e.view(np.ndarray) if isinstance(e, _Enteros) else e for e in entradas]
+            resultado = ufunc(*entradas)
+            enteros = [e for e in entradas if isinstance(e, np.ndarray) and e.dtype.kind in 'iu']
+            flotantes = resultado.dtype.kind == 'f' or any(
+                isinstance(e, float) or (isinstance(e, np.ndarray) and e.dtype.kind == 'f') for e in entradas)
+            if flotantes and any(e.size and np.abs(e).max() >= _LIMITE_EXACTO for e in enteros):
+                raise _NoVectorizable(ufunc.__name__)
+            if resultado.dtype.kind not in 'iu':
+                return resultado
+            if ufunc in _PUEDEN_DESBORDAR:
+                with np.errstate(over='ignore', invalid='ignore'):
+                    sombra = ufunc(*[np.asarray(e, dtype=np.float64) for e in entradas])
+                if not np.all(np.abs(sombra) < 2.0 ** 62):
+                    raise _NoVectorizable(ufunc.__name__)
+            return resultado.view(_Enteros)
+
+def _bloques(fuente):
+    # Genera la fuente en arrays de int64 o float64 de BLOQUE elementos, para que la memoria no
+    # dependa del tamaño de la entrada; lanza _NoVectorizable si no es numérica y homogénea
+    if isinstance(fuente, range):
+        if not (_es_numero(fuente[0]) and _es_numero(fuente[-1])):
+            raise _NoVectorizable('range fuera de int64')
+        for inicio in range(0, len(fuente), BLOQUE):
+            trozo = fuente[inicio:inicio + BLOQUE]
+            yield np.arange(trozo.start, trozo.stop, trozo.step, dtype=np.int64)
+        return
+    if isinstance(fuente, np.ndarray):
+        if fuente.ndim != 1 or fuente.dtype not in (np.int64, np.float64):
+            raise _NoVectorizable('array no numérico')
+        for inicio in range(0, len(fuente), BLOQUE):
+            yield fuente[inicio:inicio + BLOQUE]
+        return
+    if not isinstance(fuente, (list, tuple)):
+        raise _NoVectorizable('fuente no numérica')
+    tipo = type(fuente[0])
+    if tipo not in (int, float):
+        raise _NoVectorizable('fuente no numérica')
+    for inicio in range(0, len(fuente), BLOQUE):
+        trozo = fuente[inicio:inicio + BLOQUE]
+        # Sin esta comprobación np.array convertiría en silencio bool a int o mezclaría int y float
+        if set(map(type, trozo)) != {tipo}:
+            raise _NoVectorizable('fuente no homogénea')
+        try:
+            yield np.fromiter(trozo, dtype=np.int64 if tipo is int else np.float64, count=len(trozo))
+        except OverflowError:
+            raise _NoVectorizable('entero fuera de int64') from None
+
+def _aplicar(funcion, datos):
+    if datos.dtype.kind == 'i':
+        datos = datos.view(_Enteros)
+    elif datos.dtype.kind == 'b':
+        # En NumPy True + True es True; en Python, 2
+        raise _NoVectorizable('booleanos')
+    resultado = np.asarray(funcion(datos))
+    if resultado.shape != datos.shape:
+        raise _NoVectorizable('resultado de otra forma')
+    return resultado
+
+def _ejecutar(fuente, etapas):
+    # Genera por bloques el resultado de aplicar las etapas; lanza _NoVectorizable si no se puede
+    try:
+        if len(fuente) < UMBRAL:
+            raise _NoVectorizable('fuente pequeña')
+    except TypeError:
+        raise _NoVectorizable('fuente sin longitud') from None
+    for tipo, argumento in etapas:
+        if tipo not in ('map', 'filter', 'take', 'skip') or (tipo in ('map', 'filter') and not es_vectorizable(argumento)):
+            raise _NoVectorizable(tipo)
+    # Elementos que les quedan por saltar o tomar a las etapas skip y take
+    restantes = [max(argumento, 0) if tipo in ('take', 'skip') else None for tipo, argumento in etapas]
+    tipos = set()
+    with np.errstate(all='raise', under='ignore'):
+        for datos in _bloques(fuente):
+            for posicion, (tipo, argumento) in enumerate(etapas):
+                if tipo == 'map':
+                    datos = _aplicar(argumento, datos)
+                elif tipo == 'filter':
+                    datos = datos[_aplicar(argumento, datos).astype(bool)]
+                elif tipo == 'skip':
+                    saltados = min(restantes[posicion], len(datos))
+                    restantes[posicion] -= saltados
+                    datos = datos[saltados:]
+                else:
+                    datos = datos[:restantes[posicion]]
+                    restantes[posicion] -= len(datos)
+            datos = datos.view(np.ndarray)
+            tipos.add(datos.dtype.kind)
+            if len(tipos) > 1:
+                raise _NoVectorizable('bloques de distinto tipo')
+            yield datos
+            if 0 in (restantes[posicion] for posicion, (tipo, _) in enumerate(etapas) if tipo == 'take'):
+                return
+
+def _suma_entera(datos):
+    # Suma exacta de int64 sin desbordar: se suman por separado los 32 bits altos y los bajos
+    altos = int((datos >> 32).sum())
+    bajos = int((datos & 0xFFFFFFFF).sum())
+    return (altos << 32) + bajos
+
+def _producto_entero(datos):
+    # En un producto de enteros distintos de cero cada resultado parcial es menor que el total
+    with np.errstate(all='ignore'):
+        sombra = np.prod(datos.astype(np.float64))
+    if not abs(sombra) < 2.0 ** 62:
+        raise _NoVectorizable('producto')
+    return int(np.prod(datos))
+
+def _acumular(datos, operacion, acumulado):
+    # Combina un bloque con el resultado acumulado (None al empezar) como lo haría reduce()
+    if operacion in ('max', 'min'):
+        if datos.dtype.kind == 'f' and np.isnan(datos).any():
+            raise _NoVectorizable('nan')
+        parcial = (datos.max() if operacion == 'max' else datos.min()).item()
+        if acumulado is None:
+            return parcial
+        return max(acumulado, parcial) if operacion == 'max' else min(acumulado, parcial)
+    if datos.dtype.kind == 'i':
+        parcial = _suma_entera(datos) if operacion == 'suma' else _producto_entero(datos)
+        if acumulado is None:
+            return parcial
+        return acumulado + parcial if operacion == 'suma' else acumulado * parcial
+    # cumsum y cumprod acumulan de izquierda a derecha, con el mismo redondeo que reduce()
+    if acumulado is not None:
+        datos = np.concatenate(([acumulado], datos))
+    acumulados = np.cumsum(datos) if operacion == 'suma' else np.cumprod(datos)
+    return acumulados[-1].item()
+
+def reducir(fuente, etapas, funcion, inicial=()):
+    # inicial es una tupla vacía o con el valor inicial de reduce(); devuelve NO_APLICABLE si no se vectoriza
+    operacion = _operacion_reduccion(funcion) if HAY_NUMPY else None
+    if operacion is None:
+        return NO_APLICABLE
+    acumulado = inicial[0] if inicial else None
+    try:
+        for datos in _ejecutar(fuente, etapas):
+            if datos.dtype.kind not in 'if':
+                return NO_APLICABLE
+            # El valor inicial tiene que ser del mismo tipo que los elementos para dar el mismo resultado
+            if inicial and type(inicial[0]) is not (int if datos.dtype.kind == 'i' else float):
+                return NO_APLICABLE
+            if len(datos):
+                with np.errstate(all='raise', under='ignore'):
+                    acumulado = _acumular(datos, operacion, acumulado)
+    except (_NoVectorizable, ArithmeticError, ValueError, TypeError):
+        return NO_APLICABLE
+    # Sin elementos reduce() lanza TypeError: se deja a la ruta en Python
+    if acumulado is None:
+        return NO_APLICABLE
+    return acumulado
+
+def como_python(fuente):
+    # La ruta en Python recorre un array de NumPy de una dimensión como int y float de Python
+    # (convertidos por bloques con tolist()), igual que los devuelve la ruta vectorizada, para que
+    # el tipo de los elementos no dependa de la ruta elegida; cualquier otra fuente se deja igual
+    if HAY_NUMPY and isinstance(fuente, np.ndarray) and fuente.ndim == 1:
+        return chain.from_iterable(fuente[inicio:inicio + BLOQUE].tolist() for inicio in range(0, len(fuente), BLOQUE))
+    return fuente
+
+def recolectar(fuente, etapas):
+    # Lista con los elementos resultantes, o NO_APLICABLE
+    if not HAY_NUMPY:
+        return NO_APLICABLE
+    # Con una lista de entrada y sólo etapas map, convertirla a array y el resultado otra vez a lista
+    # cuesta tanto como aplicar las funciones en Python
+    if isinstance(fuente, (list, tuple)) and all(tipo == 'map' for tipo, _ in etapas):
+        return NO_APLICABLE
+    elementos = []
+    try:
+        for datos in _ejecutar(fuente, etapas):
+            elementos += datos.tolist()
+    except (_NoVectorizable, ArithmeticError, ValueError, TypeError):
+        return NO_APLICABLE
+    return elementos
+
+def contar(fuente, etapas):
+    if not HAY_NUMPY:
+        return NO_APLICABLE
+    try:
+        return sum(len(datos) for datos in _ejecutar(fuente, etapas))
+    except (_NoVectorizable, ArithmeticError, ValueError, TypeError):
+        return NO_APLICABLE
@@ -0,0 +1,136 @@
+import unittest
+import sys
+import os
+import threading
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Program import closure, orden_superior_map
+from Memoizacion import memoizar
+
+class RelojFalso:
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+class TestMemoizacion(unittest.TestCase):
+
+    def test_aciertos_y_fallos(self):
+        llamadas = []
+        @memoizar
+        def cuadrado(x):
+            llamadas.append(x)
+            return x * x
+        self.assertEqual(orden_superior_map(cuadrado, [1, 2, 1, 2, 3, 1]), [1, 4, 1, 4, 9, 1])
+        self.assertEqual(llamadas, [1, 2, 3])
+        estadisticas = cuadrado.estadisticas()
+        self.assertEqual((estadisticas['aciertos'], estadisticas['fallos'], estadisticas['entradas']), (3, 3, 3))
+        self.assertEqual(estadisticas['tasa_aciertos'], 0.5)
+        self.assertGreater(estadisticas['bytes'], 0)
+        cuadrado.limpiar()
+        self.assertEqual((cuadrado.estadisticas()['entradas'], cuadrado.estadisticas()['bytes']), (0, 0))
+
+    def test_expulsion_lru(self):
+        @memoizar(maxsize=2)
+        def doble(x):
+            return [x, x]
+        a = doble(1)
+        doble(2)
+        self.assertIs(doble(1), a)
+        doble(3)
+        # 2 era la entrada usada hace más tiempo
+        self.assertIs(doble(1), a)
+        self.assertEqual(doble.estadisticas()['expulsiones'], 1)
+        self.assertEqual(doble.estadisticas()['entradas'], 2)
+        fallos = doble.estadisticas()['fallos']
+        doble(2)
+        self.assertEqual(doble.estadisticas()['fallos'], fallos + 1)
+
+    def test_caducidad(self):
+        reloj = RelojFalso()
+        @memoizar(ttl=10, reloj=reloj)
+        def ahora(x):
+            return (x, reloj.ahora)
+        self.assertEqual(ahora(1), (1, 0.0))
+        reloj.ahora = 9.5
+        self.assertEqual(ahora(1), (1, 0.0))
+        reloj.ahora = 10.0
+        self.assertEqual(ahora(1), (1, 10.0))
+        self.assertEqual(ahora.estadisticas()['caducadas'], 1)
+
+    def test_argumentos(self):
+        @memoizar
+        def sumar(*valores, inicio=0):
+            return sum(valores, inicio)
+        self.assertEqual(sumar(1, 2, inicio=3), 6)
+        self.assertEqual(sumar(1, 2, inicio=3), 6)
+        self.assertEqual(sumar(1.0, 2), 3.0)
+        self.assertIsInstance(sumar(1.0, 2), float)
+        # Los argumentos no hashables no se cachean
+        self.assertEqual(sumar([1], [2], inicio=[]), [1, 2])
+        self.assertEqual(sumar.estadisticas()['aciertos'], 2)
+        with self.assertRaises(ValueError):
+            memoizar(maxsize=0)
+
+    def test_fabrica_closure(self):
+        self.assertIs(closure(3), closure(3))
+        self.assertIsNot(closure(3), closure(4))
+        self.assertIsNot(closure(3), closure(3.0))
+        self.assertEqual(closure(3.0)(2), 6.0)
+        self.assertEqual(closure([0])(2), [0, 0])
+
+    def test_hilos(self):
+        llamadas = []
+        @memoizar(maxsize=8)
+        def lenta(x):
+            llamadas.append(x)
+            time.sleep(0.001)
+            return object()
+        resultados = {}
+        def trabajar(indice):
+            resultados[indice] = [lenta(i % 16) for i in range(200)]
+        hilos = [threading.Thread(target=trabajar, args=(i,)) for i in range(8)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        estadisticas = lenta.estadisticas()
+        self.assertEqual(estadisticas['aciertos'] + estadisticas['fallos'], 8 * 200)
+        self.assertEqual(estadisticas['fallos'], len(llamadas))
+        self.assertLessEqual(estadisticas['entradas'], 8)
+        # Los bytes se restan al expulsar: al vaciar la caché vuelven a cero
+        lenta.limpiar()
+        self.assertEqual(lenta.estadisticas()['bytes'], 0)
+
+    def test_mismo_objeto_en_carrera(self):
+        barrera = threading.Barrier(4)
+        @memoizar
+        def crear(n):
+            barrera.wait(timeout=5)
+            return lambda x: x * n
+        resultados = []
+        hilos = [threading.Thread(target=lambda: resultados.append(crear(5))) for _ in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        self.assertEqual(len({id(funcion) for funcion in resultados}), 1)
+
+    def test_entradas_repetidas_se_calculan_una_vez(self):
+        llamadas = []
+        def costosa(n):
+            llamadas.append(n)
+            return sum(i * i for i in range(n))
+        datos = [20_000 + i % 10 for i in range(300)]
+        memoizada = memoizar(costosa)
+        self.assertEqual(orden_superior_map(memoizada, datos), [sum(i * i for i in range(n)) for n in datos])
+        # 10 valores distintos entre 300: 10 fallos que calculan y 290 aciertos (la aceleración se mide en bench_memoizacion)
+        self.assertEqual(sorted(llamadas), list(range(20_000, 20_010)))
+        estadisticas = memoizada.estadisticas()
+        self.assertEqual((estadisticas['fallos'], estadisticas['aciertos']), (10, 290))
+
+if __name__ == "__main__":
+    unittest.main()
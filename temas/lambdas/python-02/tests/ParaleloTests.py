@@ -0,0 +1,78 @@
+import unittest
+import sys
+import os
+import random
+import threading
+from functools import reduce
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Program import lambda_add, lambda_even, closure, orden_superior_map, orden_superior_filter, orden_superior_reduce
+from Paralelo import paralelo_map, paralelo_filter, paralelo_reduce
+
+class TestParalelo(unittest.TestCase):
+
+    def setUp(self):
+        aleatorio = random.Random(17)
+        self.datos = [aleatorio.randint(-1000, 1000) for _ in range(1000)]
+
+    def test_map_igual_que_serie(self):
+        esperado = orden_superior_map(closure(3), self.datos)
+        for modo in ('hilos', 'procesos'):
+            for tamano in (None, 1, 7, 5000):
+                with self.subTest(modo=modo, tamano=tamano):
+                    self.assertEqual(paralelo_map(closure(3), self.datos, modo, 4, tamano), esperado)
+
+    def test_filter_igual_que_serie(self):
+        esperado = orden_superior_filter(lambda_even, self.datos)
+        for modo in ('hilos', 'procesos'):
+            with self.subTest(modo=modo):
+                self.assertEqual(paralelo_filter(lambda_even, self.datos, modo, 3, 64), esperado)
+
+    def test_reduce_en_arbol_igual_que_serie(self):
+        for modo in ('hilos', 'procesos'):
+            for tamano in (None, 1, 3, 100):
+                with self.subTest(modo=modo, tamano=tamano):
+                    self.assertEqual(paralelo_reduce(lambda_add, self.datos, modo=modo, trabajadores=4, tamano_trozo=tamano),
+                                     orden_superior_reduce(lambda_add, self.datos))
+
+    def test_reduce_respeta_el_orden(self):
+        # La concatenación es asociativa pero no conmutativa
+        palabras = [str(x) for x in range(200)]
+        self.assertEqual(paralelo_reduce(lambda_add, palabras, trabajadores=4, tamano_trozo=7), "".join(palabras))
+        self.assertEqual(paralelo_reduce(lambda_add, palabras, "<", trabajadores=4, tamano_trozo=7),
+                         reduce(lambda_add, palabras, "<"))
+
+    def test_reduce_vacio(self):
+        self.assertEqual(paralelo_reduce(lambda_add, [], 0), 0)
+        with self.assertRaises(TypeError):
+            paralelo_reduce(lambda_add, [])
+
+    def test_sin_orden_mismos_elementos(self):
+        # Sin orden los trozos llegan según terminan: se comprueban los elementos y que cada
+        # trozo sigue entero y en orden, no el orden en que terminan
+        resultado = paralelo_map(closure(2), range(40), trabajadores=4, tamano_trozo=10, ordenado=False)
+        self.assertEqual(sorted(resultado), list(range(0, 80, 2)))
+        trozos = sorted(resultado[i:i + 10] for i in range(0, 40, 10))
+        self.assertEqual(trozos, [list(range(i, i + 20, 2)) for i in range(0, 80, 20)])
+
+    def test_hilos_en_paralelo(self):
+        hilos = set()
+        barrera = threading.Barrier(4, timeout=5)
+        def esperar(x):
+            hilos.add(threading.get_ident())
+            barrera.wait()
+            return x
+        self.assertEqual(paralelo_map(esperar, range(4), trabajadores=4, tamano_trozo=1), [0, 1, 2, 3])
+        self.assertEqual(len(hilos), 4)
+
+    def test_parametros_no_validos(self):
+        with self.assertRaises(ValueError):
+            paralelo_map(closure(2), self.datos, modo='gpu')
+        with self.assertRaises(ValueError):
+            paralelo_map(closure(2), self.datos, tamano_trozo=0)
+        with self.assertRaises(ValueError):
+            paralelo_filter(lambda_even, self.datos, trabajadores=0)
+
+if __name__ == "__main__":
+    unittest.main()
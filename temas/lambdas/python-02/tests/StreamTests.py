@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+from functools import reduce
+from itertools import count
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Program import lambda_add, lambda_even, closure, orden_superior_map, orden_superior_filter, ejemplo_procesamiento_stream
+from Stream import Stream
+
+class TestStream(unittest.TestCase):
+
+    def setUp(self):
+        self.datos = [1, 2, 3, 4, 5]
+
+    def test_map_filter_reduce(self):
+        self.assertEqual(Stream(self.datos).filter(lambda_even).map(lambda x: x ** 2).reduce(lambda_add), 20)
+        self.assertEqual(ejemplo_procesamiento_stream(self.datos), 20)
+
+    def test_equivalente_a_las_funciones_de_orden_superior(self):
+        datos = list(range(100))
+        self.assertEqual(Stream(datos).map(closure(3)).collect(), orden_superior_map(closure(3), datos))
+        self.assertEqual(Stream(datos).filter(lambda_even).collect(), orden_superior_filter(lambda_even, datos))
+
+    def test_flat_map_distinct(self):
+        self.assertEqual(Stream(["ab", "bc"]).flat_map(list).distinct().collect(), ["a", "b", "c"])
+        self.assertEqual(Stream(["uno", "dos", "tres", "cuatro"]).distinct(len).collect(), ["uno", "tres", "cuatro"])
+
+    def test_take_skip_chunk(self):
+        self.assertEqual(Stream(range(10)).skip(2).take(3).collect(), [2, 3, 4])
+        self.assertEqual(Stream(range(7)).chunk(3).collect(), [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(Stream(range(3)).take(0).collect(), [])
+        with self.assertRaises(ValueError):
+            Stream(range(3)).chunk(0)
+
+    def test_es_perezoso(self):
+        llamadas = []
+        stream = Stream(count()).map(lambda x: llamadas.append(x) or x * 2).filter(lambda_even).take(3)
+        self.assertEqual(llamadas, [])
+        self.assertEqual(stream.collect(), [0, 2, 4])
+        # take deja de pedir elementos en cuanto tiene los suficientes
+        self.assertEqual(llamadas, [0, 1, 2])
+
+    def test_fuente_infinita(self):
+        self.assertEqual(Stream(count(1)).map(lambda x: x * x).filter(lambda x: x % 3 == 1).take(4).collect(), [1, 4, 16, 25])
+
+    def test_reduce_con_y_sin_inicial(self):
+        self.assertEqual(Stream([]).reduce(lambda_add, 0), 0)
+        with self.assertRaises(TypeError):
+            Stream([]).reduce(lambda_add)
+
+    def test_collect_count_sorted(self):
+        self.assertEqual(Stream.of(3, 1, 2, 3).collect(set), {1, 2, 3})
+        self.assertEqual(Stream.of(3, 1, 2).count(), 3)
+        self.assertEqual(Stream(["python", "hola", "universidad"]).sorted(len).collect(), ["hola", "python", "universidad"])
+        self.assertEqual(Stream.of(3, 1, 2).sorted(reverse=True).take(2).collect(), [3, 2])
+
+    def test_inmutable_y_reutilizable(self):
+        base = Stream(range(10))
+        pares = base.filter(lambda_even)
+        self.assertEqual(base.count(), 10)
+        self.assertEqual(pares.collect(), [0, 2, 4, 6, 8])
+        self.assertEqual(pares.collect(), [0, 2, 4, 6, 8])
+
+    def test_cadenas_aleatorias_equivalen_a_listas(self):
+        import random
+        rnd = random.Random(0)
+        for _ in range(200):
+            datos = [rnd.randint(0, 20) for _ in range(rnd.randint(0, 40))]
+            stream, esperado = Stream(datos), list(datos)
+            for _ in range(rnd.randint(1, 6)):
+                operacion = rnd.choice(['map', 'filter', 'flat_map', 'distinct', 'take', 'skip'])
+                if operacion == 'map':
+                    stream, esperado = stream.map(closure(2)), [x * 2 for x in esperado]
+                elif operacion == 'filter':
+                    stream, esperado = stream.filter(lambda_even), [x for x in esperado if x % 2 == 0]
+                elif operacion == 'flat_map':
+                    stream, esperado = stream.flat_map(lambda x: [x, x + 1]), [y for x in esperado for y in (x, x + 1)]
+                elif operacion == 'distinct':
+                    stream, esperado = stream.distinct(), list(dict.fromkeys(esperado))
+                elif operacion == 'take':
+                    n = rnd.randint(0, 10)
+                    stream, esperado = stream.take(n), esperado[:n]
+                else:
+                    n = rnd.randint(0, 10)
+                    stream, esperado = stream.skip(n), esperado[n:]
+            self.assertEqual(stream.collect(), esperado)
+            self.assertEqual(stream.reduce(lambda_add, 0), reduce(lambda_add, esperado, 0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import sys
+import os
+import random
+from functools import reduce
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Program import lambda_add, lambda_even, closure, FiltrarPorPar, OrdenarPorLongitud, ejemplo_procesamiento_stream
+from Stream import Stream
+import Vectorizado
+from Vectorizado import NO_APLICABLE, es_vectorizable
+
+@unittest.skipUnless(Vectorizado.HAY_NUMPY, "NumPy no está instalado")
+class TestVectorizado(unittest.TestCase):
+
+    def setUp(self):
+        aleatorio = random.Random(19)
+        self.enteros = [aleatorio.randint(-10 ** 6, 10 ** 6) for _ in range(50_000)]
+        self.reales = [aleatorio.uniform(-100, 100) for _ in range(50_000)]
+
+    def test_reconoce_funciones_aritmeticas(self):
+        self.assertTrue(es_vectorizable(lambda_even))
+        self.assertTrue(es_vectorizable(closure(3)))
+        self.assertTrue(es_vectorizable(FiltrarPorPar()))
+        self.assertTrue(es_vectorizable(lambda x: -x ** 2 // 3 + 1.5 > x))
+        self.assertFalse(es_vectorizable(OrdenarPorLongitud()))
+        self.assertFalse(es_vectorizable(lambda x: abs(x)))
+        self.assertFalse(es_vectorizable(lambda x: x if x > 0 else -x))
+        self.assertFalse(es_vectorizable(closure("a")))
+        self.assertFalse(es_vectorizable(lambda_add))
+
+    def test_paridad_enteros(self):
+        cadenas = [
+            lambda s: s.filter(lambda_even).map(lambda x: x ** 2),
+            lambda s: s.map(closure(7)).filter(FiltrarPorPar()).skip(100).take(20_000),
+            lambda s: s.map(lambda x: x // 3 - x % 5).filter(lambda x: x > -1000),
+            lambda s: s.map(lambda x: x / 4),
+        ]
+        for fuente in (self.enteros, tuple(self.enteros), range(-30_000, 90_000, 3)):
+            for crear in cadenas:
+                stream = crear(Stream(fuente))
+                esperado = list(iter(stream))
+                self.assertEqual(stream.collect(), esperado)
+                self.assertEqual(stream.count(), len(esperado))
+                # Con repr también se comprueba que el tipo del resultado (int o float) es el mismo
+                for funcion in (lambda_add, max, min):
+                    with self.subTest(funcion=funcion):
+                        self.assertEqual(repr(stream.reduce(funcion)), repr(reduce(funcion, esperado)))
+                self.assertEqual(stream.reduce(lambda_add, 10), reduce(lambda_add, esperado, 10))
+
+    def test_paridad_producto(self):
+        signos = Stream(range(50_000)).map(lambda x: 1 - x % 2 * 2)
+        self.assertIsNot(Vectorizado.reducir(range(50_000), signos._etapas, lambda x, y: y * x), NO_APLICABLE)
+        self.assertEqual(signos.reduce(lambda x, y: y * x), 1)
+        reales = signos.map(lambda x: x * 1.0001).skip(1)
+        self.assertEqual(reales.reduce(lambda x, y: x * y), reduce(lambda x, y: x * y, list(iter(reales))))
+
+    def test_paridad_reales(self):
+        # La suma se acumula de izquierda a derecha, así que coincide bit a bit con reduce()
+        stream = Stream(self.reales).map(lambda x: x * 1.5 - 2).filter(lambda x: x > 0)
+        esperado = list(iter(stream))
+        self.assertEqual(stream.collect(), esperado)
+        self.assertEqual(stream.reduce(lambda_add), reduce(lambda_add, esperado))
+        self.assertEqual(stream.reduce(lambda_add, 0.25), reduce(lambda_add, esperado, 0.25))
+        self.assertEqual(stream.reduce(max), max(esperado))
+
+    def test_usa_la_ruta_vectorizada(self):
+        etapas = Stream(range(100_000)).filter(lambda_even).map(lambda x: x ** 2)._etapas
+        self.assertEqual(Vectorizado.reducir(range(100_000), etapas, lambda_add), ejemplo_procesamiento_stream(range(100_000)))
+        self.assertEqual(ejemplo_procesamiento_stream(range(100_000)), sum(x * x for x in range(0, 100_000, 2)))
+
+    def test_vuelve_a_python(self):
+        llamadas = []
+        def con_efectos(x):
+            llamadas.append(x)
+            return x
+        self.assertIs(Vectorizado.reducir(self.enteros, [('map', con_efectos)], lambda_add), NO_APLICABLE)
+        self.assertEqual(Stream(self.enteros).map(con_efectos).reduce(lambda_add), sum(self.enteros))
+        self.assertEqual(len(llamadas), len(self.enteros))
+        # Reducción no reconocida, fuente pequeña, fuente mezclada y generador
+        self.assertIs(Vectorizado.reducir(self.enteros, (), lambda x, y: x - y), NO_APLICABLE)
+        self.assertIs(Vectorizado.reducir(self.enteros[:100], (), lambda_add), NO_APLICABLE)
+        self.assertIs(Vectorizado.recolectar(self.enteros + [1.5], ()), NO_APLICABLE)
+        self.assertIs(Vectorizado.contar(iter(self.enteros), ()), NO_APLICABLE)
+
+    def test_arrays_devuelven_tipos_de_python(self):
+        np = Vectorizado.np
+        # Arrays pequeños (sin vectorizar), grandes y grandes con una función no vectorizable
+        for fuente, funcion in ((np.arange(100), closure(1)), (np.arange(50_000), closure(1)),
+                                (np.arange(50_000), lambda x: abs(x)), (np.linspace(0, 1, 100), closure(1))):
+            stream = Stream(fuente).map(funcion)
+            tipo = int if fuente.dtype.kind == 'i' else float
+            with self.subTest(n=len(fuente), funcion=funcion):
+                self.assertEqual({type(x) for x in stream.collect()}, {tipo})
+                self.assertIs(type(stream.reduce(lambda_add)), tipo)
+
+    def test_mismo_resultado_donde_numpy_diferiria(self):
+        # Desbordamiento de int64: la ruta en Python da el entero exacto
+        grandes = range(3 * 10 ** 9, 3 * 10 ** 9 + 20_000)
+        self.assertEqual(Stream(grandes).map(lambda x: x ** 2).reduce(lambda_add), sum(x * x for x in grandes))
+        self.assertEqual(Stream(range(1, 20_001)).map(lambda x: x % 7 + 1).reduce(lambda x, y: x * y),
+                         reduce(lambda x, y: x * y, (x % 7 + 1 for x in range(1, 20_001))))
+        # Booleanos: en Python True + True es 2
+        self.assertEqual(Stream(self.enteros).map(lambda x: x > 0).reduce(lambda_add), sum(x > 0 for x in self.enteros))
+        self.assertEqual(Stream([True] * 20_000).reduce(lambda_add), 20_000)
+        # División por cero: Python lanza la excepción
+        with self.assertRaises(ZeroDivisionError):
+            Stream(range(-10_000, 10_000)).map(lambda x: 1 / x).collect()
+        with self.assertRaises(TypeError):
+            Stream(range(20_000)).filter(lambda x: x < 0).reduce(lambda_add)
+
+if __name__ == "__main__":
+    unittest.main()
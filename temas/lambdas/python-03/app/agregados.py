@@ -0,0 +1,183 @@
+import heapq
+import math
+from array import array
+from hashlib import blake2b
+
+# Hash de 64 bits estable entre procesos (hash() cambia con PYTHONHASHSEED),
+# necesario para poder fusionar sketches calculados en workers distintos
+def hash64(valor):
+    return int.from_bytes(blake2b(valor.encode('utf-8'), digest_size=8).digest(), 'little')
+
+# Top-K aproximado con Space-Saving: como mucho k contadores. Cada elemento guarda
+# (cuenta, error); la cuenta real está en [cuenta - error, cuenta]. Cualquier elemento
+# con frecuencia mayor que n/k está garantizado entre los contadores.
+class SpaceSaving:
+    def __init__(self, k=100):
+        self.k = k
+        self.n = 0
+        self.contadores = {}
+        self._monticulo = []
+
+    def agregar(self, elemento, cuenta=1):
+        self.n += cuenta
+        actual = self.contadores.get(elemento)
+        if actual is not None:
+            nueva = (actual[0] + cuenta, actual[1])
+        elif len(self.contadores) < self.k:
+            nueva = (cuenta, 0)
+        else:
+            minimo, expulsado = self._extraer_minimo()
+            del self.contadores[expulsado]
+            nueva = (minimo + cuenta, minimo)
+        self.contadores[elemento] = nueva
+        heapq.heappush(self._monticulo, (nueva[0], elemento))
+        if len(self._monticulo) > 4 * self.k + 64:
+            self._reconstruir()
+
+    # Montículo con borrado perezoso: se ignoran las entradas con cuentas ya superadas
+    def _extraer_minimo(self):
+        while True:
+            cuenta, elemento = heapq.heappop(self._monticulo)
+            actual = self.contadores.get(elemento)
+            if actual is not None and actual[0] == cuenta:
+                return cuenta, elemento
+
+    def _reconstruir(self):
+        self._monticulo = [(cuenta, elemento) for elemento, (cuenta, _) in self.contadores.items()]
+        heapq.heapify(self._monticulo)
+
+    def minimo(self):
+        if len(self.contadores) < self.k:
+            return 0
+        return min(cuenta for cuenta, _ in self.contadores.values())
+
+    # Fusión de dos resúmenes: los elementos ausentes en uno suman su mínimo como error
+    def fusionar(self, otro):
+        minimo_propio, minimo_otro = self.minimo(), otro.minimo()
+        combinados = {}
+        for elemento in self.contadores.keys() | otro.contadores.keys():
+            cuenta_a, error_a = self.contadores.get(elemento, (minimo_propio, minimo_propio))
+            cuenta_b, error_b = otro.contadores.get(elemento, (minimo_otro, minimo_otro))
+            combinados[elemento] = (cuenta_a + cuenta_b, error_a + error_b)
+        mejores = heapq.nlargest(self.k, combinados.items(), key=lambda par: par[1][0])
+        self.contadores = dict(mejores)
+        self.n += otro.n
+        self._reconstruir()
+        return self
+
+    def top(self, n=None):
+        ordenados = sorted(self.contadores.items(), key=lambda par: (-par[1][0], par[0]))
+        return [(elemento, cuenta, error) for elemento, (cuenta, error) in ordenados[:n]]
+
+# Estimación de elementos distintos con HyperLogLog: 2^p registros de un byte,
+# error típico de 1.04 / sqrt(2^p) (~0.8 % con p=14, 16 KiB)
+class HyperLogLog:
+    def __init__(self, p=14):
+        if not 4 <= p <= 18:
+            raise ValueError("p debe estar entre 4 y 18")
+        self.p = p
+        self.m = 1 << p
+        self.registros = bytearray(self.m)
+
+    def agregar(self, elemento):
+        self.agregar_hash(hash64(elemento))
+
+    def agregar_hash(self, valor):
+        indice = valor & (self.m - 1)
+        resto = valor >> self.p
+        rango = (64 - self.p) - resto.bit_length() + 1
+        if rango > self.registros[indice]:
+            self.registros[indice] = rango
+
+    def fusionar(self, otro):
+        if otro.p != self.p:
+            raise ValueError("Sólo se pueden fusionar HyperLogLog con la misma precisión")
+        self.registros = bytearray(map(max, self.registros, otro.registros))
+        return self
+
+    def estimar(self):
+        alfa = 0.7213 / (1 + 1.079 / self.m)
+        estimacion = alfa * self.m * self.m / sum(2.0 ** -registro for registro in self.registros)
+        vacios = self.registros.count(0)
+        if estimacion <= 2.5 * self.m and vacios:
+            # Corrección para cardinalidades pequeñas (linear counting)
+            return self.m * math.log(self.m / vacios)
+        return estimacion
+
+# Frecuencias aproximadas con Count-Min: profundidad x ancho contadores. La estimación
+# nunca es menor que la cuenta real y la supera en más de e·n/ancho con probabilidad e^-profundidad.
+class CountMin:
+    def __init__(self, ancho=2048, profundidad=4):
+        self.ancho = ancho
+        self.profundidad = profundidad
+        self.filas = [array('Q', bytes(8 * ancho)) for _ in range(profundidad)]
+
+    # Las filas se indexan con doble hashing a partir de un único hash de 64 bits
+    def _columnas(self, valor):
+        h1, h2 = valor & 0xFFFFFFFF, (valor >> 32) | 1
+        return [(h1 + i * h2) % self.ancho for i in range(self.profundidad)]
+
+    def agregar(self, elemento, cuenta=1):
+        self.agregar_hash(hash64(elemento), cuenta)
+
+    def agregar_hash(self, valor, cuenta=1):
+        for fila, columna in zip(self.filas, self._columnas(valor)):
+            fila[columna] += cuenta
+
+    def estimar(self, elemento):
+        return min(fila[columna] for fila, columna in zip(self.filas, self._columnas(hash64(elemento))))
+
+    def fusionar(self, otro):
+        if (otro.ancho, otro.profundidad) != (self.ancho, self.profundidad):
+            raise ValueError("Sólo se pueden fusionar Count-Min con las mismas dimensiones")
+        for fila, otra in zip(self.filas, otro.filas):
+            for i, cuenta in enumerate(otra):
+                if cuenta:
+                    fila[i] += cuenta
+        return self
+
+# Los tres sketches aplicados a los mensajes de un flujo de logs, con memoria acotada
+class ResumenMensajes:
+    def __init__(self, k=20, precision=14, ancho=2048, profundidad=4):
+        self.top_k = SpaceSaving(k)
+        self.distintos = HyperLogLog(precision)
+        self.frecuencias = CountMin(ancho, profundidad)
+
+    def agregar(self, log):
+        self.agregar_mensaje(log['mensaje'])
+
+    # Sólo se usa el mensaje: los bucles que parsean tuplas lo pasan sin construir el log
+    def agregar_mensaje(self, mensaje):
+        valor = hash64(mensaje)
+        self.top_k.agregar(mensaje)
+        self.distintos.agregar_hash(valor)
+        self.frecuencias.agregar_hash(valor)
+
+    def extender(self, logs):
+        for log in logs:
+            self.agregar(log)
+        return self
+
+    def fusionar(self, otro):
+        self.top_k.fusionar(otro.top_k)
+        self.distintos.fusionar(otro.distintos)
+        self.frecuencias.fusionar(otro.frecuencias)
+        return self
+
+    def top(self, n=None):
+        return self.top_k.top(n)
+
+    def mensajes_distintos(self):
+        return round(self.distintos.estimar())
+
+    def frecuencia(self, mensaje):
+        return self.frecuencias.estimar(mensaje)
+
+# Space-Saving es preciso en los primeros puestos si guarda bastantes más contadores de
+# los que se muestran: para pedir un top-K se reservan 10·K (como mínimo 100)
+def resumen_para_top(top):
+    return ResumenMensajes(k=max(10 * top, 100))
+
+# Etapa del pipeline en streaming: consume el flujo y devuelve el resumen
+def resumir_mensajes(logs, k=20, precision=14, ancho=2048, profundidad=4):
+    return ResumenMensajes(k, precision, ancho, profundidad).extender(logs)
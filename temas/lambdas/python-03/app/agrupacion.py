@@ -0,0 +1,31 @@
+from collections import Counter
+
+MODOS = ('lista', 'conteo', 'muestra')
+
+# Claves de agrupación predefinidas
+clave_nivel = lambda log: log['nivel']
+clave_hora = lambda log: log['timestamp'][:13]
+
+# Genera una clave que agrupa por los primeros caracteres del mensaje
+def clave_prefijo(longitud):
+    return lambda log: log['mensaje'][:longitud]
+
+# Agrupa en una sola pasada por cualquier clave.
+# modo='lista' guarda todas las entradas, 'conteo' sólo cuántas hay y
+# 'muestra' conserva como mucho max_muestras entradas por grupo.
+def agrupar_por(logs, clave=clave_nivel, modo='lista', max_muestras=10):
+    if modo not in MODOS:
+        raise ValueError(f"Modo de agrupación no válido: {modo}")
+    if modo == 'conteo':
+        return dict(Counter(map(clave, logs)))
+
+    grupos = {}
+    if modo == 'lista':
+        for log in logs:
+            grupos.setdefault(clave(log), []).append(log)
+    else:
+        for log in logs:
+            grupo = grupos.setdefault(clave(log), [])
+            if len(grupo) < max_muestras:
+                grupo.append(log)
+    return grupos
@@ -0,0 +1,98 @@
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from itertools import compress
+
+# Convierte "2025-05-20 12:00:01" a segundos desde epoch (UTC) y viceversa. Se guardan
+# segundos enteros: las fracciones ("12:00:01.250") se truncan, así que el almacén y la
+# caché devuelven esos logs con el timestamp redondeado hacia abajo al segundo.
+def a_epoch(timestamp):
+    return int(datetime.fromisoformat(timestamp).replace(tzinfo=timezone.utc).timestamp())
+
+def desde_epoch(segundos):
+    return datetime.fromtimestamp(segundos, timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+# Almacén columnar de logs parseados:
+#  - codigos:    nivel internado como entero pequeño (array 'B')
+#  - timestamps: segundos desde epoch (array 'q', int64)
+#  - mensajes:   índice a un pool de cadenas compartido (array 'I')
+# Los subconjuntos (filtrar, ordenar, agrupar) comparten niveles y pool con el original.
+class AlmacenLogs:
+    def __init__(self, logs=(), _compartido=None):
+        if _compartido is None:
+            _compartido = ([], {}, [], {})
+        self._niveles, self._codigo_nivel, self._pool, self._id_mensaje = _compartido
+        self.codigos = array('B')
+        self.timestamps = array('q')
+        self.mensajes = array('I')
+        self.extender(logs)
+
+    def _vacio(self):
+        return AlmacenLogs(_compartido=(self._niveles, self._codigo_nivel, self._pool, self._id_mensaje))
+
+    def _codigo(self, nivel):
+        codigo = self._codigo_nivel.get(nivel)
+        if codigo is None:
+            codigo = len(self._niveles)
+            if codigo > 255:
+                raise ValueError("Demasiados niveles distintos para el almacén columnar")
+            self._niveles.append(nivel)
+            self._codigo_nivel[nivel] = codigo
+        return codigo
+
+    def _id(self, mensaje):
+        identificador = self._id_mensaje.get(mensaje)
+        if identificador is None:
+            identificador = len(self._pool)
+            self._pool.append(mensaje)
+            self._id_mensaje[mensaje] = identificador
+        return identificador
+
+    def agregar(self, log):
+        self.codigos.append(self._codigo(log['nivel']))
+        self.timestamps.append(a_epoch(log['timestamp']))
+        self.mensajes.append(self._id(log['mensaje']))
+
+    def extender(self, logs):
+        for log in logs:
+            self.agregar(log)
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def __getitem__(self, i):
+        return {
+            'timestamp': desde_epoch(self.timestamps[i]),
+            'nivel': self._niveles[self.codigos[i]],
+            'mensaje': self._pool[self.mensajes[i]]
+        }
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self)))
+
+    # Nuevo almacén con las filas indicadas, sin copiar las cadenas
+    def seleccionar(self, indices):
+        subconjunto = self._vacio()
+        for i in indices:
+            subconjunto.codigos.append(self.codigos[i])
+            subconjunto.timestamps.append(self.timestamps[i])
+            subconjunto.mensajes.append(self.mensajes[i])
+        return subconjunto
+
+    def filtrar_por_nivel(self, nivel='ERROR'):
+        codigo = self._codigo_nivel.get(nivel)
+        if codigo is None:
+            return self._vacio()
+        return self.seleccionar(compress(range(len(self)), map(codigo.__eq__, self.codigos)))
+
+    def contar_por_nivel(self):
+        return {self._niveles[codigo]: total for codigo, total in Counter(self.codigos).items()}
+
+    def ordenar(self):
+        return self.seleccionar(sorted(range(len(self)), key=self.timestamps.__getitem__))
+
+    def agrupar_por_nivel(self):
+        indices = {}
+        for i, codigo in enumerate(self.codigos):
+            indices.setdefault(codigo, []).append(i)
+        return {self._niveles[codigo]: self.seleccionar(filas) for codigo, filas in indices.items()}
@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+from app.flujo import TAM_BLOQUE
+from app.indice import cota_superior
+from app.parser_rapido import ParserLogs
+from app.seguimiento import AgregadorIncremental
+
+_FIN = object()
+
+# Productor: lee un fichero por bloques en un hilo y envía a la cola el texto de las
+# líneas completas de cada bloque (decodificado de una vez, no línea a línea).
+# La cola es acotada, así que si el consumidor va más lento el productor espera (back-pressure).
+async def _leer_archivo(ruta, cola, limite, tam_bloque):
+    async with limite:
+        archivo = await asyncio.to_thread(open, ruta, 'rb')
+        try:
+            pendiente = b''
+            fin = False
+            while not fin:
+                bloque = await asyncio.to_thread(archivo.read, tam_bloque)
+                # Una lectura incompleta de un fichero regular indica el final: nos ahorramos otra vuelta al hilo
+                fin = len(bloque) < tam_bloque
+                datos = pendiente + bloque
+                corte = datos.rfind(b'\n') + 1
+                pendiente = datos[corte:]
+                if corte:
+                    await cola.put(datos[:corte].decode('utf-8'))
+            if pendiente:
+                await cola.put(pendiente.decode('utf-8'))
+        finally:
+            archivo.close()
+
+# Parsea un lote de texto a tuplas y alimenta el agregador con los logs dentro de
+# [desde, hasta] (hasta ya pasado por cota_superior); al_leer, si se indica, recibe cada
+# uno de ellos (sólo los de 'nivel', si se indica) como dict, que sólo se construye para
+# esos logs. Devuelve los logs parseados; las líneas en blanco o malformadas no cuentan.
+# Es el trabajo común del camino concurrente y del secuencial.
+def _agregar_lote(parser, texto, agregador, desde, hasta, al_leer, nivel):
+    tuplas = parser.parsear_buffer(texto)
+    for timestamp, nivel_log, mensaje in tuplas:
+        if (desde is not None and timestamp < desde) or (hasta is not None and timestamp > hasta):
+            continue
+        agregador.agregar_campos(timestamp, nivel_log, mensaje)
+        if al_leer is not None and (nivel is None or nivel_log == nivel):
+            al_leer({'timestamp': timestamp, 'nivel': nivel_log, 'mensaje': mensaje})
+    return len(tuplas)
+
+# Consumidor único: agrega cada lote de la cola según llega
+async def _consumir(cola, agregador, desde=None, hasta=None, al_leer=None, nivel=None):
+    parser = ParserLogs('tupla')
+    lineas = 0
+    hasta = cota_superior(hasta)
+    while True:
+        lote = await cola.get()
+        if lote is _FIN:
+            return lineas
+        lineas += _agregar_lote(parser, lote, agregador, desde, hasta, al_leer, nivel)
+
+def _resumen(agregador, lineas, segundos):
+    resumen = agregador.instantanea()
+    resumen['lineas'] = lineas
+    resumen['segundos'] = segundos
+    resumen['lineas_por_segundo'] = lineas / segundos if segundos > 0 else 0.0
+    return resumen
+
+# Lee varios ficheros a la vez (como mucho max_concurrentes abiertos) con un buffer
+# de max_lotes lotes pendientes, y devuelve conteos, grupos y el rendimiento en líneas/s.
+# 'lineas' cuenta los logs parseados de todos los ficheros, estén o no en el rango
+# desde/hasta (el agregador sólo recibe los del rango); las líneas en blanco y las
+# malformadas (sin timestamp y nivel) se descartan y no cuentan.
+async def procesar_archivos_async(rutas, agregador=None, max_concurrentes=16, max_lotes=64, tam_bloque=TAM_BLOQUE,
+                                  desde=None, hasta=None, al_leer=None, nivel=None):
+    agregador = agregador if agregador is not None else AgregadorIncremental()
+    cola = asyncio.Queue(maxsize=max_lotes)
+    limite = asyncio.Semaphore(max_concurrentes)
+
+    inicio = time.perf_counter()
+    consumidor = asyncio.create_task(_consumir(cola, agregador, desde, hasta, al_leer, nivel))
+    try:
+        await asyncio.gather(*(_leer_archivo(ruta, cola, limite, tam_bloque) for ruta in rutas))
+    finally:
+        await cola.put(_FIN)
+        lineas = await consumidor
+    return _resumen(agregador, lineas, time.perf_counter() - inicio)
+
+# Punto de entrada síncrono para el CLI
+def procesar_archivos(rutas, agregador=None, max_concurrentes=16, max_lotes=64, tam_bloque=TAM_BLOQUE,
+                      desde=None, hasta=None, al_leer=None, nivel=None):
+    return asyncio.run(procesar_archivos_async(rutas, agregador, max_concurrentes, max_lotes, tam_bloque,
+                                               desde, hasta, al_leer, nivel))
+
+# Texto de las líneas completas de un fichero, bloque a bloque, igual que _leer_archivo
+def _bloques_secuenciales(ruta, tam_bloque):
+    with open(ruta, 'rb') as archivo:
+        pendiente = b''
+        fin = False
+        while not fin:
+            bloque = archivo.read(tam_bloque)
+            fin = len(bloque) < tam_bloque
+            datos = pendiente + bloque
+            corte = datos.rfind(b'\n') + 1
+            pendiente = datos[corte:]
+            if corte:
+                yield datos[:corte].decode('utf-8')
+        if pendiente:
+            yield pendiente.decode('utf-8')
+
+# Camino de referencia: los mismos ficheros leídos uno detrás de otro, con los mismos
+# bloques, parser y llamadas al agregador, así que la diferencia sólo es la concurrencia
+def procesar_archivos_secuencial(rutas, agregador=None, tam_bloque=TAM_BLOQUE, desde=None, hasta=None,
+                                 al_leer=None, nivel=None):
+    agregador = agregador if agregador is not None else AgregadorIncremental()
+    parser = ParserLogs('tupla')
+    hasta = cota_superior(hasta)
+    inicio = time.perf_counter()
+    lineas = 0
+    for ruta in rutas:
+        for texto in _bloques_secuenciales(ruta, tam_bloque):
+            lineas += _agregar_lote(parser, texto, agregador, desde, hasta, al_leer, nivel)
+    return _resumen(agregador, lineas, time.perf_counter() - inicio)
@@ -0,0 +1,197 @@
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+from array import array
+
+from app.almacen import AlmacenLogs, a_epoch
+from app.parser_rapido import ParserLogs
+
+# Formato del fichero de caché (little-endian):
+#   cabecera | tabla de niveles | timestamps q[n] | inicio de mensaje q[n] | fin de mensaje q[n] | códigos B[n]
+# Los mensajes no se copian: se guardan sus offsets en bytes dentro del fichero original.
+MAGICO = b'LOGCACHE'
+VERSION = 1
+CABECERA = struct.Struct('<8sIqqqqIII')
+MUESTRA = 4096
+
+# Directorio de la caché: $PROCESADOR_CACHE o ~/.cache/procesador
+def directorio_cache():
+    return os.environ.get('PROCESADOR_CACHE') or os.path.join(os.path.expanduser('~'), '.cache', 'procesador')
+
+# Ruta del fichero de caché asociado a un log (clave: ruta absoluta)
+def ruta_cache(ruta, directorio=None):
+    clave = hashlib.sha1(os.path.abspath(ruta).encode('utf-8')).hexdigest()
+    return os.path.join(directorio or directorio_cache(), f"{clave}.logcache")
+
+# Huella del prefijo cubierto: CRC del primer y el último bloque, para detectar que sólo se ha añadido al final
+def _huella(fuente, cubierto):
+    return zlib.crc32(fuente[:min(MUESTRA, cubierto)]), zlib.crc32(fuente[max(0, cubierto - MUESTRA):cubierto])
+
+# Copia una columna mapeada a un array modificable (copia de memoria, sin reparsear)
+def _copiar(vista):
+    columna = array(vista.format)
+    columna.frombytes(vista.cast('B'))
+    return columna
+
+# Mensajes leídos bajo demanda del fichero original a partir de sus offsets.
+# Actúa como pool de AlmacenLogs: los índices son las filas y se pueden añadir cadenas nuevas.
+class MensajesFuente:
+    def __init__(self, fuente, inicios, fines):
+        self._fuente = fuente
+        self._inicios = inicios
+        self._fines = fines
+        self._extra = []
+
+    def __len__(self):
+        return len(self._inicios) + len(self._extra)
+
+    def __getitem__(self, i):
+        if i < len(self._inicios):
+            return self._fuente[self._inicios[i]:self._fines[i]].decode('utf-8')
+        return self._extra[i - len(self._inicios)]
+
+    def append(self, mensaje):
+        self._extra.append(mensaje)
+
+# Columnas parseadas de las líneas completas de fuente[desde:hasta]; con final=True
+# también la última línea aunque no termine en salto de línea. Cada línea se parsea a
+# tupla por separado para guardar su offset sólo si es válida: las malformadas se descartan,
+# como en el resto de caminos de ingesta.
+def _parsear_region(fuente, desde, hasta, niveles, codigo_nivel, final=False):
+    timestamps, inicios, fines, codigos = array('q'), array('q'), array('q'), array('B')
+    parser = ParserLogs('tupla')
+    posicion = desde
+    while posicion < hasta:
+        salto = fuente.find(b'\n', posicion, hasta)
+        if salto < 0:
+            if not final:
+                break
+            salto = hasta
+        texto = fuente[posicion:salto].decode('utf-8')
+        registro = parser.parsear_linea(texto)
+        if registro is not None:
+            timestamp, nivel, mensaje = registro
+            codigo = codigo_nivel.get(nivel)
+            if codigo is None:
+                codigo = codigo_nivel[nivel] = len(niveles)
+                if codigo > 255:
+                    raise ValueError("Demasiados niveles distintos para la caché")
+                niveles.append(nivel)
+            fin = posicion + len(texto.rstrip().encode('utf-8'))
+            timestamps.append(a_epoch(timestamp))
+            inicios.append(fin - len(mensaje.encode('utf-8')))
+            fines.append(fin)
+            codigos.append(codigo)
+        posicion = salto + 1
+    return timestamps, inicios, fines, codigos, posicion
+
+def _escribir(destino, estado, cubierto, huella, niveles, columnas):
+    timestamps, inicios, fines, codigos = columnas
+    tabla = b''.join(struct.pack('<H', len(n.encode('utf-8'))) + n.encode('utf-8') for n in niveles)
+    tabla += b'\0' * (-(CABECERA.size + len(tabla)) % 8)
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    temporal = f"{destino}.{os.getpid()}.tmp"
+    with open(temporal, 'wb') as archivo:
+        archivo.write(CABECERA.pack(MAGICO, VERSION, estado.st_size, estado.st_mtime_ns, cubierto, len(codigos),
+                                    huella[0], huella[1], len(niveles)))
+        archivo.write(tabla)
+        for columna in (timestamps, inicios, fines, codigos):
+            archivo.write(columna)
+    os.replace(temporal, destino)
+
+# Lee la caché mapeada en memoria; devuelve None si no existe o no es válida
+def _leer(origen_cache):
+    try:
+        with open(origen_cache, 'rb') as archivo:
+            datos = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None
+    if len(datos) < CABECERA.size:
+        return None
+    magico, version, tam, mtime_ns, cubierto, n, crc_inicio, crc_fin, n_niveles = CABECERA.unpack_from(datos)
+    if magico != MAGICO or version != VERSION:
+        return None
+    niveles, posicion = [], CABECERA.size
+    try:
+        for _ in range(n_niveles):
+            (longitud,) = struct.unpack_from('<H', datos, posicion)
+            niveles.append(bytes(datos[posicion + 2:posicion + 2 + longitud]).decode('utf-8'))
+            posicion += 2 + longitud
+    except (struct.error, UnicodeDecodeError):
+        return None
+    posicion += -posicion % 8
+    # Las columnas ocupan exactamente el resto del fichero: si no, está truncado o corrupto
+    if len(datos) != posicion + n * (8 + 8 + 8 + 1):
+        return None
+    vista = memoryview(datos)
+    columnas = []
+    for formato, ancho in (('q', 8), ('q', 8), ('q', 8), ('B', 1)):
+        columnas.append(vista[posicion:posicion + n * ancho].cast(formato))
+        posicion += n * ancho
+    return {'tam': tam, 'mtime_ns': mtime_ns, 'cubierto': cubierto, 'huella': (crc_inicio, crc_fin),
+            'niveles': niveles, 'columnas': columnas, 'mmap': datos}
+
+# AlmacenLogs respaldado por la caché: los códigos y timestamps son vistas del fichero
+# mapeado y los mensajes se leen del log original sólo cuando se piden. Las vistas son
+# de sólo lectura: al primer agregar/extender las columnas se copian a arrays en memoria.
+class LogsCacheados(AlmacenLogs):
+    def __init__(self, fuente, niveles, columnas, origen, cola=None):
+        timestamps, inicios, fines, codigos = columnas
+        if cola is not None and len(cola[0]):
+            # Última línea sin salto de línea: no se guarda en la caché, se añade en memoria
+            timestamps, inicios, fines, codigos = (_copiar(vista) + extra for vista, extra in zip(columnas, cola))
+        super().__init__(_compartido=(niveles, {nivel: codigo for codigo, nivel in enumerate(niveles)},
+                                      MensajesFuente(fuente, inicios, fines), {}))
+        self.codigos = codigos
+        self.timestamps = timestamps
+        self.mensajes = range(len(codigos))
+        # 'cache' (sin parsear), 'incremental' (sólo lo añadido) o 'completo' (reparseado)
+        self.origen = origen
+
+    # Copia en memoria de las columnas (sin reparsear) antes de la primera modificación
+    def _materializar(self):
+        if isinstance(self.mensajes, range):
+            self.codigos = self.codigos if isinstance(self.codigos, array) else _copiar(self.codigos)
+            self.timestamps = self.timestamps if isinstance(self.timestamps, array) else _copiar(self.timestamps)
+            self.mensajes = array('I', self.mensajes)
+
+    def agregar(self, log):
+        self._materializar()
+        super().agregar(log)
+
+# Devuelve los logs de 'ruta' usando la caché binaria: si el fichero no ha cambiado
+# (misma ruta, tamaño y mtime) no se parsea nada; si sólo ha crecido por el final se
+# parsea lo añadido y se reutiliza el resto; en otro caso se reconstruye. La caché guarda
+# las líneas completas; una última línea sin salto se parsea en cada carga.
+def cargar_logs(ruta, directorio=None):
+    destino = ruta_cache(ruta, directorio)
+    with open(ruta, 'rb') as archivo:
+        estado = os.fstat(archivo.fileno())
+        fuente = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) if estado.st_size else b''
+    tam = len(fuente)
+
+    cache = _leer(destino)
+    if cache is not None and cache['tam'] == tam and cache['mtime_ns'] == estado.st_mtime_ns:
+        origen = 'cache'
+    else:
+        if cache is not None and cache['cubierto'] <= tam and _huella(fuente, cache['cubierto']) == cache['huella']:
+            niveles, desde, origen = cache['niveles'], cache['cubierto'], 'incremental'
+            columnas = [_copiar(columna) for columna in cache['columnas']]
+        else:
+            niveles, desde, origen = [], 0, 'completo'
+            columnas = [array('q'), array('q'), array('q'), array('B')]
+        codigo_nivel = {nivel: codigo for codigo, nivel in enumerate(niveles)}
+        *nuevas, cubierto = _parsear_region(fuente, desde, tam, niveles, codigo_nivel)
+        for columna, nueva in zip(columnas, nuevas):
+            columna.extend(nueva)
+        _escribir(destino, estado, cubierto, _huella(fuente, cubierto), niveles, columnas)
+        cache = _leer(destino)
+
+    niveles = cache['niveles']
+    cola = None
+    if cache['cubierto'] < tam:
+        *cola, _ = _parsear_region(fuente, cache['cubierto'], tam, niveles,
+                                   {nivel: codigo for codigo, nivel in enumerate(niveles)}, final=True)
+    return LogsCacheados(fuente, niveles, cache['columnas'], origen, cola)
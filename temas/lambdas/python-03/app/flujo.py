@@ -0,0 +1,73 @@
+import sys
+from collections import Counter
+
+from app.procesador import parsear_log
+from app.parser_rapido import ParserLogs
+from app.agrupacion import agrupar_por, clave_nivel
+from app.indice import cota_superior
+
+TAM_BLOQUE = 1 << 16
+
+# Abre la fuente de logs: una ruta a fichero o '-' para la entrada estándar
+def abrir_fuente(origen):
+    if origen == '-':
+        return sys.stdin
+    return open(origen, 'r', encoding='utf-8')
+
+# Lee de forma perezosa en bloques de tamaño fijo (memoria acotada) y devuelve, por
+# cada bloque, la lista de sus líneas completas
+def leer_lotes(origen, tam_bloque=TAM_BLOQUE):
+    archivo = abrir_fuente(origen) if isinstance(origen, str) else origen
+    try:
+        resto = ''
+        while True:
+            bloque = archivo.read(tam_bloque)
+            if not bloque:
+                break
+            lineas = (resto + bloque).split('\n')
+            resto = lineas.pop()
+            if lineas:
+                yield lineas
+        if resto:
+            yield [resto]
+    finally:
+        if archivo is not sys.stdin and archivo is not origen:
+            archivo.close()
+
+# Lee líneas de forma perezosa en bloques de tamaño fijo (memoria acotada)
+def leer_lineas(origen, tam_bloque=TAM_BLOQUE):
+    for lote in leer_lotes(origen, tam_bloque):
+        yield from lote
+
+# Parsea cada línea no vacía con parsear_log, sin materializar la lista
+def parsear_flujo(lineas):
+    return map(parsear_log, filter(lambda linea: linea.strip(), lineas))
+
+# Etapa de filtrado por nivel como generador
+def filtrar_flujo(logs, nivel='ERROR'):
+    return filter(lambda log: log['nivel'] == nivel, logs)
+
+# Etapa de filtrado por rango de timestamps (extremos incluidos; hasta como prefijo) como generador
+def filtrar_flujo_por_rango(logs, desde=None, hasta=None):
+    hasta = cota_superior(hasta)
+    return filter(lambda log: (desde is None or log['timestamp'] >= desde)
+                  and (hasta is None or log['timestamp'] <= hasta), logs)
+
+# Etapa de conteo: consume el flujo y sólo guarda un contador por nivel
+def contar_flujo(logs):
+    return dict(Counter(map(lambda log: log['nivel'], logs)))
+
+# Etapa de agrupación: consume el flujo en una sola pasada
+def agrupar_flujo(logs, clave=clave_nivel, modo='lista', max_muestras=10):
+    return agrupar_por(logs, clave, modo, max_muestras)
+
+# Pipeline completo: fichero (o stdin) -> líneas -> logs parseados
+def logs_desde(origen, tam_bloque=TAM_BLOQUE):
+    return parsear_flujo(leer_lineas(origen, tam_bloque))
+
+# Como logs_desde, pero cada log es una tupla (timestamp, nivel, mensaje) parseada por
+# lotes con ParserLogs, sin construir un dict por línea
+def tuplas_desde(origen, tam_bloque=TAM_BLOQUE):
+    parser = ParserLogs('tupla')
+    for lote in leer_lotes(origen, tam_bloque):
+        yield from parser.parsear_lineas(lote)
@@ -0,0 +1,59 @@
+from bisect import bisect_left, bisect_right
+
+# Inserta manteniendo el orden por timestamp; si llega en orden es un append O(1)
+# y los timestamps iguales conservan el orden de llegada (como sorted, que es estable).
+def _insertar(timestamps, logs, log):
+    timestamp = log['timestamp']
+    if not timestamps or timestamps[-1] <= timestamp:
+        timestamps.append(timestamp)
+        logs.append(log)
+    else:
+        posicion = bisect_right(timestamps, timestamp)
+        timestamps.insert(posicion, timestamp)
+        logs.insert(posicion, log)
+
+# Cota superior con semántica de prefijo: '2025-05-20 12:05' incluye todo el minuto
+# (de 12:05:00 a 12:05:59) y no sólo los timestamps menores o iguales como cadena.
+def cota_superior(hasta):
+    return None if hasta is None else hasta + '\uffff'
+
+# Devuelve los logs con desde <= timestamp <= hasta (comparación de cadenas; hasta como prefijo)
+def _rango(timestamps, logs, desde, hasta):
+    inicio = 0 if desde is None else bisect_left(timestamps, desde)
+    fin = len(timestamps) if hasta is None else bisect_right(timestamps, cota_superior(hasta))
+    return logs[inicio:fin]
+
+# Índice ordenado por timestamp, con un índice adicional por nivel.
+# Se construye una vez (un único sort) y se mantiene al añadir logs,
+# de modo que las consultas por rango cuestan O(log n + k).
+class IndiceTemporal:
+    def __init__(self, logs=()):
+        ordenados = sorted(logs, key=lambda log: log['timestamp'])
+        self._timestamps = [log['timestamp'] for log in ordenados]
+        self._logs = ordenados
+        self._por_nivel = {}
+        for log in ordenados:
+            timestamps, logs_nivel = self._por_nivel.setdefault(log['nivel'], ([], []))
+            timestamps.append(log['timestamp'])
+            logs_nivel.append(log)
+
+    def agregar(self, log):
+        _insertar(self._timestamps, self._logs, log)
+        _insertar(*self._por_nivel.setdefault(log['nivel'], ([], [])), log)
+
+    def extender(self, logs):
+        for log in logs:
+            self.agregar(log)
+
+    def __len__(self):
+        return len(self._logs)
+
+    def __iter__(self):
+        return iter(self._logs)
+
+    def rango(self, desde=None, hasta=None, nivel=None):
+        if nivel is None:
+            return _rango(self._timestamps, self._logs, desde, hasta)
+        if nivel not in self._por_nivel:
+            return []
+        return _rango(*self._por_nivel[nivel], desde, hasta)
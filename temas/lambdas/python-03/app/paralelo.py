@@ -0,0 +1,104 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from app.flujo import TAM_BLOQUE
+from app.parser_rapido import ParserLogs
+from app.agregados import resumen_para_top
+from app.indice import cota_superior
+
+# Divide el fichero en rangos de bytes [inicio, fin) alineados con saltos de línea
+def dividir_en_rangos(ruta, partes):
+    tam = os.path.getsize(ruta)
+    if tam == 0:
+        return []
+    limites = [0]
+    with open(ruta, 'rb') as archivo:
+        for i in range(1, max(1, partes)):
+            posicion = tam * i // partes
+            if posicion <= limites[-1]:
+                continue
+            # Si el byte anterior ya es un salto de línea, el corte queda en 'posicion'
+            archivo.seek(posicion - 1)
+            archivo.readline()
+            corte = archivo.tell()
+            if limites[-1] < corte < tam:
+                limites.append(corte)
+    limites.append(tam)
+    return list(zip(limites, limites[1:]))
+
+# Resultado parcial vacío: conteo por nivel, grupos por nivel, logs filtrados y,
+# si se pide top, el resumen aproximado de mensajes (app/agregados.py)
+def resultado_vacio(top=None):
+    return {'conteo': Counter(), 'grupos': {}, 'filtrados': [], 'resumen': resumen_para_top(top) if top else None}
+
+# Texto de las líneas de un rango de bytes, leído por bloques y decodificado de una vez por
+# bloque; cada bloque termina en un salto de línea salvo el último del fichero
+def _bloques_de_texto(archivo, inicio, fin, tam_bloque=TAM_BLOQUE):
+    archivo.seek(inicio)
+    pendiente = b''
+    restante = fin - inicio
+    while restante > 0:
+        bloque = archivo.read(min(tam_bloque, restante))
+        if not bloque:
+            break
+        restante -= len(bloque)
+        datos = pendiente + bloque
+        corte = datos.rfind(b'\n') + 1
+        pendiente = datos[corte:]
+        if corte:
+            yield datos[:corte].decode('utf-8')
+    if pendiente:
+        yield pendiente.decode('utf-8')
+
+# Trabajo de cada proceso: parsea y agrega las líneas de un rango de bytes
+# Si se indican desde/hasta, sólo cuentan los logs dentro de ese rango de timestamps.
+# Los bloques se parsean a tuplas con ParserLogs y el dict sólo se construye para los
+# logs que se guardan en grupos o filtrados; las líneas malformadas se descartan.
+def procesar_rango(ruta, inicio, fin, nivel='ERROR', agrupar=True, desde=None, hasta=None, top=None):
+    resultado = resultado_vacio(top)
+    conteo, grupos, filtrados, resumen = resultado['conteo'], resultado['grupos'], resultado['filtrados'], resultado['resumen']
+    hasta = cota_superior(hasta)
+    parser = ParserLogs('tupla')
+    with open(ruta, 'rb') as archivo:
+        for texto in _bloques_de_texto(archivo, inicio, fin):
+            for timestamp, nivel_log, mensaje in parser.parsear_buffer(texto):
+                if (desde is not None and timestamp < desde) or (hasta is not None and timestamp > hasta):
+                    continue
+                conteo[nivel_log] += 1
+                if agrupar or nivel_log == nivel:
+                    log = {'timestamp': timestamp, 'nivel': nivel_log, 'mensaje': mensaje}
+                    if agrupar:
+                        grupos.setdefault(nivel_log, []).append(log)
+                    if nivel_log == nivel:
+                        filtrados.append(log)
+                if resumen is not None:
+                    resumen.agregar_mensaje(mensaje)
+    return resultado
+
+# Combina los resultados parciales respetando el orden de los rangos
+def fusionar_resultados(parciales):
+    total = resultado_vacio()
+    for parcial in parciales:
+        if parcial['resumen'] is not None:
+            total['resumen'] = parcial['resumen'] if total['resumen'] is None else total['resumen'].fusionar(parcial['resumen'])
+        total['conteo'].update(parcial['conteo'])
+        for clave, grupo in parcial['grupos'].items():
+            total['grupos'].setdefault(clave, []).extend(grupo)
+        total['filtrados'].extend(parcial['filtrados'])
+    total['conteo'] = dict(total['conteo'])
+    return total
+
+# Camino secuencial de referencia: un único rango con todo el fichero
+def procesar_en_serie(ruta, nivel='ERROR', agrupar=True, desde=None, hasta=None, top=None):
+    return fusionar_resultados([procesar_rango(ruta, 0, os.path.getsize(ruta), nivel, agrupar, desde, hasta, top)])
+
+# Reparte los rangos entre un pool de procesos y fusiona los parciales
+def procesar_en_paralelo(ruta, workers=None, nivel='ERROR', agrupar=True, desde=None, hasta=None, top=None):
+    workers = workers or os.cpu_count() or 1
+    rangos = dividir_en_rangos(ruta, workers)
+    if workers == 1 or len(rangos) <= 1:
+        return procesar_en_serie(ruta, nivel, agrupar, desde, hasta, top)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futuros = [pool.submit(procesar_rango, ruta, inicio, fin, nivel, agrupar, desde, hasta, top) for inicio, fin in rangos]
+        return fusionar_resultados(futuro.result() for futuro in futuros)
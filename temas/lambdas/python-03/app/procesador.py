@@ -1,6 +1,9 @@
-from functools import reduce
 from collections import Counter
 
+from app.agrupacion import agrupar_por, clave_nivel
+from app.almacen import AlmacenLogs
+from app.indice import IndiceTemporal, cota_superior
+
 # Log de ejemplo: "2025-05-20 12:00:01 ERROR Fallo de conexión"
 def parsear_log(log_linea):
     partes = log_linea.strip().split(' ', 3)
@@ -10,19 +13,47 @@ def parsear_log(log_linea):
         'mensaje': partes[3] if len(partes) > 3 else ''
     }
 
+# Las funciones siguientes aceptan una lista de logs o un AlmacenLogs (app/almacen.py);
+# con el almacén columnar operan directamente sobre sus columnas.
+
 # Función para filtrar por nivel usando una lambda
 def filtrar_por_nivel(logs, nivel='ERROR'):
+    if isinstance(logs, AlmacenLogs):
+        return logs.filtrar_por_nivel(nivel)
     return list(filter(lambda log: log['nivel'] == nivel, logs))
 
+# Construye un índice por timestamp para consultas repetidas por rango
+def construir_indice(logs):
+    return IndiceTemporal(logs)
+
+# Filtra por rango de timestamps (extremos incluidos) y, opcionalmente, por nivel.
+# Con un IndiceTemporal la consulta es O(log n); con una lista se recorre entera.
+# Un hasta parcial ('2025-05-20 12:05') incluye todo su periodo (ver cota_superior).
+def filtrar_por_rango(logs, desde=None, hasta=None, nivel=None):
+    if isinstance(logs, IndiceTemporal):
+        return logs.rango(desde, hasta, nivel)
+    hasta = cota_superior(hasta)
+    return list(filter(lambda log: (desde is None or log['timestamp'] >= desde)
+                       and (hasta is None or log['timestamp'] <= hasta)
+                       and (nivel is None or log['nivel'] == nivel), logs))
+
 # Función para contar logs por nivel
 def contar_por_nivel(logs):
+    if isinstance(logs, AlmacenLogs):
+        return logs.contar_por_nivel()
     niveles = list(map(lambda log: log['nivel'], logs))
     return dict(Counter(niveles))
 
 # Ordenar por timestamp
 def ordenar_logs(logs):
+    if isinstance(logs, AlmacenLogs):
+        return logs.ordenar()
+    if isinstance(logs, IndiceTemporal):
+        return list(logs)
     return sorted(logs, key=lambda log: log['timestamp'])
 
-# Agrupar por nivel (usando reduce y lambdas)
+# Agrupar por nivel en una sola pasada (ver app/agrupacion.py)
 def agrupar_por_nivel(logs):
-    return reduce(lambda acc, log: {**acc, log['nivel']: acc.get(log['nivel'], []) + [log]}, logs, {})
+    if isinstance(logs, AlmacenLogs):
+        return logs.agrupar_por_nivel()
+    return agrupar_por(logs, clave_nivel)
@@ -0,0 +1,160 @@
+import os
+import time
+from collections import Counter, deque
+
+from app.flujo import TAM_BLOQUE
+from app.indice import cota_superior
+from app.parser_rapido import ParserLogs
+
+# Logs que conserva por nivel el agregador por defecto del Seguidor, que puede no terminar nunca
+MAX_POR_GRUPO = 1000
+
+# Conteos y grupos por nivel mantenidos de forma incremental: O(1) por log nuevo.
+# Con max_por_grupo cada grupo conserva sólo los últimos logs de su nivel (0: sólo cuenta);
+# con None los conserva todos, así que sólo es adecuado para entradas finitas.
+class AgregadorIncremental:
+    def __init__(self, max_por_grupo=None):
+        self.max_por_grupo = max_por_grupo
+        self.total = 0
+        self.conteo = Counter()
+        self.grupos = {}
+
+    def agregar(self, log):
+        nivel = log['nivel']
+        self.total += 1
+        self.conteo[nivel] += 1
+        grupo = self.grupos.get(nivel)
+        if grupo is None:
+            grupo = self.grupos[nivel] = deque(maxlen=self.max_por_grupo)
+        grupo.append(log)
+
+    # Como agregar, a partir de los campos ya parseados: el dict sólo se construye si el
+    # grupo guarda logs (max_por_grupo distinto de 0)
+    def agregar_campos(self, timestamp, nivel, mensaje):
+        self.total += 1
+        self.conteo[nivel] += 1
+        grupo = self.grupos.get(nivel)
+        if grupo is None:
+            grupo = self.grupos[nivel] = deque(maxlen=self.max_por_grupo)
+        if self.max_por_grupo != 0:
+            grupo.append({'timestamp': timestamp, 'nivel': nivel, 'mensaje': mensaje})
+
+    def extender(self, logs):
+        for log in logs:
+            self.agregar(log)
+
+    def instantanea(self):
+        return {
+            'total': self.total,
+            'conteo': dict(self.conteo),
+            'grupos': {nivel: list(grupo) for nivel, grupo in self.grupos.items()}
+        }
+
+# Sigue un fichero que crece (como tail -f) leyendo sólo los bytes nuevos.
+# Detecta la rotación (cambia el inodo de la ruta) y el truncado (el tamaño
+# baja de la posición leída) y vuelve a empezar desde el principio del fichero.
+# Con desde/hasta sólo se agregan los logs de ese rango de timestamps, y al_leer
+# se llama con cada uno de ellos según se leen (sólo con los de 'nivel', si se indica).
+# Las líneas malformadas se descartan.
+class Seguidor:
+    def __init__(self, ruta, agregador=None, desde_el_final=False, desde=None, hasta=None, al_leer=None, nivel=None):
+        self.ruta = ruta
+        self.agregador = agregador if agregador is not None else AgregadorIncremental(MAX_POR_GRUPO)
+        self.desde = desde
+        self.hasta = hasta
+        self.al_leer = al_leer
+        self.nivel = nivel
+        self._parser = ParserLogs('tupla')
+        self._archivo = None
+        self._inodo = None
+        self._pendiente = b''
+        self._abrir(desde_el_final)
+
+    def _abrir(self, desde_el_final=False):
+        try:
+            self._archivo = open(self.ruta, 'rb')
+        except FileNotFoundError:
+            self._archivo = None
+            return
+        self._inodo = os.fstat(self._archivo.fileno()).st_ino
+        self._pendiente = b''
+        if desde_el_final:
+            self._archivo.seek(0, os.SEEK_END)
+
+    def cerrar(self):
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+
+    # Lotes de líneas completas hasta el final actual del fichero, leídos en bloques de
+    # TAM_BLOQUE para que un fichero grande ya existente no se cargue entero en memoria
+    def _lotes(self):
+        while True:
+            bloque = self._archivo.read(TAM_BLOQUE)
+            if not bloque:
+                return
+            *lineas, self._pendiente = (self._pendiente + bloque).split(b'\n')
+            yield lineas
+
+    # Parsea el lote a tuplas de una vez; el dict sólo se construye para los logs que se
+    # devuelven (conservar) o se pasan a al_leer
+    def _procesar(self, lineas, conservar=True):
+        hasta = cota_superior(self.hasta)
+        logs = []
+        for timestamp, nivel, mensaje in self._parser.parsear_buffer(b'\n'.join(lineas).decode('utf-8')):
+            if (self.desde is not None and timestamp < self.desde) or (hasta is not None and timestamp > hasta):
+                continue
+            avisar = self.al_leer is not None and (self.nivel is None or nivel == self.nivel)
+            if not conservar and not avisar:
+                self.agregador.agregar_campos(timestamp, nivel, mensaje)
+                continue
+            log = {'timestamp': timestamp, 'nivel': nivel, 'mensaje': mensaje}
+            self.agregador.agregar(log)
+            if avisar:
+                self.al_leer(log)
+            if conservar:
+                logs.append(log)
+        return logs
+
+    # Lee las líneas añadidas desde la última llamada y actualiza el agregador.
+    # Devuelve los logs nuevos; con conservar=False no los acumula (memoria acotada).
+    def leer_nuevas(self, conservar=True):
+        if self._archivo is None:
+            self._abrir()
+            if self._archivo is None:
+                return []
+        try:
+            estado = os.stat(self.ruta)
+        except FileNotFoundError:
+            estado = None
+
+        nuevos = []
+        if estado is not None and estado.st_ino != self._inodo:
+            # Rotación: se terminan de leer las líneas del fichero antiguo y se abre el nuevo
+            for lineas in self._lotes():
+                nuevos += self._procesar(lineas, conservar)
+            if self._pendiente:
+                nuevos += self._procesar([self._pendiente], conservar)
+            self.cerrar()
+            self._abrir()
+        elif estado is not None and estado.st_size < self._archivo.tell():
+            # Truncado: se descarta lo pendiente y se vuelve al principio
+            self._archivo.seek(0)
+            self._pendiente = b''
+
+        if self._archivo is not None:
+            for lineas in self._lotes():
+                nuevos += self._procesar(lineas, conservar)
+        return nuevos
+
+    # Generador de instantáneas: sondea cada 'sondeo' segundos y emite una cada 'intervalo'
+    def seguir(self, intervalo=5.0, sondeo=0.5):
+        siguiente = time.monotonic() + intervalo
+        while True:
+            self.leer_nuevas(conservar=False)
+            ahora = time.monotonic()
+            if ahora >= siguiente:
+                siguiente = ahora + intervalo
+                yield self.agregador.instantanea()
+            else:
+                time.sleep(min(sondeo, siguiente - ahora))
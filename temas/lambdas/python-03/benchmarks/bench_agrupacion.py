@@ -0,0 +1,59 @@
+# Benchmark de agrupación: reduce original (cuadrático) frente a agrupar_por (lineal)
+# Uso: python -m benchmarks.bench_agrupacion [--max-exp 7] [--max-exp-reduce 4]
+
+import argparse
+import time
+from functools import reduce
+from itertools import cycle, islice
+
+from app.agrupacion import agrupar_por, clave_nivel, clave_hora
+
+NIVELES = ['ERROR', 'INFO', 'WARNING', 'DEBUG']
+
+# Implementación original de agrupar_por_nivel, conservada como referencia
+def agrupar_por_nivel_reduce(logs):
+    return reduce(lambda acc, log: {**acc, log['nivel']: acc.get(log['nivel'], []) + [log]}, logs, {})
+
+# Un conjunto fijo de entradas que se recicla para no medir la creación de dicts
+def generar_logs(n, distintos=1000):
+    base = [
+        {
+            'timestamp': f"2025-05-20 {i % 24:02d}:{i % 60:02d}:01",
+            'nivel': NIVELES[i % len(NIVELES)],
+            'mensaje': f"Mensaje {i}"
+        }
+        for i in range(distintos)
+    ]
+    return list(islice(cycle(base), n))
+
+def medir(funcion, logs):
+    inicio = time.perf_counter()
+    funcion(logs)
+    return time.perf_counter() - inicio
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Escalado de la agrupación de logs')
+    parser.add_argument('--max-exp', type=int, default=7, help='tamaño máximo 10^N (por defecto 7)')
+    parser.add_argument('--max-exp-reduce', type=int, default=4,
+                        help='tamaño máximo 10^N para la versión con reduce (por defecto 4)')
+    args = parser.parse_args(argv)
+
+    variantes = [
+        ('reduce (original)', agrupar_por_nivel_reduce, args.max_exp_reduce),
+        ('agrupar_por lista', lambda logs: agrupar_por(logs, clave_nivel), args.max_exp),
+        ('agrupar_por conteo', lambda logs: agrupar_por(logs, clave_nivel, modo='conteo'), args.max_exp),
+        ('agrupar_por muestra', lambda logs: agrupar_por(logs, clave_nivel, modo='muestra'), args.max_exp),
+        ('agrupar_por hora', lambda logs: agrupar_por(logs, clave_hora), args.max_exp),
+    ]
+
+    print(f"{'n':>10} " + " ".join(f"{nombre:>20}" for nombre, _, _ in variantes))
+    for exponente in range(3, args.max_exp + 1):
+        logs = generar_logs(10 ** exponente)
+        tiempos = [
+            f"{medir(funcion, logs):>19.4f}s" if exponente <= limite else f"{'-':>20}"
+            for _, funcion, limite in variantes
+        ]
+        print(f"{10 ** exponente:>10} " + " ".join(tiempos))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Benchmark de ingesta de muchos ficheros: asyncio concurrente frente a lectura secuencial
+# Uso: python -m benchmarks.bench_asincrono [--ficheros 300] [--lineas 2000] [--latencia 20]
+# Con --latencia cada apertura de fichero espera esos milisegundos (sistema de ficheros en red, disco frío)
+
+import argparse
+import builtins
+import tempfile
+import time
+from pathlib import Path
+
+import app.asincrono
+from app.asincrono import procesar_archivos, procesar_archivos_secuencial
+from app.seguimiento import AgregadorIncremental
+
+NIVELES = ['ERROR', 'INFO', 'WARNING', 'DEBUG']
+
+def generar_ficheros(directorio, ficheros, lineas):
+    rutas = []
+    for f in range(ficheros):
+        ruta = Path(directorio) / f"servicio-{f:04d}.log"
+        ruta.write_text("".join(
+            f"2025-05-20 12:{i % 60:02d}:{f % 60:02d} {NIVELES[(i + f) % 4]} Servicio {f} evento {i}\n"
+            for i in range(lineas)
+        ), encoding='utf-8')
+        rutas.append(str(ruta))
+    return rutas
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Ingesta concurrente de muchos ficheros de log')
+    parser.add_argument('--ficheros', type=int, default=300)
+    parser.add_argument('--lineas', type=int, default=2000, help='líneas por fichero')
+    parser.add_argument('--concurrentes', type=int, default=16)
+    parser.add_argument('--latencia', type=float, default=0, metavar='MS', help='latencia simulada por fichero abierto')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = generar_ficheros(directorio, args.ficheros, args.lineas)
+        if args.latencia:
+            def abrir(*posicionales, **nombrados):
+                time.sleep(args.latencia / 1000)
+                return builtins.open(*posicionales, **nombrados)
+            app.asincrono.open = abrir
+        # Sólo se cuentan: los grupos no retienen logs para no medir memoria
+        secuencial = procesar_archivos_secuencial(rutas, AgregadorIncremental(max_por_grupo=0))
+        concurrente = procesar_archivos(rutas, AgregadorIncremental(max_por_grupo=0), max_concurrentes=args.concurrentes)
+
+    assert secuencial['conteo'] == concurrente['conteo']
+    print(f"{'modo':<12} {'líneas':>10} {'segundos':>10} {'líneas/s':>12}")
+    for nombre, resumen in (('secuencial', secuencial), ('asyncio', concurrente)):
+        print(f"{nombre:<12} {resumen['lineas']:>10} {resumen['segundos']:>10.3f} {resumen['lineas_por_segundo']:>12.0f}")
+    print(f"asyncio/secuencial: {secuencial['segundos'] / concurrente['segundos']:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# Benchmark de memoria: lista de dicts (parsear_log) frente a AlmacenLogs columnar
+# Uso: python -m benchmarks.bench_memoria [--lineas 1000000] [--mensajes 1000]
+
+import argparse
+import time
+import tracemalloc
+
+from app.almacen import AlmacenLogs
+from app.procesador import parsear_log, contar_por_nivel
+
+NIVELES = ['ERROR', 'INFO', 'WARNING', 'DEBUG']
+
+def generar_lineas(n, mensajes_distintos):
+    for i in range(n):
+        yield f"2025-05-20 {i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d} {NIVELES[i % 4]} Mensaje {i % mensajes_distintos}"
+
+# Devuelve (estructura, bytes retenidos, segundos de construcción)
+def medir(construir):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    estructura = construir()
+    segundos = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return estructura, memoria, segundos
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Memoria de la representación de logs parseados')
+    parser.add_argument('--lineas', type=int, default=1_000_000)
+    parser.add_argument('--mensajes', type=int, default=1000, help='número de mensajes distintos')
+    args = parser.parse_args(argv)
+
+    lineas = lambda: generar_lineas(args.lineas, args.mensajes)
+    variantes = [
+        ('lista de dicts', lambda: list(map(parsear_log, lineas()))),
+        ('AlmacenLogs', lambda: AlmacenLogs(map(parsear_log, lineas()))),
+    ]
+    print(f"{'representación':<16} {'MB':>10} {'bytes/log':>10} {'construir':>10} {'contar':>10}")
+    for nombre, construir in variantes:
+        logs, memoria, segundos = medir(construir)
+        inicio = time.perf_counter()
+        contar_por_nivel(logs)
+        contar = time.perf_counter() - inicio
+        print(f"{nombre:<16} {memoria / 2**20:>10.1f} {memoria / args.lineas:>10.1f} {segundos:>9.2f}s {contar:>9.3f}s")
+        del logs
+
+if __name__ == "__main__":
+    main()
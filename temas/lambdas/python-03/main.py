@@ -1,20 +1,165 @@
 # main.py
 
+import argparse
+import multiprocessing
+from collections import Counter
+
 from app.logs import ejemplo_logs
 from app.procesador import (
     parsear_log,
     filtrar_por_nivel,
     contar_por_nivel,
     ordenar_logs,
-    agrupar_por_nivel
+    agrupar_por_nivel,
+    construir_indice,
+    filtrar_por_rango
 )
+from app.flujo import tuplas_desde
+from app.indice import cota_superior
+from app.paralelo import procesar_en_paralelo
+from app.seguimiento import Seguidor, AgregadorIncremental
+from app.asincrono import procesar_archivos
+from app.cache import cargar_logs
+from app.agregados import resumen_para_top
+
+def parsear_argumentos(argv=None):
+    parser = argparse.ArgumentParser(prog='procesador', description='Procesamiento de logs con funciones lambda')
+    parser.add_argument('--file', '-f', dest='archivos', metavar='RUTA', nargs='+',
+                        help="fichero(s) de logs a procesar en streaming ('-' para leer de stdin); "
+                             "con varios ficheros se leen de forma concurrente con asyncio")
+    parser.add_argument('--nivel', default='ERROR', help='nivel a filtrar (por defecto ERROR)')
+    parser.add_argument('--workers', '-w', type=int, default=1, metavar='N',
+                        help='número de procesos para repartir el fichero (por defecto 1)')
+    parser.add_argument('--since', dest='desde', metavar='TIMESTAMP',
+                        help="sólo logs con timestamp >= TIMESTAMP (p. ej. '2025-05-20 12:00')")
+    parser.add_argument('--until', dest='hasta', metavar='TIMESTAMP',
+                        help="sólo logs con timestamp <= TIMESTAMP; uno parcial incluye todo su periodo "
+                             "(p. ej. '2025-05-20 12:05' llega hasta 12:05:59)")
+    parser.add_argument('--follow', dest='seguir', action='store_true',
+                        help='seguir el fichero mientras crece (como tail -f) mostrando conteos periódicos')
+    parser.add_argument('--intervalo', type=float, default=5.0, metavar='SEGUNDOS',
+                        help='cada cuánto se muestra una instantánea en modo --follow (por defecto 5)')
+    parser.add_argument('--concurrentes', type=int, default=16, metavar='N',
+                        help='máximo de ficheros abiertos a la vez al leer varios ficheros (por defecto 16)')
+    parser.add_argument('--cache', action='store_true',
+                        help='usar la caché binaria de logs parseados (sólo reparsea si el fichero ha cambiado)')
+    parser.add_argument('--top', type=int, metavar='K',
+                        help='mostrar los K mensajes más frecuentes y los mensajes distintos (aproximados, memoria acotada)')
+    args = parser.parse_args(argv)
+    args.archivo = args.archivos[0] if args.archivos else None
+    if args.archivos and len(args.archivos) > 1:
+        if '-' in args.archivos:
+            parser.error("'-' no se puede combinar con otros ficheros")
+        if args.seguir or args.workers > 1:
+            parser.error('--follow y --workers sólo admiten un fichero')
+    if args.cache and (args.archivo in (None, '-') or len(args.archivos) > 1):
+        parser.error('--cache requiere --file con una única ruta a fichero')
+    if args.cache and (args.seguir or args.workers > 1 or args.desde or args.hasta):
+        parser.error('--cache no se puede combinar con --follow, --workers, --since ni --until')
+    if args.top is not None and (args.archivo is None or len(args.archivos) > 1 or args.seguir or args.cache):
+        parser.error('--top requiere --file con una única ruta (o -) sin --follow ni --cache')
+    if args.top is not None and args.top < 1:
+        parser.error('--top debe ser mayor o igual que 1')
+    if args.seguir and args.archivo in (None, '-'):
+        parser.error('--follow requiere --file con una ruta a fichero')
+    if args.workers < 1:
+        parser.error('--workers debe ser mayor o igual que 1')
+    if args.workers > 1 and args.archivo in (None, '-'):
+        parser.error('--workers requiere --file con una ruta a fichero')
+    return args
+
+def mostrar_resumen(resumen, top):
+    print(f"\n--- Top {top} mensajes (aproximado) ---")
+    for mensaje, cuenta, error in resumen.top(top):
+        print(f"{cuenta:>10} ±{error:<8} {mensaje}")
+    print(f"Mensajes distintos (aprox.): {resumen.mensajes_distintos()}")
+
+# Procesa un fichero en una sola pasada sin cargarlo en memoria
+def procesar_archivo(origen, nivel, desde=None, hasta=None, top=None):
+    conteo = Counter()
+    resumen = resumen_para_top(top) if top else None
+
+    hasta = cota_superior(hasta)
+
+    print(f"\n--- Filtrando {nivel} ---")
+    # Tuplas parseadas por lotes: sólo se construye el dict de los logs que se muestran
+    for timestamp, nivel_log, mensaje in tuplas_desde(origen):
+        if (desde is not None and timestamp < desde) or (hasta is not None and timestamp > hasta):
+            continue
+        conteo[nivel_log] += 1
+        if nivel_log == nivel:
+            print({'timestamp': timestamp, 'nivel': nivel_log, 'mensaje': mensaje})
+        if resumen is not None:
+            resumen.agregar_mensaje(mensaje)
+
+    print("\n--- Conteo por nivel ---")
+    print(dict(conteo))
+
+    if resumen is not None:
+        mostrar_resumen(resumen, top)
+
+# Reparte el fichero en trozos entre varios procesos y fusiona los resultados
+def procesar_archivo_en_paralelo(ruta, nivel, workers, desde=None, hasta=None, top=None):
+    resultado = procesar_en_paralelo(ruta, workers, nivel, agrupar=False, desde=desde, hasta=hasta, top=top)
+
+    print(f"\n--- Filtrando {nivel} ---")
+    for log in resultado['filtrados']:
+        print(log)
+
+    print("\n--- Conteo por nivel ---")
+    print(resultado['conteo'])
 
-def main():
+    if resultado['resumen'] is not None:
+        mostrar_resumen(resultado['resumen'], top)
+
+# Consulta los logs desde la caché binaria sin volver a parsear el fichero si no ha cambiado
+def procesar_archivo_con_cache(ruta, nivel):
+    logs = cargar_logs(ruta)
+
+    print(f"\n--- Filtrando {nivel} ---")
+    for log in filtrar_por_nivel(logs, nivel):
+        print(log)
+
+    print("\n--- Conteo por nivel ---")
+    print(contar_por_nivel(logs))
+
+# Lee varios ficheros a la vez y combina sus conteos en un único agregador; los logs de 'nivel'
+# se muestran según se parsean, así que los de ficheros distintos pueden salir intercalados
+def procesar_varios_archivos(rutas, concurrentes, nivel='ERROR', desde=None, hasta=None):
+    print(f"\n--- Filtrando {nivel} ---")
+    resumen = procesar_archivos(rutas, AgregadorIncremental(max_por_grupo=0), max_concurrentes=concurrentes,
+                                desde=desde, hasta=hasta, nivel=nivel, al_leer=print)
+
+    print("\n--- Conteo por nivel ---")
+    print(resumen['conteo'])
+
+    print("\n--- Rendimiento ---")
+    print(f"{len(rutas)} ficheros, {resumen['lineas']} líneas en {resumen['segundos']:.3f} s "
+          f"({resumen['lineas_por_segundo']:.0f} líneas/s)")
+
+# Monitoriza un fichero en crecimiento: muestra los logs de 'nivel' según llegan y cada instantánea
+# refleja sólo lo leído hasta ese momento. Sólo se guardan los conteos (memoria acotada).
+def seguir_archivo(ruta, intervalo, max_instantaneas=None, nivel='ERROR', desde=None, hasta=None):
+    print(f"\n--- Filtrando {nivel} ---")
+    seguidor = Seguidor(ruta, AgregadorIncremental(max_por_grupo=0), desde=desde, hasta=hasta,
+                        al_leer=print, nivel=nivel)
+    try:
+        for numero, instantanea in enumerate(seguidor.seguir(intervalo), start=1):
+            print(f"\n--- Instantánea ({instantanea['total']} logs) ---")
+            print(instantanea['conteo'])
+            if max_instantaneas is not None and numero >= max_instantaneas:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        seguidor.cerrar()
+
+def procesar_ejemplo(nivel='ERROR', desde=None, hasta=None):
     logs_raw = ejemplo_logs()
     logs = list(map(parsear_log, logs_raw))
 
-    print("\n--- Filtrando errores ---")
-    for log in filtrar_por_nivel(logs, 'ERROR'):
+    print(f"\n--- Filtrando {nivel} ---")
+    for log in filtrar_por_nivel(logs, nivel):
         print(log)
 
     print("\n--- Conteo por nivel ---")
@@ -26,8 +171,30 @@ def main():
 
     print("\n--- Agrupación por nivel ---")
     agrupados = agrupar_por_nivel(logs)
-    for nivel, grupo in agrupados.items():
-        print(f"{nivel}: {len(grupo)} entradas")
+    for nivel_grupo, grupo in agrupados.items():
+        print(f"{nivel_grupo}: {len(grupo)} entradas")
+
+    if desde is not None or hasta is not None:
+        print(f"\n--- {nivel} entre {desde or 'el inicio'} y {hasta or 'el final'} ---")
+        for log in filtrar_por_rango(construir_indice(logs), desde, hasta, nivel):
+            print(log)
+
+def main(argv=None):
+    args = parsear_argumentos(argv)
+    if args.archivo is None:
+        procesar_ejemplo(args.nivel, args.desde, args.hasta)
+    elif len(args.archivos) > 1:
+        procesar_varios_archivos(args.archivos, args.concurrentes, args.nivel, args.desde, args.hasta)
+    elif args.cache:
+        procesar_archivo_con_cache(args.archivo, args.nivel)
+    elif args.seguir:
+        seguir_archivo(args.archivo, args.intervalo, nivel=args.nivel, desde=args.desde, hasta=args.hasta)
+    elif args.workers > 1:
+        procesar_archivo_en_paralelo(args.archivo, args.nivel, args.workers, args.desde, args.hasta, args.top)
+    else:
+        procesar_archivo(args.archivo, args.nivel, args.desde, args.hasta, args.top)
 
 if __name__ == "__main__":
+    # Necesario para el pool de procesos en el ejecutable de PyInstaller
+    multiprocessing.freeze_support()
     main()
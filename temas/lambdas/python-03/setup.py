@@ -4,6 +4,7 @@ setup(
     name='lambdas_logs',
     version='0.1',
     packages=find_packages(include=['app', 'app.*']),
+    py_modules=['main'],
     entry_points={
         'console_scripts': [
             'procesador=main:main',
@@ -0,0 +1,110 @@
+import pickle
+import random
+import sys
+from collections import Counter
+
+import pytest
+
+from app.agregados import SpaceSaving, HyperLogLog, CountMin, ResumenMensajes, resumir_mensajes
+from app.flujo import parsear_flujo
+
+def flujo_zipf(n, distintos, semilla=10):
+    # Frecuencias tipo Zipf: pocos mensajes muy frecuentes y una cola larga
+    generador = random.Random(semilla)
+    pesos = [1 / (rango + 1) for rango in range(distintos)]
+    return [f"mensaje {i}" for i in generador.choices(range(distintos), weights=pesos, k=n)]
+
+def test_space_saving_encuentra_los_mas_frecuentes():
+    mensajes = flujo_zipf(50_000, 5_000)
+    exacto = Counter(mensajes)
+    resumen = SpaceSaving(k=100)
+    for mensaje in mensajes:
+        resumen.agregar(mensaje)
+    top = resumen.top(10)
+    assert [elemento for elemento, _, _ in top] == [elemento for elemento, _ in exacto.most_common(10)]
+    for elemento, cuenta, error in top:
+        assert cuenta - error <= exacto[elemento] <= cuenta
+    assert len(resumen.contadores) == 100
+
+def test_space_saving_garantiza_elementos_frecuentes():
+    mensajes = ["frecuente"] * 300 + [f"raro {i}" for i in range(2000)]
+    random.Random(1).shuffle(mensajes)
+    resumen = SpaceSaving(k=10)
+    for mensaje in mensajes:
+        resumen.agregar(mensaje)
+    assert resumen.top(1)[0][0] == "frecuente"
+
+def test_space_saving_fusion():
+    mensajes = flujo_zipf(40_000, 2_000)
+    exacto = Counter(mensajes)
+    mitades = [SpaceSaving(k=100), SpaceSaving(k=100)]
+    for i, mensaje in enumerate(mensajes):
+        mitades[i % 2].agregar(mensaje)
+    fusionado = mitades[0].fusionar(mitades[1])
+    assert fusionado.n == len(mensajes)
+    assert [elemento for elemento, _, _ in fusionado.top(5)] == [elemento for elemento, _ in exacto.most_common(5)]
+    for elemento, cuenta, error in fusionado.top(20):
+        assert cuenta - error <= exacto[elemento] <= cuenta
+
+@pytest.mark.parametrize('distintos', [10, 1_000, 50_000])
+def test_hyperloglog_precision(distintos):
+    hll = HyperLogLog(p=14)
+    for i in range(distintos):
+        hll.agregar(f"mensaje {i}")
+        hll.agregar(f"mensaje {i}")
+    assert abs(hll.estimar() - distintos) / distintos < 0.03
+    assert len(hll.registros) == 16384
+
+def test_hyperloglog_fusion_equivale_al_total():
+    a, b, total = HyperLogLog(12), HyperLogLog(12), HyperLogLog(12)
+    for i in range(20_000):
+        (a if i % 3 else b).agregar(f"m{i}")
+        total.agregar(f"m{i}")
+    assert a.fusionar(b).registros == total.registros
+    with pytest.raises(ValueError):
+        a.fusionar(HyperLogLog(10))
+
+def test_count_min_nunca_subestima_y_acota_el_error():
+    mensajes = flujo_zipf(50_000, 5_000)
+    exacto = Counter(mensajes)
+    sketch = CountMin(ancho=2048, profundidad=4)
+    for mensaje in mensajes:
+        sketch.agregar(mensaje)
+    errores = [sketch.estimar(elemento) - cuenta for elemento, cuenta in exacto.items()]
+    assert min(errores) >= 0
+    # Cota e·n/ancho para la gran mayoría de elementos
+    limite = 2.72 * len(mensajes) / 2048
+    assert sum(error > limite for error in errores) < 0.02 * len(errores)
+
+def test_count_min_fusion():
+    a, b, total = CountMin(256, 3), CountMin(256, 3), CountMin(256, 3)
+    for i in range(3000):
+        (a if i % 2 else b).agregar(f"m{i % 97}")
+        total.agregar(f"m{i % 97}")
+    assert a.fusionar(b).filas == total.filas
+
+def test_resumen_en_pipeline_y_entre_workers():
+    lineas = [f"2025-05-20 12:00:01 INFO {mensaje}" for mensaje in flujo_zipf(20_000, 3_000)]
+    exacto = Counter(linea.split(' ', 3)[3] for linea in lineas)
+    completo = resumir_mensajes(parsear_flujo(lineas), k=50)
+
+    # Resúmenes parciales serializados como si vinieran de otros procesos
+    partes = [pickle.loads(pickle.dumps(resumir_mensajes(parsear_flujo(lineas[i::4]), k=50))) for i in range(4)]
+    fusionado = partes[0]
+    for parte in partes[1:]:
+        fusionado.fusionar(parte)
+
+    for resumen in (completo, fusionado):
+        assert resumen.top(3)[0][0] == exacto.most_common(1)[0][0]
+        assert abs(resumen.mensajes_distintos() - len(exacto)) / len(exacto) < 0.03
+        assert resumen.frecuencia('mensaje 0') >= exacto['mensaje 0']
+    assert fusionado.mensajes_distintos() == completo.mensajes_distintos()
+
+def test_memoria_acotada_frente_al_contador_exacto():
+    mensajes = [f"mensaje único {i}" for i in range(100_000)]
+    resumen = ResumenMensajes(k=20).extender({'mensaje': mensaje} for mensaje in mensajes)
+    exacto = Counter(mensajes)
+    memoria_resumen = (sys.getsizeof(resumen.top_k.contadores) + len(resumen.distintos.registros)
+                       + sum(fila.buffer_info()[1] * fila.itemsize for fila in resumen.frecuencias.filas))
+    assert len(resumen.top_k.contadores) == 20
+    assert memoria_resumen * 20 < sys.getsizeof(exacto)
@@ -0,0 +1,40 @@
+import pytest
+
+from app.agrupacion import agrupar_por, clave_nivel, clave_hora, clave_prefijo
+from app.procesador import parsear_log, agrupar_por_nivel
+
+raw_logs = [
+    "2025-05-20 12:00:01 ERROR Fallo de conexión",
+    "2025-05-20 12:01:01 INFO Usuario conectado",
+    "2025-05-20 13:02:01 WARNING Memoria alta",
+    "2025-05-20 13:03:01 ERROR Timeout alcanzado",
+    "2025-05-20 13:04:01 ERROR Fallo de disco"
+]
+
+parsed_logs = list(map(parsear_log, raw_logs))
+
+def test_agrupar_por_nivel_conserva_orden():
+    grupos = agrupar_por_nivel(parsed_logs)
+    assert [log['mensaje'] for log in grupos['ERROR']] == ['Fallo de conexión', 'Timeout alcanzado', 'Fallo de disco']
+    assert list(grupos) == ['ERROR', 'INFO', 'WARNING']
+
+def test_agrupar_por_hora():
+    grupos = agrupar_por(parsed_logs, clave_hora)
+    assert {hora: len(grupo) for hora, grupo in grupos.items()} == {'2025-05-20 12': 2, '2025-05-20 13': 3}
+
+def test_agrupar_por_prefijo_en_modo_conteo():
+    assert agrupar_por(parsed_logs, clave_prefijo(5), modo='conteo') == {
+        'Fallo': 2, 'Usuar': 1, 'Memor': 1, 'Timeo': 1
+    }
+
+def test_agrupar_con_muestras_acotadas():
+    grupos = agrupar_por(parsed_logs, clave_nivel, modo='muestra', max_muestras=2)
+    assert len(grupos['ERROR']) == 2
+    assert grupos['ERROR'][0]['mensaje'] == 'Fallo de conexión'
+
+def test_agrupar_acepta_generadores():
+    assert agrupar_por(iter(parsed_logs), modo='conteo') == {'ERROR': 3, 'INFO': 1, 'WARNING': 1}
+
+def test_modo_no_valido():
+    with pytest.raises(ValueError):
+        agrupar_por(parsed_logs, modo='otro')
@@ -0,0 +1,56 @@
+import tracemalloc
+
+from app.almacen import AlmacenLogs, a_epoch, desde_epoch
+from app.procesador import parsear_log, filtrar_por_nivel, contar_por_nivel, ordenar_logs, agrupar_por_nivel
+
+raw_logs = [
+    "2025-05-20 12:03:01 ERROR Timeout alcanzado",
+    "2025-05-20 12:01:01 INFO Usuario conectado",
+    "2025-05-20 12:02:01 WARNING Memoria alta",
+    "2025-05-20 12:00:01 ERROR Fallo de conexión",
+    "2025-05-20 12:00:01 INFO Usuario conectado"
+]
+
+parsed_logs = list(map(parsear_log, raw_logs))
+
+def test_conversion_epoch_ida_y_vuelta():
+    assert desde_epoch(a_epoch('2025-05-20 12:00:01')) == '2025-05-20 12:00:01'
+    assert desde_epoch(a_epoch('2025-05-20 12:00:01.999')) == '2025-05-20 12:00:01'      # Se truncan las fracciones
+
+def test_almacen_reconstruye_los_logs():
+    almacen = AlmacenLogs(parsed_logs)
+    assert len(almacen) == 5
+    assert list(almacen) == parsed_logs
+    assert almacen[3] == parsed_logs[3]
+
+def test_mensajes_y_niveles_internados():
+    almacen = AlmacenLogs(parsed_logs)
+    assert almacen.mensajes[1] == almacen.mensajes[4]
+    assert almacen.codigos[0] == almacen.codigos[3]
+
+def test_funciones_de_procesador_sobre_almacen():
+    almacen = AlmacenLogs(parsed_logs)
+    assert list(filtrar_por_nivel(almacen, 'ERROR')) == filtrar_por_nivel(parsed_logs, 'ERROR')
+    assert contar_por_nivel(almacen) == contar_por_nivel(parsed_logs)
+    assert list(ordenar_logs(almacen)) == ordenar_logs(parsed_logs)
+    grupos = agrupar_por_nivel(almacen)
+    assert {nivel: list(grupo) for nivel, grupo in grupos.items()} == agrupar_por_nivel(parsed_logs)
+
+def test_filtrar_nivel_inexistente():
+    assert len(filtrar_por_nivel(AlmacenLogs(parsed_logs), 'CRITICAL')) == 0
+
+def test_almacen_ocupa_menos_que_lista_de_dicts():
+    lineas = [f"2025-05-20 12:{i % 60:02d}:01 {('ERROR', 'INFO')[i % 2]} Mensaje {i % 100}" for i in range(20000)]
+
+    tracemalloc.start()
+    logs = list(map(parsear_log, lineas))
+    memoria_dicts = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    almacen = AlmacenLogs(map(parsear_log, lineas))
+    memoria_almacen = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(almacen) == len(logs)
+    assert memoria_almacen * 5 < memoria_dicts
@@ -0,0 +1,83 @@
+import asyncio
+import builtins
+import time
+
+import pytest
+
+from app.asincrono import procesar_archivos, procesar_archivos_async, procesar_archivos_secuencial
+from app.seguimiento import AgregadorIncremental
+
+NIVELES = ['ERROR', 'INFO', 'WARNING', 'DEBUG']
+
+def generar_ficheros(tmp_path, ficheros, lineas):
+    rutas = []
+    for f in range(ficheros):
+        ruta = tmp_path / f"servicio-{f:03d}.log"
+        ruta.write_text("".join(
+            f"2025-05-20 12:{i % 60:02d}:01 {NIVELES[(i * f) % 4]} Servicio {f} evento {i} ñ\n" for i in range(lineas)
+        ), encoding='utf-8')
+        rutas.append(str(ruta))
+    return rutas
+
+def test_cientos_de_ficheros_igual_que_secuencial(tmp_path):
+    rutas = generar_ficheros(tmp_path, 300, 40)
+    secuencial = procesar_archivos_secuencial(rutas)
+    # Bloques y cola muy pequeños para forzar la espera de los productores (back-pressure)
+    concurrente = procesar_archivos(rutas, max_concurrentes=32, max_lotes=2, tam_bloque=256)
+    assert concurrente['lineas'] == secuencial['lineas'] == 300 * 40
+    assert concurrente['conteo'] == secuencial['conteo']
+    assert {nivel: sorted(log['mensaje'] for log in grupo) for nivel, grupo in concurrente['grupos'].items()} == \
+        {nivel: sorted(log['mensaje'] for log in grupo) for nivel, grupo in secuencial['grupos'].items()}
+    assert concurrente['lineas_por_segundo'] > 0
+
+def test_rango_de_tiempo_igual_que_secuencial(tmp_path):
+    rutas = generar_ficheros(tmp_path, 5, 120)
+    leidos = []
+    concurrente = procesar_archivos(rutas, desde='2025-05-20 12:10', hasta='2025-05-20 12:20', al_leer=leidos.append)
+    secuencial = procesar_archivos_secuencial(rutas, desde='2025-05-20 12:10', hasta='2025-05-20 12:20')
+    assert concurrente['lineas'] == secuencial['lineas'] == 5 * 120
+    assert concurrente['conteo'] == secuencial['conteo']
+    assert concurrente['total'] == len(leidos) == 5 * 2 * 11
+    assert all('2025-05-20 12:10' <= log['timestamp'] <= '2025-05-20 12:20:59' for log in leidos)
+
+def test_lineas_malformadas_igual_que_secuencial(tmp_path):
+    rutas = generar_ficheros(tmp_path, 3, 10)
+    with open(rutas[1], 'a', encoding='utf-8') as archivo:
+        archivo.write("basura\n\n2025-05-20 12:00:01 ERROR Tras la basura\n")
+    concurrente = procesar_archivos(rutas, tam_bloque=64)
+    secuencial = procesar_archivos_secuencial(rutas, tam_bloque=64)
+    assert concurrente['lineas'] == secuencial['lineas'] == 3 * 10 + 1                  # Ni la malformada ni la vacía
+    assert concurrente['conteo'] == secuencial['conteo']
+
+# Apertura con latencia, como en un sistema de ficheros en red o un disco frío
+def abrir_con_latencia(latencia):
+    def abrir(*args, **kwargs):
+        time.sleep(latencia)
+        return builtins.open(*args, **kwargs)
+    return abrir
+
+def test_estres_con_latencia_de_entrada_salida(tmp_path, monkeypatch):
+    """Con latencia de E/S por fichero, leer de forma concurrente es claramente más rápido"""
+    rutas = generar_ficheros(tmp_path, 60, 50)
+    monkeypatch.setattr('app.asincrono.open', abrir_con_latencia(0.02), raising=False)
+    secuencial = procesar_archivos_secuencial(rutas, AgregadorIncremental(max_por_grupo=0))
+    concurrente = procesar_archivos(rutas, AgregadorIncremental(max_por_grupo=0), max_concurrentes=16)
+    assert concurrente['conteo'] == secuencial['conteo']
+    assert secuencial['segundos'] >= 60 * 0.02
+    assert concurrente['segundos'] < secuencial['segundos'] / 2
+
+def test_agregador_compartido_entre_llamadas(tmp_path):
+    rutas = generar_ficheros(tmp_path, 3, 10)
+    agregador = AgregadorIncremental()
+    procesar_archivos(rutas[:2], agregador)
+    procesar_archivos(rutas[2:], agregador)
+    assert agregador.total == 30
+
+def test_ultima_linea_sin_salto(tmp_path):
+    ruta = tmp_path / "app.log"
+    ruta.write_text("2025-05-20 12:00:01 ERROR Uno\n2025-05-20 12:00:02 INFO Dos", encoding='utf-8')
+    assert procesar_archivos([str(ruta)], tam_bloque=8)['conteo'] == {'ERROR': 1, 'INFO': 1}
+
+def test_fichero_inexistente(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(procesar_archivos_async([str(tmp_path / "no-existe.log")]))
@@ -0,0 +1,122 @@
+import os
+
+import pytest
+
+from app.cache import cargar_logs, ruta_cache
+from app.parser_rapido import ParserLogs
+from app.procesador import parsear_log, filtrar_por_nivel, contar_por_nivel, ordenar_logs
+
+raw_logs = [
+    "2025-05-20 12:03:01 ERROR Timeout alcanzado",
+    "2025-05-20 12:01:01 INFO Usuario conectado ñ",
+    "",
+    "2025-05-20 12:02:01 WARNING Memoria alta  ",
+    "2025-05-20 12:00:01 ERROR Fallo de conexión",
+    "2025-05-20 12:04:01 DEBUG"
+]
+
+parsed_logs = list(map(parsear_log, filter(str.strip, raw_logs)))
+
+@pytest.fixture
+def log(tmp_path):
+    ruta = tmp_path / "app.log"
+    ruta.write_text("\n".join(raw_logs) + "\n", encoding='utf-8')
+    return str(ruta)
+
+@pytest.fixture
+def directorio(tmp_path):
+    return str(tmp_path / "cache")
+
+def escribir(ruta, texto, modo='a'):
+    with open(ruta, modo, encoding='utf-8') as archivo:
+        archivo.write(texto)
+
+def test_primera_carga_parsea_y_crea_la_cache(log, directorio):
+    logs = cargar_logs(log, directorio)
+    assert logs.origen == 'completo'
+    assert os.path.exists(ruta_cache(log, directorio))
+    assert list(logs) == parsed_logs
+
+def test_segunda_carga_no_reparsea(log, directorio, monkeypatch):
+    cargar_logs(log, directorio)
+    monkeypatch.setattr('app.cache.ParserLogs.parsear_lineas', lambda parser, lineas: pytest.fail("no debería parsear"))
+    logs = cargar_logs(log, directorio)
+    assert logs.origen == 'cache'
+    assert contar_por_nivel(logs) == contar_por_nivel(parsed_logs)
+    assert list(filtrar_por_nivel(logs, 'ERROR')) == filtrar_por_nivel(parsed_logs, 'ERROR')
+    assert list(ordenar_logs(logs)) == ordenar_logs(parsed_logs)
+
+def test_reutiliza_la_cache_si_solo_se_anade(log, directorio, monkeypatch):
+    cargar_logs(log, directorio)
+    escribir(log, "2025-05-20 12:05:01 ERROR Nuevo\n")
+    parseadas = []
+    original = ParserLogs.parsear_lineas
+    monkeypatch.setattr('app.cache.ParserLogs.parsear_lineas',
+                        lambda parser, lineas: parseadas.extend(lineas) or original(parser, lineas))
+    logs = cargar_logs(log, directorio)
+    assert logs.origen == 'incremental'
+    assert parseadas == ["2025-05-20 12:05:01 ERROR Nuevo"]
+    assert list(logs) == parsed_logs + [parsear_log("2025-05-20 12:05:01 ERROR Nuevo")]
+    assert cargar_logs(log, directorio).origen == 'cache'
+
+def test_invalida_si_cambia_el_contenido(log, directorio):
+    cargar_logs(log, directorio)
+    escribir(log, "2025-05-20 13:00:01 INFO Otro fichero\n", modo='w')
+    logs = cargar_logs(log, directorio)
+    assert logs.origen == 'completo'
+    assert contar_por_nivel(logs) == {'INFO': 1}
+
+def test_invalida_si_se_trunca(log, directorio):
+    cargar_logs(log, directorio)
+    with open(log, 'r+b') as archivo:
+        archivo.truncate(len(raw_logs[0]) + 1)
+    logs = cargar_logs(log, directorio)
+    assert logs.origen == 'completo'
+    assert list(logs) == parsed_logs[:1]
+
+def test_ultima_linea_sin_salto(log, directorio):
+    escribir(log, "2025-05-20 12:05:01 INFO Sin salto")
+    logs = cargar_logs(log, directorio)
+    assert list(logs)[-1] == parsear_log("2025-05-20 12:05:01 INFO Sin salto")
+    escribir(log, " de línea\n")
+    assert list(cargar_logs(log, directorio))[-1]['mensaje'] == 'Sin salto de línea'
+
+def test_cache_corrupta_se_reconstruye(log, directorio):
+    cargar_logs(log, directorio)
+    escribir(ruta_cache(log, directorio), "basura", modo='w')
+    assert cargar_logs(log, directorio).origen == 'completo'
+
+def test_fichero_vacio(tmp_path, directorio):
+    ruta = tmp_path / "vacio.log"
+    ruta.write_text("", encoding='utf-8')
+    assert len(cargar_logs(str(ruta), directorio)) == 0
+    assert cargar_logs(str(ruta), directorio).origen == 'cache'
+
+def test_subconjuntos_admiten_nuevos_logs(log, directorio):
+    errores = filtrar_por_nivel(cargar_logs(log, directorio), 'ERROR')
+    errores.agregar(parsear_log("2025-05-20 12:09:01 ERROR Añadido"))
+    assert [log['mensaje'] for log in errores] == ['Timeout alcanzado', 'Fallo de conexión', 'Añadido']
+
+def test_admite_nuevos_logs(log, directorio):
+    logs = cargar_logs(log, directorio)
+    logs.extender([parsear_log("2025-05-20 12:09:01 ERROR Añadido")])
+    assert list(logs) == parsed_logs + [parsear_log("2025-05-20 12:09:01 ERROR Añadido")]
+    assert list(cargar_logs(log, directorio)) == parsed_logs                     # La caché no cambia
+
+def test_cache_truncada_se_reconstruye(log, directorio):
+    cargar_logs(log, directorio)
+    with open(ruta_cache(log, directorio), 'r+b') as archivo:
+        archivo.truncate(os.path.getsize(ruta_cache(log, directorio)) - 3)
+    logs = cargar_logs(log, directorio)
+    assert logs.origen == 'completo'
+    assert list(logs) == parsed_logs
+
+def test_lineas_malformadas_se_descartan(log, directorio):
+    escribir(log, "basura\n2025-05-20 12:05:01 ERROR Tras la basura\n")
+    esperado = parsed_logs + [parsear_log("2025-05-20 12:05:01 ERROR Tras la basura")]
+    assert list(cargar_logs(log, directorio)) == esperado
+    escribir(log, "otra basura\n")
+    logs = cargar_logs(log, directorio)
+    assert logs.origen == 'incremental'
+    assert list(logs) == esperado
+    assert list(cargar_logs(log, directorio)) == esperado                        # Offsets de los mensajes correctos
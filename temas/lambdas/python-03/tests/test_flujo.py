@@ -0,0 +1,45 @@
+import io
+
+from app.flujo import leer_lineas, parsear_flujo, filtrar_flujo, contar_flujo, agrupar_flujo, logs_desde, tuplas_desde
+from app.procesador import parsear_log, contar_por_nivel, agrupar_por_nivel
+
+raw_logs = [
+    "2025-05-20 12:00:01 ERROR Fallo de conexión",
+    "2025-05-20 12:01:01 INFO Usuario conectado",
+    "2025-05-20 12:02:01 WARNING Memoria alta",
+    "2025-05-20 12:03:01 ERROR Timeout alcanzado"
+]
+
+def test_leer_lineas_bloques_pequenos():
+    texto = "\n".join(raw_logs) + "\n"
+    lineas = list(leer_lineas(io.StringIO(texto), tam_bloque=7))
+    assert lineas == raw_logs
+
+def test_leer_lineas_sin_salto_final(tmp_path):
+    ruta = tmp_path / "app.log"
+    ruta.write_text("\n".join(raw_logs), encoding='utf-8')
+    assert list(leer_lineas(str(ruta), tam_bloque=16)) == raw_logs
+
+def test_parsear_flujo_ignora_lineas_vacias():
+    logs = list(parsear_flujo(iter(raw_logs[:1] + ["", "   "] + raw_logs[1:])))
+    assert logs == list(map(parsear_log, raw_logs))
+
+def test_filtrar_flujo_es_perezoso():
+    errores = filtrar_flujo(parsear_flujo(iter(raw_logs)), 'ERROR')
+    assert next(errores)['mensaje'] == 'Fallo de conexión'
+    assert next(errores)['mensaje'] == 'Timeout alcanzado'
+
+def test_contar_y_agrupar_flujo_coinciden_con_procesador():
+    parsed = list(map(parsear_log, raw_logs))
+    assert contar_flujo(iter(parsed)) == contar_por_nivel(parsed)
+    assert agrupar_flujo(iter(parsed)) == agrupar_por_nivel(parsed)
+
+def test_logs_desde_fichero(tmp_path):
+    ruta = tmp_path / "app.log"
+    ruta.write_text("\n".join(raw_logs) + "\n", encoding='utf-8')
+    assert contar_flujo(logs_desde(str(ruta))) == {'ERROR': 2, 'INFO': 1, 'WARNING': 1}
+
+def test_tuplas_desde_coincide_con_logs_desde():
+    texto = "\n".join(raw_logs[:2] + ["", "malformada"] + raw_logs[2:])
+    tuplas = list(tuplas_desde(io.StringIO(texto), tam_bloque=11))
+    assert tuplas == [(log['timestamp'], log['nivel'], log['mensaje']) for log in map(parsear_log, raw_logs)]
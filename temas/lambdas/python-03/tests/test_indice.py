@@ -0,0 +1,54 @@
+from app.indice import IndiceTemporal
+from app.procesador import parsear_log, construir_indice, filtrar_por_rango, ordenar_logs
+
+raw_logs = [
+    "2025-05-20 12:03:01 ERROR Timeout alcanzado",
+    "2025-05-20 12:01:01 INFO Usuario conectado",
+    "2025-05-20 12:02:01 WARNING Memoria alta",
+    "2025-05-20 12:00:01 ERROR Fallo de conexión",
+    "2025-05-20 12:06:01 ERROR Disco lleno",
+    "2025-05-20 12:03:01 INFO Reintento"
+]
+
+parsed_logs = list(map(parsear_log, raw_logs))
+
+def mensajes(logs):
+    return [log['mensaje'] for log in logs]
+
+def test_indice_ordenado_igual_que_ordenar_logs():
+    indice = construir_indice(parsed_logs)
+    assert ordenar_logs(indice) == ordenar_logs(parsed_logs)
+
+def test_rango_con_nivel():
+    indice = construir_indice(parsed_logs)
+    errores = filtrar_por_rango(indice, '2025-05-20 12:00', '2025-05-20 12:05', 'ERROR')
+    assert mensajes(errores) == ['Fallo de conexión', 'Timeout alcanzado']
+
+def test_rango_abierto_y_extremos_incluidos():
+    indice = construir_indice(parsed_logs)
+    assert mensajes(indice.rango(desde='2025-05-20 12:03:01')) == ['Timeout alcanzado', 'Reintento', 'Disco lleno']
+    assert mensajes(indice.rango(hasta='2025-05-20 12:01:01')) == ['Fallo de conexión', 'Usuario conectado']
+    assert indice.rango(nivel='CRITICAL') == []
+
+def test_indice_coincide_con_recorrido_de_lista():
+    indice = construir_indice(parsed_logs)
+    for nivel in (None, 'ERROR', 'INFO'):
+        esperado = ordenar_logs(filtrar_por_rango(parsed_logs, '2025-05-20 12:01', '2025-05-20 12:04', nivel))
+        assert filtrar_por_rango(indice, '2025-05-20 12:01', '2025-05-20 12:04', nivel) == esperado
+
+def test_agregar_mantiene_el_orden():
+    indice = IndiceTemporal()
+    for log in parsed_logs:
+        indice.agregar(log)
+    assert list(indice) == ordenar_logs(parsed_logs)
+    indice.agregar(parsear_log("2025-05-20 12:02:30 ERROR Tarde"))
+    assert mensajes(indice.rango('2025-05-20 12:02', '2025-05-20 12:03', 'ERROR')) == ['Tarde', 'Timeout alcanzado']
+    assert len(indice) == len(parsed_logs) + 1
+
+def test_hasta_con_precision_de_minuto_incluye_todo_el_minuto():
+    logs = parsed_logs + [parsear_log("2025-05-20 12:05:00 ERROR Inicio del minuto"),
+                          parsear_log("2025-05-20 12:05:59 ERROR Fin del minuto")]
+    esperado = ['Fallo de conexión', 'Timeout alcanzado', 'Inicio del minuto', 'Fin del minuto']
+    assert mensajes(filtrar_por_rango(construir_indice(logs), hasta='2025-05-20 12:05', nivel='ERROR')) == esperado
+    assert mensajes(ordenar_logs(filtrar_por_rango(logs, hasta='2025-05-20 12:05', nivel='ERROR'))) == esperado
+    assert mensajes(filtrar_por_rango(logs, '2025-05-20 12:05', '2025-05-20 12:05')) == ['Inicio del minuto', 'Fin del minuto']
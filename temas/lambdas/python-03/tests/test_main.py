@@ -0,0 +1,135 @@
+import io
+
+import main
+
+raw_logs = [
+    "2025-05-20 12:00:01 ERROR Fallo de conexión",
+    "2025-05-20 12:01:01 INFO Usuario conectado",
+    "2025-05-20 12:03:01 ERROR Timeout alcanzado"
+]
+
+def test_main_sin_argumentos_usa_ejemplo(capsys):
+    main.main([])
+    salida = capsys.readouterr().out
+    assert "--- Agrupación por nivel ---" in salida
+
+def test_main_ejemplo_respeta_el_nivel(capsys):
+    main.main(['--nivel', 'WARNING'])
+    filtrados = capsys.readouterr().out.split("--- Filtrando WARNING ---")[1].split("--- Conteo por nivel ---")[0]
+    assert "'nivel': 'WARNING'" in filtrados
+    assert "'nivel': 'ERROR'" not in filtrados
+
+def test_main_con_fichero(tmp_path, capsys):
+    ruta = tmp_path / "app.log"
+    ruta.write_text("\n".join(raw_logs) + "\n", encoding='utf-8')
+    main.main(['--file', str(ruta)])
+    salida = capsys.readouterr().out
+    assert "Timeout alcanzado" in salida
+    assert "{'ERROR': 2, 'INFO': 1}" in salida
+
+def test_main_desde_stdin(monkeypatch, capsys):
+    monkeypatch.setattr('sys.stdin', io.StringIO("\n".join(raw_logs)))
+    main.main(['--file', '-'])
+    assert "{'ERROR': 2, 'INFO': 1}" in capsys.readouterr().out
+
+def test_main_con_workers_igual_que_serie(tmp_path, capsys):
+    ruta = tmp_path / "app.log"
+    ruta.write_text("\n".join(raw_logs * 50) + "\n", encoding='utf-8')
+    main.main(['--file', str(ruta)])
+    serie = capsys.readouterr().out
+    main.main(['--file', str(ruta), '--workers', '3'])
+    assert capsys.readouterr().out == serie
+
+def test_main_con_rango_de_tiempo(tmp_path, capsys):
+    ruta = tmp_path / "app.log"
+    ruta.write_text("\n".join(raw_logs) + "\n", encoding='utf-8')
+    main.main(['--file', str(ruta), '--since', '2025-05-20 12:01', '--until', '2025-05-20 12:05'])
+    salida = capsys.readouterr().out
+    assert "Fallo de conexión" not in salida
+    assert "{'INFO': 1, 'ERROR': 1}" in salida
+    main.main(['--file', str(ruta), '--since', '2025-05-20 12:01', '--until', '2025-05-20 12:05', '--workers', '2'])
+    assert capsys.readouterr().out == salida
+
+def test_main_until_con_precision_de_minuto(tmp_path, capsys):
+    ruta = tmp_path / "app.log"
+    ruta.write_text("\n".join(raw_logs + ["2025-05-20 12:05:30 ERROR Dentro del minuto",
+                                          "2025-05-20 12:06:00 ERROR Fuera"]) + "\n", encoding='utf-8')
+    main.main(['--file', str(ruta), '--until', '2025-05-20 12:05'])
+    salida = capsys.readouterr().out
+    assert "Dentro del minuto" in salida
+    assert "Fuera" not in salida
+    main.main(['--file', str(ruta), '--until', '2025-05-20 12:05', '--workers', '2'])
+    assert capsys.readouterr().out == salida
+
+def test_main_linea_malformada_igual_en_todos_los_modos(tmp_path, capsys, monkeypatch):
+    monkeypatch.setenv('PROCESADOR_CACHE', str(tmp_path / "cache"))
+    ruta = tmp_path / "app.log"
+    ruta.write_text(raw_logs[0] + "\nbasura\n" + raw_logs[1] + "\n", encoding='utf-8')
+    for opciones in ([], ['--workers', '2'], ['--cache']):
+        main.main(['--file', str(ruta), *opciones])
+        assert "{'ERROR': 1, 'INFO': 1}" in capsys.readouterr().out
+
+def test_main_seguir_archivo(tmp_path, capsys):
+    ruta = tmp_path / "app.log"
+    ruta.write_text("\n".join(raw_logs) + "\n", encoding='utf-8')
+    main.seguir_archivo(str(ruta), intervalo=0.01, max_instantaneas=1)
+    assert "--- Instantánea (3 logs) ---" in capsys.readouterr().out
+
+def test_main_seguir_archivo_con_linea_malformada(tmp_path, capsys):
+    ruta = tmp_path / "app.log"
+    ruta.write_text(raw_logs[0] + "\nbasura\n" + "\n".join(raw_logs[1:]) + "\n", encoding='utf-8')
+    main.seguir_archivo(str(ruta), intervalo=0.01, max_instantaneas=1)
+    salida = capsys.readouterr().out
+    assert "--- Instantánea (3 logs) ---" in salida
+    assert "Timeout alcanzado" in salida
+
+def test_main_seguir_archivo_aplica_filtros(tmp_path, capsys):
+    ruta = tmp_path / "app.log"
+    ruta.write_text("\n".join(raw_logs) + "\n", encoding='utf-8')
+    main.seguir_archivo(str(ruta), intervalo=0.01, max_instantaneas=1, desde='2025-05-20 12:01')
+    salida = capsys.readouterr().out
+    assert "Fallo de conexión" not in salida
+    assert "Timeout alcanzado" in salida
+    assert "--- Instantánea (2 logs) ---" in salida
+    assert "{'INFO': 1, 'ERROR': 1}" in salida
+    main.seguir_archivo(str(ruta), intervalo=0.01, max_instantaneas=1, nivel='INFO', hasta='2025-05-20 12:00')
+    salida = capsys.readouterr().out
+    assert "Usuario conectado" not in salida and "Fallo de conexión" not in salida
+    assert "{'ERROR': 1}" in salida
+
+def test_main_con_varios_ficheros(tmp_path, capsys):
+    rutas = []
+    for i in range(3):
+        ruta = tmp_path / f"app{i}.log"
+        ruta.write_text("\n".join(raw_logs) + "\n", encoding='utf-8')
+        rutas.append(str(ruta))
+    main.main(['--file', *rutas])
+    salida = capsys.readouterr().out
+    assert "{'ERROR': 6, 'INFO': 3}" in salida
+    assert "3 ficheros, 9 líneas" in salida
+    main.main(['--file', *rutas, '--since', '2025-05-20 12:01', '--nivel', 'INFO'])
+    salida = capsys.readouterr().out
+    assert "{'INFO': 3, 'ERROR': 3}" in salida
+    assert salida.count("Usuario conectado") == 3
+    assert "Fallo de conexión" not in salida
+
+def test_main_con_cache(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv('PROCESADOR_CACHE', str(tmp_path / "cache"))
+    ruta = tmp_path / "app.log"
+    ruta.write_text("\n".join(raw_logs) + "\n", encoding='utf-8')
+    main.main(['--file', str(ruta)])
+    sin_cache = capsys.readouterr().out
+    main.main(['--file', str(ruta), '--cache'])
+    assert capsys.readouterr().out == sin_cache
+    main.main(['--file', str(ruta), '--cache'])
+    assert capsys.readouterr().out == sin_cache
+
+def test_main_con_top(tmp_path, capsys):
+    ruta = tmp_path / "app.log"
+    ruta.write_text("\n".join(raw_logs * 4) + "\n", encoding='utf-8')
+    main.main(['--file', str(ruta), '--top', '2'])
+    salida = capsys.readouterr().out
+    assert "--- Top 2 mensajes (aproximado) ---" in salida
+    assert "Mensajes distintos (aprox.): 3" in salida
+    main.main(['--file', str(ruta), '--top', '2', '--workers', '2'])
+    assert "Mensajes distintos (aprox.): 3" in capsys.readouterr().out
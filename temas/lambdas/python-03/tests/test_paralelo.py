@@ -0,0 +1,66 @@
+from app.paralelo import dividir_en_rangos, procesar_rango, procesar_en_serie, procesar_en_paralelo
+from app.procesador import parsear_log, filtrar_por_nivel, contar_por_nivel, agrupar_por_nivel
+
+NIVELES = ['ERROR', 'INFO', 'WARNING', 'DEBUG']
+
+def generar_lineas(n):
+    return [f"2025-05-20 12:{i % 60:02d}:{i % 60:02d} {NIVELES[i % 7 % 4]} Mensaje número {i} ñ" for i in range(n)]
+
+def escribir_log(tmp_path, lineas):
+    ruta = tmp_path / "app.log"
+    ruta.write_text("\n".join(lineas) + "\n", encoding='utf-8')
+    return str(ruta)
+
+def test_rangos_cubren_el_fichero_y_acaban_en_salto_de_linea(tmp_path):
+    ruta = escribir_log(tmp_path, generar_lineas(500))
+    rangos = dividir_en_rangos(ruta, 7)
+    contenido = open(ruta, 'rb').read()
+    assert rangos[0][0] == 0 and rangos[-1][1] == len(contenido)
+    assert all(fin == siguiente for (_, fin), (siguiente, _) in zip(rangos, rangos[1:]))
+    assert all(contenido[fin - 1:fin] == b'\n' for _, fin in rangos)
+
+def test_mas_partes_que_lineas(tmp_path):
+    ruta = escribir_log(tmp_path, generar_lineas(3))
+    rangos = dividir_en_rangos(ruta, 50)
+    assert len(rangos) == 3
+    assert sum(procesar_rango(ruta, inicio, fin)['conteo'][nivel]
+               for inicio, fin in rangos for nivel in NIVELES) == 3
+
+def test_rango_leido_por_bloques_pequenos(tmp_path, monkeypatch):
+    lineas = generar_lineas(200)
+    ruta = escribir_log(tmp_path, lineas)
+    esperado = procesar_en_serie(ruta, 'INFO')
+    monkeypatch.setattr('app.paralelo.TAM_BLOQUE', 37)                              # Bloques que cortan líneas y caracteres
+    assert procesar_en_serie(ruta, 'INFO') == esperado
+    assert esperado['filtrados'] == filtrar_por_nivel(list(map(parsear_log, lineas)), 'INFO')
+
+def test_serie_coincide_con_procesador(tmp_path):
+    lineas = generar_lineas(300)
+    logs = list(map(parsear_log, lineas))
+    resultado = procesar_en_serie(escribir_log(tmp_path, lineas), 'WARNING')
+    assert resultado['conteo'] == contar_por_nivel(logs)
+    assert resultado['grupos'] == agrupar_por_nivel(logs)
+    assert resultado['filtrados'] == filtrar_por_nivel(logs, 'WARNING')
+
+def test_paralelo_identico_a_serie(tmp_path):
+    ruta = escribir_log(tmp_path, generar_lineas(2000))
+    serie = procesar_en_serie(ruta)
+    paralelo = procesar_en_paralelo(ruta, workers=4)
+    assert paralelo == serie
+    assert list(paralelo['conteo']) == list(serie['conteo'])
+
+def test_fichero_vacio(tmp_path):
+    ruta = tmp_path / "vacio.log"
+    ruta.write_text("", encoding='utf-8')
+    assert procesar_en_paralelo(str(ruta), workers=4)['conteo'] == {}
+
+def test_top_de_mensajes_fusionado_entre_workers(tmp_path):
+    lineas = generar_lineas(1000) + ["2025-05-20 12:00:00 ERROR Repetido"] * 200
+    ruta = escribir_log(tmp_path, lineas)
+    serie = procesar_en_serie(ruta, top=5)['resumen']
+    paralelo = procesar_en_paralelo(ruta, workers=4, top=5)['resumen']
+    for resumen in (serie, paralelo):
+        mensaje, cuenta, error = resumen.top(1)[0]
+        assert mensaje == 'Repetido'
+        assert cuenta - error <= 200 <= cuenta
+    assert paralelo.mensajes_distintos() == serie.mensajes_distintos()
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from app.logs import LogEntry
+from app.parser_rapido import ParserLogs, LineaMalformada, parsear_buffer
+from app.procesador import parsear_log
+
+raw_logs = [
+    "2025-05-20 12:00:01 ERROR Fallo de conexión",
+    "2025-05-20 12:01:01 INFO Usuario conectado",
+    "2025-05-20 12:02:01 WARNING  Doble espacio",
+    "2025-05-20 12:03:01 DEBUG",
+    "  2025-05-20 12:04:01 ERROR Con espacios alrededor  ",
+    "2025-5-2 1:0:1 INFO Fecha corta",
+    "2025-05-20 12:05:01  INFO Nivel vacío"
+]
+
+def test_parsear_linea_coincide_con_parsear_log():
+    for linea in raw_logs:
+        log = parsear_log(linea)
+        assert ParserLogs().parsear_linea(linea) == log
+
+def test_parsear_buffer_coincide_con_parsear_log_aleatorio():
+    random.seed(8)
+    piezas = ['2025-05-20', '12:00:01', 'ERROR', 'INFO', 'mensaje', '', 'con', 'x' * 19, 'ñ']
+    lineas = [' '.join(random.choice(piezas) for _ in range(random.randint(3, 7))) for _ in range(2000)]
+    lineas = [linea for linea in lineas if len(linea.strip().split(' ', 3)) >= 3]
+    assert parsear_buffer("\n".join(lineas)) == list(map(parsear_log, lineas))
+
+def test_formatos():
+    assert parsear_buffer(raw_logs[0], formato='tupla') == [('2025-05-20 12:00:01', 'ERROR', 'Fallo de conexión')]
+    entrada = parsear_buffer(raw_logs[0], formato='entrada')[0]
+    assert entrada == LogEntry('2025-05-20 12:00:01', 'ERROR', 'Fallo de conexión')
+    assert not hasattr(entrada, '__dict__')
+
+def test_politica_omitir_y_lineas_en_blanco():
+    texto = "basura\n\n" + "\n".join(raw_logs[:2]) + "\n"
+    assert len(parsear_buffer(texto)) == 2
+
+def test_politica_contar():
+    parser = ParserLogs(politica='contar')
+    registros = parser.parsear_lineas(["basura", raw_logs[0], "2025-05-20 12:00:01", ""])
+    assert len(registros) == 1
+    assert parser.malformadas == 2
+
+def test_politica_error():
+    with pytest.raises(LineaMalformada) as error:
+        ParserLogs(politica='error').parsear_buffer(raw_logs[0] + "\nbasura")
+    assert error.value.numero == 2
+    assert error.value.linea == "basura"
+
+def test_numeracion_continua_entre_lotes():
+    parser = ParserLogs(politica='error')
+    parser.parsear_buffer(raw_logs[0] + "\n\n" + raw_logs[1] + "\n")                     # Tres líneas, una en blanco
+    parser.parsear_lineas([raw_logs[2]])
+    with pytest.raises(LineaMalformada) as error:
+        parser.parsear_buffer(raw_logs[0] + "\nbasura")
+    assert error.value.numero == 6
+
+def test_parsear_linea():
+    parser = ParserLogs(politica='contar')
+    assert parser.parsear_linea(raw_logs[1]) == parsear_log(raw_logs[1])
+    assert parser.parsear_linea("  ") is None
+    assert parser.parsear_linea("basura") is None and parser.malformadas == 1
+
+def test_parametros_no_validos():
+    with pytest.raises(ValueError):
+        ParserLogs(formato='xml')
+    with pytest.raises(ValueError):
+        ParserLogs(politica='ignorar')
@@ -0,0 +1,36 @@
+# Suite de rendimiento del parseo (pytest-benchmark). Se salta si el plugin no está instalado.
+# Las líneas por segundo de cada variante quedan en extra_info del informe:
+#   pytest tests/test_rendimiento_parser.py --benchmark-json=parser.json
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from app.parser_rapido import ParserLogs
+from app.procesador import parsear_log
+
+NIVELES = ['ERROR', 'INFO', 'WARNING', 'DEBUG']
+LINEAS = [f"2025-05-20 12:{i % 60:02d}:{i % 60:02d} {NIVELES[i % 4]} Mensaje de prueba {i}" for i in range(50_000)]
+TEXTO = "\n".join(LINEAS)
+
+def registrar_lineas_por_segundo(benchmark):
+    benchmark.extra_info['lineas'] = len(LINEAS)
+    if benchmark.stats is not None:
+        benchmark.extra_info['lineas_por_segundo'] = len(LINEAS) / benchmark.stats.stats.mean
+
+def test_parsear_log_original(benchmark):
+    registros = benchmark(lambda: list(map(parsear_log, LINEAS)))
+    registrar_lineas_por_segundo(benchmark)
+    assert len(registros) == len(LINEAS)
+
+@pytest.mark.parametrize('formato', ['dict', 'tupla', 'entrada'])
+def test_parser_rapido_lineas(benchmark, formato):
+    parser = ParserLogs(formato)
+    registros = benchmark(parser.parsear_lineas, LINEAS)
+    registrar_lineas_por_segundo(benchmark)
+    assert len(registros) == len(LINEAS)
+
+def test_parser_rapido_buffer(benchmark):
+    parser = ParserLogs()
+    registros = benchmark(parser.parsear_buffer, TEXTO)
+    registrar_lineas_por_segundo(benchmark)
+    assert registros == list(map(parsear_log, LINEAS))
@@ -0,0 +1,131 @@
+import os
+from itertools import islice
+
+from app.seguimiento import AgregadorIncremental, Seguidor
+from app.procesador import parsear_log
+
+def escribir(ruta, *lineas, modo='a'):
+    with open(ruta, modo, encoding='utf-8') as archivo:
+        archivo.write("".join(lineas))
+
+def test_agregador_incremental():
+    agregador = AgregadorIncremental(max_por_grupo=2)
+    for i in range(5):
+        agregador.agregar(parsear_log(f"2025-05-20 12:00:0{i} ERROR Fallo {i}"))
+    agregador.agregar(parsear_log("2025-05-20 12:00:09 INFO Hola"))
+    instantanea = agregador.instantanea()
+    assert instantanea['total'] == 6
+    assert instantanea['conteo'] == {'ERROR': 5, 'INFO': 1}
+    assert [log['mensaje'] for log in instantanea['grupos']['ERROR']] == ['Fallo 3', 'Fallo 4']
+
+def test_agregar_campos_equivale_a_agregar():
+    por_log, por_campos = AgregadorIncremental(), AgregadorIncremental()
+    for linea in ("2025-05-20 12:00:01 ERROR Fallo", "2025-05-20 12:00:02 INFO Hola"):
+        log = parsear_log(linea)
+        por_log.agregar(log)
+        por_campos.agregar_campos(log['timestamp'], log['nivel'], log['mensaje'])
+    assert por_campos.instantanea() == por_log.instantanea()
+    sin_grupos = AgregadorIncremental(max_por_grupo=0)
+    sin_grupos.agregar_campos("2025-05-20 12:00:01", 'ERROR', 'Fallo')
+    assert sin_grupos.instantanea() == {'total': 1, 'conteo': {'ERROR': 1}, 'grupos': {'ERROR': []}}
+
+def test_lee_solo_lineas_nuevas(tmp_path):
+    ruta = tmp_path / "app.log"
+    escribir(ruta, "2025-05-20 12:00:01 ERROR Fallo de conexión\n", modo='w')
+    seguidor = Seguidor(str(ruta))
+    assert len(seguidor.leer_nuevas()) == 1
+    assert seguidor.leer_nuevas() == []
+
+    escribir(ruta, "2025-05-20 12:01:01 INFO Usuario conectado\n", "2025-05-20 12:02:01 WARNING Memo")
+    assert [log['nivel'] for log in seguidor.leer_nuevas()] == ['INFO']
+    escribir(ruta, "ria alta\n")
+    assert [log['mensaje'] for log in seguidor.leer_nuevas()] == ['Memoria alta']
+    assert seguidor.agregador.conteo == {'ERROR': 1, 'INFO': 1, 'WARNING': 1}
+    seguidor.cerrar()
+
+def test_desde_el_final(tmp_path):
+    ruta = tmp_path / "app.log"
+    escribir(ruta, "2025-05-20 12:00:01 ERROR Antiguo\n", modo='w')
+    seguidor = Seguidor(str(ruta), desde_el_final=True)
+    escribir(ruta, "2025-05-20 12:01:01 ERROR Nuevo\n")
+    assert [log['mensaje'] for log in seguidor.leer_nuevas()] == ['Nuevo']
+    seguidor.cerrar()
+
+def test_truncado(tmp_path):
+    ruta = tmp_path / "app.log"
+    escribir(ruta, "2025-05-20 12:00:01 ERROR Fallo de conexión\n" * 3, modo='w')
+    seguidor = Seguidor(str(ruta))
+    seguidor.leer_nuevas()
+    escribir(ruta, "2025-05-20 12:05:01 INFO Reinicio\n", modo='w')
+    assert [log['mensaje'] for log in seguidor.leer_nuevas()] == ['Reinicio']
+    assert seguidor.agregador.conteo == {'ERROR': 3, 'INFO': 1}
+    seguidor.cerrar()
+
+def test_rotacion(tmp_path):
+    ruta = tmp_path / "app.log"
+    escribir(ruta, "2025-05-20 12:00:01 ERROR Primero\n", modo='w')
+    seguidor = Seguidor(str(ruta))
+    seguidor.leer_nuevas()
+
+    escribir(ruta, "2025-05-20 12:00:02 ERROR Último del antiguo\n")
+    os.rename(ruta, tmp_path / "app.log.1")
+    escribir(ruta, "2025-05-20 12:00:03 INFO Primero del nuevo\n", modo='w')
+
+    assert [log['mensaje'] for log in seguidor.leer_nuevas()] == ['Último del antiguo', 'Primero del nuevo']
+    escribir(ruta, "2025-05-20 12:00:04 INFO Segundo del nuevo\n")
+    assert [log['mensaje'] for log in seguidor.leer_nuevas()] == ['Segundo del nuevo']
+    seguidor.cerrar()
+
+def test_fichero_aun_no_creado(tmp_path):
+    ruta = tmp_path / "app.log"
+    seguidor = Seguidor(str(ruta))
+    assert seguidor.leer_nuevas() == []
+    escribir(ruta, "2025-05-20 12:00:01 ERROR Fallo\n", modo='w')
+    assert len(seguidor.leer_nuevas()) == 1
+    seguidor.cerrar()
+
+def test_lee_un_fichero_grande_por_bloques(tmp_path, monkeypatch):
+    ruta = tmp_path / "app.log"
+    escribir(ruta, *(f"2025-05-20 12:00:{i % 60:02d} INFO Evento {i}\n" for i in range(5000)), modo='w')
+    monkeypatch.setattr('app.seguimiento.TAM_BLOQUE', 1024)
+    lotes = list(Seguidor(str(ruta))._lotes())
+    assert len(lotes) > 100
+    assert all(sum(map(len, lote)) <= 1024 for lote in lotes)
+
+    seguidor = Seguidor(str(ruta))
+    assert seguidor.leer_nuevas(conservar=False) == []
+    assert seguidor.agregador.total == 5000
+    assert len(seguidor.agregador.grupos['INFO']) == 1000                               # MAX_POR_GRUPO
+    seguidor.cerrar()
+
+def test_filtros_de_rango_y_al_leer(tmp_path):
+    ruta = tmp_path / "app.log"
+    escribir(ruta, "2025-05-20 12:00:01 ERROR Antes\n", "2025-05-20 12:05:30 ERROR Dentro\n",
+             "2025-05-20 12:06:01 INFO Después\n", modo='w')
+    leidos = []
+    seguidor = Seguidor(str(ruta), desde='2025-05-20 12:01', hasta='2025-05-20 12:05', al_leer=leidos.append)
+    assert [log['mensaje'] for log in seguidor.leer_nuevas()] == ['Dentro']
+    assert [log['mensaje'] for log in leidos] == ['Dentro']
+    assert seguidor.agregador.conteo == {'ERROR': 1}
+    seguidor.cerrar()
+
+def test_lineas_malformadas_se_descartan(tmp_path):
+    ruta = tmp_path / "app.log"
+    escribir(ruta, "2025-05-20 12:00:01 ERROR Fallo\n", modo='w')
+    leidos = []
+    seguidor = Seguidor(str(ruta), al_leer=leidos.append, nivel='ERROR')
+    seguidor.leer_nuevas()
+    escribir(ruta, "basura\n", "2025-05-20 12:00:02 INFO Hola\n", "2025-05-20 12:00:03 ERROR Otro\n")
+    assert [log['mensaje'] for log in seguidor.leer_nuevas()] == ['Hola', 'Otro']
+    assert [log['mensaje'] for log in leidos] == ['Fallo', 'Otro']                   # Sólo los de 'nivel'
+    assert seguidor.agregador.conteo == {'ERROR': 2, 'INFO': 1}
+    seguidor.cerrar()
+
+def test_seguir_emite_instantaneas(tmp_path):
+    ruta = tmp_path / "app.log"
+    escribir(ruta, "2025-05-20 12:00:01 ERROR Fallo\n", modo='w')
+    seguidor = Seguidor(str(ruta))
+    instantaneas = list(islice(seguidor.seguir(intervalo=0.01, sondeo=0.005), 2))
+    assert instantaneas[0]['conteo'] == {'ERROR': 1}
+    assert instantaneas[1]['total'] == 1
+    seguidor.cerrar()